@@ -0,0 +1 @@
+"""Developer benchmarks for the SpaceController add-on (run outside Blender)."""
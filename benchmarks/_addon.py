@@ -0,0 +1,131 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Import helpers for running add-on modules outside Blender.
+
+The add-on's `__init__.py` imports `bpy`, so `src` cannot simply be imported
+as a package here. `addon_module()` registers an empty package pointing at
+`src/` instead, which keeps the submodules' relative imports working without
+executing the Blender-only `__init__.py`.
+"""
+
+import ctypes
+import importlib
+import os
+import sys
+import types
+
+ADDON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+ADDON_PACKAGE = "spacecontroller_addon"
+
+
+def addon_module(name: str) -> types.ModuleType:
+    """Import `src/<name>.py` as `spacecontroller_addon.<name>`."""
+    if ADDON_PACKAGE not in sys.modules:
+        package = types.ModuleType(ADDON_PACKAGE)
+        package.__path__ = [ADDON_DIR]
+        sys.modules[ADDON_PACKAGE] = package
+    return importlib.import_module(f"{ADDON_PACKAGE}.{name}")
+
+
+# ---------------------------------------------------------------------------
+# In-process stand-in for the vendor DLL
+# ---------------------------------------------------------------------------
+
+_SHORT_P = ctypes.POINTER(ctypes.c_short)
+_INT_P = ctypes.POINTER(ctypes.c_int)
+_LONG_P = ctypes.POINTER(ctypes.c_long)
+
+_FETCH_PROTO = ctypes.CFUNCTYPE(
+    ctypes.c_int, ctypes.c_int,
+    _SHORT_P, _SHORT_P, _SHORT_P, _SHORT_P, _SHORT_P, _SHORT_P,
+    _INT_P, _INT_P, _INT_P, _LONG_P, _LONG_P,
+)
+_CONNECT_PROTO = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_bool, ctypes.c_char_p)
+_DISCONNECT_PROTO = ctypes.CFUNCTYPE(ctypes.c_int)
+_DEVNUM_PROTO = ctypes.CFUNCTYPE(ctypes.c_int, _INT_P, _INT_P, _INT_P)
+
+
+class FakeSpaceControlLib:
+    """
+    Replacement for the SpaceControl DLL.
+
+    With `ffi=True` each entry point is a ctypes callback, so calls cross the
+    ctypes FFI boundary like they would with the vendor DLL (the callback
+    itself then dominates the cost). With `ffi=False` the entry points are
+    plain Python functions whose fetch does nothing, which isolates the cost
+    of the wrapper code around the call.
+    """
+
+    def __init__(self, num_devices: int = 1, ffi: bool = True):
+        self.num_devices = num_devices
+        self.tick = 0
+        if ffi:
+            self.scConnect2 = _CONNECT_PROTO(self._connect)
+            self.scDisconnect = _DISCONNECT_PROTO(self._disconnect)
+            self.scGetDevNum = _DEVNUM_PROTO(self._get_dev_num)
+            self.scFetchStdData = _FETCH_PROTO(self._fetch)
+        else:
+            self.scConnect2 = _PyEntryPoint(self._connect)
+            self.scDisconnect = _PyEntryPoint(self._disconnect)
+            self.scGetDevNum = _PyEntryPoint(self._get_dev_num_byref)
+            self.scFetchStdData = _PyEntryPoint(self._fetch_noop)
+
+    def _connect(self, _use_daemon, _app_name):
+        return 0
+
+    def _disconnect(self):
+        return 0
+
+    def _get_dev_num(self, num_all, num_usb, num_other):
+        num_all[0] = self.num_devices
+        num_usb[0] = self.num_devices
+        num_other[0] = 0
+        return 0
+
+    def _get_dev_num_byref(self, num_all, num_usb, num_other):
+        num_all._obj.value = self.num_devices
+        return 0
+
+    def _fetch_noop(self, *_args):
+        return 0
+
+    def _fetch(self, _dev, x, y, z, a, b, c, wheel, buttons, event, tv_sec, tv_usec):
+        self.tick += 1
+        value = self.tick % 200 - 100
+        x[0] = y[0] = z[0] = value
+        a[0] = b[0] = c[0] = -value
+        wheel[0] = buttons[0] = event[0] = 0
+        tv_sec[0] = self.tick // 1000
+        tv_usec[0] = (self.tick % 1000) * 1000
+        return 0
+
+
+class _PyEntryPoint:
+    """Plain Python callable that accepts ctypes `argtypes`/`restype` assignment."""
+
+    def __init__(self, fn):
+        self._fn = fn
+        self.argtypes = None
+        self.restype = None
+
+    def __call__(self, *args):
+        return self._fn(*args)
+
+
+def fake_device(num_devices: int = 1, ffi: bool = True):
+    """Construct a SpaceControllerDevice bound to FakeSpaceControlLib."""
+    device_module = addon_module("spacecontroller_device")
+
+    class _FakeDevice(device_module.SpaceControllerDevice):
+        def _load_library(self):
+            return FakeSpaceControlLib(num_devices, ffi=ffi)
+
+    return _FakeDevice(app_name="Benchmark")
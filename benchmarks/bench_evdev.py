@@ -0,0 +1,68 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+EvdevBackend fed with recorded input_event structs: read() calls and time
+per frame when draining bursts of frames written to a pipe (frame folding is
+tested in tests/test_evdev_backend.py, with frame() below).
+
+Run from the repository root (Linux):
+
+    python -m benchmarks.bench_evdev
+"""
+
+import argparse
+import os
+import time
+
+from ._addon import addon_module
+
+
+def frame(ev, t: float, *events) -> bytes:
+    """Encode (type, code, value) events plus SYN_REPORT, all at time `t`."""
+    sec = int(t)
+    usec = int(round((t - sec) * 1e6))
+    out = b"".join(ev.INPUT_EVENT.pack(sec, usec, kind, code, value) for kind, code, value in events)
+    return out + ev.INPUT_EVENT.pack(sec, usec, ev.EV_SYN, ev.SYN_REPORT, 0)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="evdev backend batching")
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--burst", type=int, default=16, help="frames per timer tick")
+    args = parser.parse_args(argv)
+
+    device_module = addon_module("spacecontroller_device")
+    ev = addon_module("evdev_backend")
+
+    rel = ev.EV_REL
+    burst = frame(ev, 1.0, *((rel, axis, 10) for axis in range(6))) * args.burst
+    read_fd, write_fd = os.pipe()
+    backend = ev.EvdevBackend(read_fd, repeat_held=False)
+    backend.connect()
+    batch = device_module.SpaceControllerBatch()
+    ticks = max(1, args.frames // args.burst)
+    total = 0
+    elapsed = 0.0
+    for _ in range(ticks):
+        os.write(write_fd, burst)
+        t0 = time.perf_counter()
+        total += len(backend.read_states(batch, args.burst))
+        elapsed += time.perf_counter() - t0
+    backend.close()
+    os.close(read_fd)
+    os.close(write_fd)
+
+    print(f"{'read_states()':<22} {elapsed / total * 1e6:8.3f} us/frame   "
+          f"({args.burst} frames of 7 events per tick)")
+    print(f"{'read() with data':<22} {backend.reads / ticks:8.2f} per tick")
+
+
+if __name__ == "__main__":
+    main()
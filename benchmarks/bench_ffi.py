@@ -0,0 +1,97 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+ctypes call overhead against a real native library.
+
+Builds the stub library (benchmarks/stub_lib), loads it through
+SpaceControllerDevice(library_path=...) and times the original per-call
+fetch, read_state(), read_state_into() and read_states() per sample (the
+scripted samples are checked in tests/test_spacecontroller_device.py).
+
+Run from the repository root (needs a C compiler):
+
+    python -m benchmarks.bench_ffi
+"""
+
+import argparse
+import time
+
+from ._addon import addon_module
+from .bench_read_state import _baseline_read_state, transient_bytes_per_call
+from .stub_library import build
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="ctypes overhead against the stub library")
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--burst", type=int, default=8, help="samples per drain")
+    args = parser.parse_args(argv)
+
+    device_module = addon_module("spacecontroller_device")
+    device = device_module.SpaceControllerDevice(app_name="Benchmark", library_path=build())
+    lib = device._lib
+    state_cls = device_module.SpaceControllerState
+
+    # Long bursts for per-call timing, so "no data" returns are rare.
+    lib.scStubConfigure(1, 1 << 30)
+    state = state_cls()
+    batch = device_module.SpaceControllerBatch()
+
+    def baseline(n):
+        for _ in range(n):
+            _baseline_read_state(device, state_cls)
+
+    def read_state(n):
+        read = device.read_state
+        for _ in range(n):
+            read()
+
+    def read_state_into(n):
+        read_into = device.read_state_into
+        for _ in range(n):
+            read_into(state)
+
+    def per_call_null(n):
+        # Bare ctypes call with the preallocated pointers: the FFI floor.
+        fetch = lib.scFetchStdData
+        pointers = device._fetch_pointers
+        for _ in range(n):
+            fetch(0, *pointers)
+
+    for label, fn in (
+        ("ctypes call only", per_call_null),
+        ("baseline (per-call)", baseline),
+        ("read_state()", read_state),
+        ("read_state_into()", read_state_into),
+    ):
+        fn(1000)
+        t0 = time.perf_counter()
+        fn(args.calls)
+        elapsed = time.perf_counter() - t0
+        print(
+            f"{label:<22} {elapsed / args.calls * 1e6:8.3f} us/sample   "
+            f"{transient_bytes_per_call(fn, 2000):8.1f} bytes allocated/call"
+        )
+
+    lib.scStubConfigure(1, args.burst)
+    drains = max(1, args.calls // args.burst)
+    t0 = time.perf_counter()
+    total = 0
+    for _ in range(drains):
+        total += len(device.read_states(batch, args.burst + 1))
+    elapsed = time.perf_counter() - t0
+    print(f"{'read_states()':<22} {elapsed / total * 1e6:8.3f} us/sample   "
+          f"({args.burst} samples per drain)")
+
+    device.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+HidrawBackend fed with recorded report bytes: read() calls and time per
+sample when draining bursts of reports written to a pipe (decoding is tested
+in tests/test_hid_backend.py, with the report builders below).
+
+Run from the repository root (POSIX):
+
+    python -m benchmarks.bench_hidraw
+"""
+
+import argparse
+import os
+import struct
+import time
+
+from ._addon import addon_module
+
+
+def translation_report(x, y, z) -> bytes:
+    return struct.pack("<B3h", 1, x, y, z)
+
+
+def rotation_report(rx, ry, rz) -> bytes:
+    return struct.pack("<B3h", 2, rx, ry, rz)
+
+
+def combined_report(x, y, z, rx, ry, rz) -> bytes:
+    return struct.pack("<B6h", 1, x, y, z, rx, ry, rz)
+
+
+def buttons_report(mask: int) -> bytes:
+    return struct.pack("<BH", 3, mask)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="hidraw backend batching")
+    parser.add_argument("--samples", type=int, default=100_000)
+    parser.add_argument("--burst", type=int, default=16, help="samples per timer tick")
+    args = parser.parse_args(argv)
+
+    device_module = addon_module("spacecontroller_device")
+    hid = addon_module("hid_backend")
+
+    burst = (translation_report(100, -100, 50) + rotation_report(10, -10, 5)) * args.burst
+    read_fd, write_fd = os.pipe()
+    backend = hid.HidrawBackend(read_fd)
+    backend.connect()
+    batch = device_module.SpaceControllerBatch()
+    ticks = max(1, args.samples // args.burst)
+    total = 0
+    elapsed = 0.0
+    for _ in range(ticks):
+        os.write(write_fd, burst)
+        t0 = time.perf_counter()
+        total += len(backend.read_states(batch, args.burst))
+        elapsed += time.perf_counter() - t0
+    backend.close()
+    os.close(read_fd)
+    os.close(write_fd)
+
+    print(f"{'read_states()':<22} {elapsed / total * 1e6:8.3f} us/sample   "
+          f"({args.burst} samples per tick)")
+    print(f"{'read() with data':<22} {backend.reads / ticks:8.2f} per tick")
+
+
+if __name__ == "__main__":
+    main()
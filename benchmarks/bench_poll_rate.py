@@ -0,0 +1,66 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Adaptive poll interval: runs the headless timer in real time against the
+simulated backend at several rates, sleeping for the interval it asks for,
+and reports the measured device rate, its estimation error and the resulting
+ticks per second (sleep overhead included). The estimator itself is tested
+in tests/test_poll_rate.py.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_poll_rate
+"""
+
+import argparse
+import time
+
+from .harness import HeadlessBlender
+
+MIN_INTERVAL = 0.002
+MAX_INTERVAL = 0.05
+
+
+def _run_live(rate_hz: float, seconds: float) -> tuple[float, float, float, int]:
+    """(estimated rate, error, ticks per second, ticks) of the headless add-on polling for `seconds`."""
+    with HeadlessBlender() as blender:
+        prefs = blender.prefs
+        prefs.backend = 'SIMULATED'
+        prefs.simulated_rate = rate_hz
+        prefs.adaptive_poll_rate = True
+        prefs.min_poll_interval = MIN_INTERVAL
+        prefs.max_poll_interval = MAX_INTERVAL
+        blender.wait_for_device()
+
+        addon = blender.addon
+        ticks = 0
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            interval = blender.tick()
+            ticks += 1
+            time.sleep(interval)
+        estimator = addon._rate_estimator
+        return estimator.rate, estimator.error, ticks / seconds, ticks
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Adaptive poll interval")
+    parser.add_argument("--seconds", type=float, default=2.0, help="real-time run per rate")
+    parser.add_argument("--rates", type=float, nargs="*", default=[60.0, 125.0, 250.0, 500.0])
+    args = parser.parse_args(argv)
+
+    for rate_hz in args.rates:
+        rate, error, polling, ticks = _run_live(rate_hz, args.seconds)
+        print(f"device {rate_hz:6.0f} Hz   estimated {rate:7.1f} Hz (±{error * 100:.2f} %)   "
+              f"polling at {polling:6.1f} Hz   ({ticks} ticks)")
+
+
+if __name__ == "__main__":
+    main()
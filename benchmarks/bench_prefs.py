@@ -0,0 +1,75 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Micro-benchmark: per-tick cost of reading the hot-path preferences.
+
+"before" reproduces the old access pattern, `get_prefs()` through
+`bpy.context.preferences.addons[__name__].preferences` plus six attribute
+reads. Outside Blender the chain is modelled with plain Python objects, so
+the numbers are a lower bound: real RNA property access is slower still.
+"after" reads the same six values from a PrefsSnapshot.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_prefs
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+
+from ._addon import ADDON_PACKAGE, addon_module
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Preference read micro-benchmark")
+    parser.add_argument("--ticks", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    PrefsSnapshot = addon_module("prefs_snapshot").PrefsSnapshot
+
+    addon_prefs = SimpleNamespace(**{
+        name: getattr(PrefsSnapshot(), name) for name in PrefsSnapshot.__slots__
+    })
+    context = SimpleNamespace(preferences=SimpleNamespace(
+        addons={ADDON_PACKAGE: SimpleNamespace(preferences=addon_prefs)},
+    ))
+
+    def get_prefs():
+        return context.preferences.addons[ADDON_PACKAGE].preferences
+
+    def before(n):
+        for _ in range(n):
+            prefs = get_prefs()
+            (prefs.invert_x, prefs.invert_y, prefs.invert_z,
+             prefs.move_sensitivity, prefs.enable_rotation, prefs.rotate_sensitivity)
+
+    snapshot = PrefsSnapshot.from_prefs(addon_prefs)
+
+    def after(n):
+        for _ in range(n):
+            prefs = snapshot
+            (prefs.invert_x, prefs.invert_y, prefs.invert_z,
+             prefs.move_sensitivity, prefs.enable_rotation, prefs.rotate_sensitivity)
+
+    results = {}
+    for label, fn in (("before: get_prefs()", before), ("after: snapshot", after)):
+        fn(10_000)  # warm up
+        t0 = time.perf_counter()
+        fn(args.ticks)
+        results[label] = (time.perf_counter() - t0) / args.ticks
+        print(f"{label:<22} {results[label] * 1e9:8.1f} ns/tick")
+
+    ratio = results["before: get_prefs()"] / results["after: snapshot"]
+    print(f"speed-up (lower bound)  {ratio:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Micro-benchmark: allocations and time per SpaceControllerDevice fetch.
+
+Compares the original per-call ctypes fetch (eleven fresh ctypes objects and
+`byref` wrappers, reproduced below as the baseline), `read_state()` and
+`read_state_into()`, which reuses the preallocated fetch buffer and a
+caller-owned state.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_read_state          # wrapper cost only
+    python -m benchmarks.bench_read_state --ffi    # through a ctypes callback
+"""
+
+import argparse
+import ctypes
+import time
+import tracemalloc
+
+from ._addon import addon_module, fake_device
+
+
+def transient_bytes_per_call(fn, calls: int) -> float:
+    """Average peak memory allocated during a single call to `fn(1)`."""
+    total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            fn(1)
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - base
+    finally:
+        tracemalloc.stop()
+    return total / calls
+
+
+def _baseline_read_state(device, state_cls):
+    """The pre-buffer implementation of SpaceControllerDevice.read_state()."""
+    x = ctypes.c_short()
+    y = ctypes.c_short()
+    z = ctypes.c_short()
+    a = ctypes.c_short()
+    b = ctypes.c_short()
+    c = ctypes.c_short()
+    wheel = ctypes.c_int()
+    buttons = ctypes.c_int()
+    event = ctypes.c_int()
+    tv_sec = ctypes.c_long()
+    tv_usec = ctypes.c_long()
+
+    status = device._lib.scFetchStdData(
+        ctypes.c_int(device._device_id),
+        ctypes.byref(x), ctypes.byref(y), ctypes.byref(z),
+        ctypes.byref(a), ctypes.byref(b), ctypes.byref(c),
+        ctypes.byref(wheel), ctypes.byref(buttons), ctypes.byref(event),
+        ctypes.byref(tv_sec), ctypes.byref(tv_usec),
+    )
+    if status != 0:
+        return None
+    return state_cls(
+        tx=float(x.value), ty=float(y.value), tz=float(z.value),
+        rx=float(a.value), ry=float(b.value), rz=float(c.value),
+        event=int(event.value),
+    )
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="SpaceControllerDevice fetch micro-benchmark")
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--ffi", action="store_true", help="call through a ctypes callback")
+    args = parser.parse_args(argv)
+
+    device_module = addon_module("spacecontroller_device")
+    device = fake_device(ffi=args.ffi)
+    state = device_module.SpaceControllerState()
+
+    def baseline(n):
+        state_cls = device_module.SpaceControllerState
+        for _ in range(n):
+            _baseline_read_state(device, state_cls)
+
+    def legacy(n):
+        read = device.read_state
+        for _ in range(n):
+            read()
+
+    def in_place(n):
+        read_into = device.read_state_into
+        for _ in range(n):
+            read_into(state)
+
+    cases = (
+        ("baseline (per-call)", baseline),
+        ("read_state()", legacy),
+        ("read_state_into()", in_place),
+    )
+    for label, fn in cases:
+        fn(1000)  # warm up
+        t0 = time.perf_counter()
+        fn(args.calls)
+        elapsed = time.perf_counter() - t0
+        print(
+            f"{label:<20} {elapsed / args.calls * 1e6:8.3f} us/call   "
+            f"{transient_bytes_per_call(fn, 2000):8.1f} bytes allocated/call"
+        )
+
+
+if __name__ == "__main__":
+    main()
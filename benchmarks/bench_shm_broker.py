@@ -0,0 +1,77 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Shared-memory broker with the simulated data source: launches the real
+broker (`--simulated`), reads its stream from this process and times
+connect() and per-sample reads (the ring itself is tested in
+tests/test_shm_broker.py).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_shm_broker
+"""
+
+import argparse
+import os
+import signal
+import time
+
+from ._addon import addon_module
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="shared-memory broker")
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--rate", type=float, default=1000.0, help="simulated rate (Hz)")
+    args = parser.parse_args(argv)
+
+    device_module = addon_module("spacecontroller_device")
+    shm = addon_module("shm_broker")
+
+    name = f"scbench-proc-{os.getpid()}"
+    process = shm.launch_broker(["--name", name, "--simulated", str(args.rate)])
+    reader = shm.SharedMemoryBackend(name)
+    try:
+        deadline = time.monotonic() + 10.0
+        while True:
+            t0 = time.perf_counter()
+            try:
+                reader.connect()
+                break
+            except RuntimeError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+        connect_us = (time.perf_counter() - t0) * 1e6
+
+        batch = device_module.SpaceControllerBatch()
+        samples = 0
+        read_time = 0.0
+        end = time.monotonic() + args.seconds
+        while time.monotonic() < end:
+            t0 = time.perf_counter()
+            samples += len(reader.read_states(batch, 256))
+            read_time += time.perf_counter() - t0
+            time.sleep(0.01)
+    finally:
+        process.send_signal(signal.SIGINT)
+        process.wait(timeout=10)
+
+    reader.close()
+
+    rate = samples / args.seconds
+    print(f"{'connect()':<22} {connect_us:8.1f} us")
+    print(f"{'received':<22} {rate:8.1f} samples/s   (broker publishes {args.rate:.0f}/s, "
+          f"{reader.dropped} dropped)")
+    print(f"{'read_states()':<22} {read_time / max(samples, 1) * 1e6:8.3f} us/sample")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+SpacenavBackend against a fake spacenavd: recv() calls and time per sample
+when draining bursts of events (decoding is tested in
+tests/test_spacenav_backend.py).
+
+Run from the repository root (Linux / macOS):
+
+    python -m benchmarks.bench_spacenav
+"""
+
+import argparse
+import time
+
+from ._addon import addon_module
+from .fake_spacenavd import EVENT, FakeSpacenavd
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="spacenavd backend batching")
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--burst", type=int, default=16, help="events per timer tick")
+    args = parser.parse_args(argv)
+
+    device_module = addon_module("spacecontroller_device")
+    backend_module = addon_module("spacenav_backend")
+
+    burst = EVENT.pack(0, 100, -100, 50, 10, -10, 5, 8) * args.burst
+    batch = device_module.SpaceControllerBatch()
+    with FakeSpacenavd() as daemon:
+        backend = backend_module.SpacenavBackend(socket_path=daemon.path)
+        backend.connect()
+        daemon.wait_for_clients(1)
+        ticks = max(1, args.events // args.burst)
+        total = 0
+        elapsed = 0.0
+        for _ in range(ticks):
+            daemon.send_raw(burst)
+            t0 = time.perf_counter()
+            got = 0
+            while got < args.burst:
+                got += len(backend.read_states(batch, args.burst))
+            elapsed += time.perf_counter() - t0
+            total += got
+        backend.close()
+
+    print(f"{'read_states()':<22} {elapsed / total * 1e6:8.3f} us/sample   "
+          f"({args.burst} events per tick)")
+    print(f"{'recv() with data':<22} {backend.receives / ticks:8.2f} per tick")
+
+
+if __name__ == "__main__":
+    main()
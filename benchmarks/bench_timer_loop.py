@@ -0,0 +1,55 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Drive `_spacecontroller_timer` headless and report ticks per second.
+
+Uses the simulated backend at "one sample per fetch", so every tick reads,
+integrates and applies motion.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_timer_loop --windows 3 --areas 12
+"""
+
+import argparse
+import time
+
+from .harness import HeadlessBlender
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Headless timer loop benchmark")
+    parser.add_argument("--ticks", type=int, default=20_000)
+    parser.add_argument("--windows", type=int, default=2)
+    parser.add_argument("--areas", type=int, default=8, help="areas per window")
+    parser.add_argument("--reader-thread", action="store_true")
+    args = parser.parse_args(argv)
+
+    with HeadlessBlender(windows=args.windows, areas_per_window=args.areas) as blender:
+        prefs = blender.prefs
+        prefs.backend = 'SIMULATED'
+        prefs.simulated_rate = 0.0
+        prefs.use_reader_thread = args.reader_thread
+        blender.wait_for_device()
+        blender.run(100)  # warm up
+
+        redraws = blender.view3d_area.redraws
+        t0 = time.perf_counter()
+        blender.run(args.ticks)
+        elapsed = time.perf_counter() - t0
+
+        print(f"ticks/s         {args.ticks / elapsed:10.0f}")
+        print(f"time per tick   {elapsed / args.ticks * 1e6:10.2f} us")
+        print(f"redraws         {blender.view3d_area.redraws - redraws:10d}")
+        print(f"view location   {blender.region_3d.view_location}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+UdpBackend over localhost: time for one drain of a burst of queued
+datagrams per timer tick (decoding is tested in tests/test_udp_source.py).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_udp
+"""
+
+import argparse
+import socket
+import time
+
+from ._addon import addon_module
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="UDP input source over localhost")
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--burst", type=int, default=16, help="datagrams per timer tick")
+    args = parser.parse_args(argv)
+
+    device_module = addon_module("spacecontroller_device")
+    udp = addon_module("udp_source")
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    state = device_module.SpaceControllerState(tx=100, ty=-100, tz=50, rx=10, ry=-10, rz=5)
+    for mode, encode in (('LATEST', udp.encode_binary), ('INTEGRATE', udp.encode_osc)):
+        backend = udp.UdpBackend(port=0, mode=mode)
+        backend.connect()
+        target = ("127.0.0.1", backend.port)
+        data = encode(state)
+        batch = device_module.SpaceControllerBatch()
+        elapsed = 0.0
+        for _ in range(args.ticks):
+            for _ in range(args.burst):
+                sender.sendto(data, target)
+            t0 = time.perf_counter()
+            backend.read_states(batch)
+            elapsed += time.perf_counter() - t0
+        backend.close()
+        print(f"{mode.lower() + ' (' + encode.__name__[7:] + ')':<22} "
+              f"{elapsed / args.ticks * 1e6:8.2f} us/tick   "
+              f"{elapsed / max(backend.datagrams, 1) * 1e6:6.2f} us/datagram   "
+              f"({backend.datagrams} of {args.ticks * args.burst} received)")
+
+    sender.close()
+
+
+if __name__ == "__main__":
+    main()
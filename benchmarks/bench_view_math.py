@@ -0,0 +1,105 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Micro-benchmark and allocation report for ViewIntegrator.
+
+Runs the per-tick view update (translate + rotate) on a reusable quaternion
+and location, and uses tracemalloc to count the blocks steady-state ticks
+leave behind (tests/test_timer_loop.py asserts there are none). The
+average peak of traced memory per tick is reported too; it stays near zero
+because the only temporaries are floats, which come from CPython's float
+freelist.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_view_math
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from ._addon import addon_module
+
+
+class _Quaternion:
+    __slots__ = ("w", "x", "y", "z")
+
+    def __init__(self):
+        self.w, self.x, self.y, self.z = 1.0, 0.0, 0.0, 0.0
+
+
+class _Vector:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self):
+        self.x = self.y = self.z = 0.0
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="ViewIntegrator allocation check")
+    parser.add_argument("--ticks", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    integrator = addon_module("view_math").ViewIntegrator()
+    rotation = _Quaternion()
+    location = _Vector()
+
+    def tick(n):
+        translate = integrator.translate
+        rotate = integrator.rotate
+        for _ in range(n):
+            translate(rotation, location, 0.01, -0.02, 0.005)
+            rotate(rotation, 0.001, 0.002, -0.0005)
+
+    tick(1000)  # warm up (specialised bytecode, float freelists)
+
+    t0 = time.perf_counter()
+    tick(args.ticks)
+    elapsed = time.perf_counter() - t0
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tick(args.ticks)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    # Ignore tracemalloc's own bookkeeping.
+    stats = [
+        stat for stat in after.compare_to(before, "lineno")
+        if stat.traceback[0].filename != tracemalloc.__file__
+    ]
+    blocks = sum(stat.count_diff for stat in stats)
+
+    peak_total = 0
+    translate = integrator.translate
+    rotate = integrator.rotate
+    tracemalloc.start()
+    try:
+        for _ in range(1000):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            translate(rotation, location, 0.01, -0.02, 0.005)
+            rotate(rotation, 0.001, 0.002, -0.0005)
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - base
+    finally:
+        tracemalloc.stop()
+
+    norm = (rotation.w ** 2 + rotation.x ** 2 + rotation.y ** 2 + rotation.z ** 2) ** 0.5
+    print(f"time per tick          {elapsed / args.ticks * 1e6:8.3f} us")
+    print(f"retained blocks/tick   {blocks / args.ticks:8.5f}  ({blocks} over {args.ticks} ticks)")
+    print(f"allocated bytes/tick   {peak_total / 1000:8.1f}")
+    print(f"quaternion norm drift  {abs(norm - 1.0):.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Minimal stand-in for spacenavd.
+
+Listens on a Unix domain socket and sends protocol events to every connected
+client on demand, so SpacenavBackend can be driven without a daemon or a
+device:
+
+    with FakeSpacenavd() as daemon:
+        backend = SpacenavBackend(socket_path=daemon.path)
+        backend.connect()
+        daemon.wait_for_clients(1)
+        daemon.send_motion(10, 0, 0, 0, 0, 0, period=8)
+"""
+
+import os
+import socket
+import struct
+import tempfile
+import threading
+import time
+
+EVENT = struct.Struct("8i")
+
+
+class FakeSpacenavd:
+    """Fake daemon bound to `path` (a fresh temporary path by default)."""
+
+    def __init__(self, path: str | None = None):
+        if path is None:
+            self._tmpdir = tempfile.mkdtemp(prefix="fake-spnav-")
+            path = os.path.join(self._tmpdir, "spnav.sock")
+        else:
+            self._tmpdir = None
+        self.path = path
+        self._clients: list[socket.socket] = []
+        self._lock = threading.Lock()
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        self._server.listen()
+        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._thread.start()
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return  # server socket closed
+            with self._lock:
+                self._clients.append(client)
+
+    def wait_for_clients(self, count: int, timeout: float = 2.0) -> None:
+        deadline = time.monotonic() + timeout
+        while len(self._clients) < count:
+            if time.monotonic() > deadline:
+                raise TimeoutError("no spacenavd client connected")
+            time.sleep(0.001)
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+    def send_raw(self, data: bytes) -> None:
+        with self._lock:
+            for client in self._clients:
+                client.sendall(data)
+
+    def send_motion(self, x, y, z, rx, ry, rz, period: int = 8) -> None:
+        self.send_raw(EVENT.pack(0, x, y, z, rx, ry, rz, period))
+
+    def send_button(self, button: int, pressed: bool) -> None:
+        self.send_raw(EVENT.pack(1 if pressed else 2, button, 0, 0, 0, 0, 0, 0))
+
+    def disconnect_clients(self) -> None:
+        with self._lock:
+            for client in self._clients:
+                client.close()
+            self._clients.clear()
+
+    def close(self) -> None:
+        self.disconnect_clients()
+        try:
+            self._server.shutdown(socket.SHUT_RDWR)  # wakes the accept() thread
+        except OSError:
+            pass
+        self._server.close()
+        self._thread.join(timeout=1.0)
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+        if self._tmpdir is not None:
+            os.rmdir(self._tmpdir)
+
+    def __enter__(self) -> "FakeSpacenavd":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
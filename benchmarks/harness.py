@@ -0,0 +1,140 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Headless harness: the full add-on (including `__init__.py`) outside Blender.
+
+`benchmarks/headless/` provides stand-ins for `bpy` and `mathutils`.
+HeadlessBlender puts them on sys.path, builds a window manager with a
+configurable number of windows and areas, registers the add-on and drives
+its timer directly, as fast as the caller wants:
+
+    with HeadlessBlender(windows=2, areas_per_window=8) as blender:
+        blender.prefs.backend = 'SIMULATED'
+        blender.wait_for_device()
+        blender.run(10_000)
+        print(blender.view3d_area.redraws)
+"""
+
+import importlib.util
+import os
+import sys
+import time
+
+from ._addon import ADDON_DIR
+
+HEADLESS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "headless")
+ADDON_NAME = "spacecontroller_headless"
+
+
+def install_stubs() -> None:
+    """Make `import bpy` / `import mathutils` resolve to the headless stand-ins."""
+    if HEADLESS_DIR not in sys.path:
+        sys.path.insert(0, HEADLESS_DIR)
+
+
+def load_addon():
+    """Import src/ as the add-on package `spacecontroller_headless` (once)."""
+    if ADDON_NAME in sys.modules:
+        return sys.modules[ADDON_NAME]
+    install_stubs()
+    spec = importlib.util.spec_from_file_location(
+        ADDON_NAME,
+        os.path.join(ADDON_DIR, "__init__.py"),
+        submodule_search_locations=[ADDON_DIR],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_NAME] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class HeadlessBlender:
+    """
+    A registered add-on in a fake Blender session.
+
+    The VIEW_3D area is placed last by default, so the add-on's view lookup
+    has to walk every other window and area first (worst case).
+    """
+
+    def __init__(self, windows: int = 1, areas_per_window: int = 4, view3d_last: bool = True):
+        install_stubs()
+        import bpy
+        from bpy.types import Area, Screen, Window, WindowManager
+
+        self.bpy = bpy
+        self.addon = load_addon()
+
+        all_windows = []
+        for w in range(windows):
+            areas = [Area('PROPERTIES') for _ in range(areas_per_window)]
+            all_windows.append(Window(Screen(areas)))
+        target = all_windows[-1] if view3d_last else all_windows[0]
+        index = len(target.screen.areas) - 1 if view3d_last else 0
+        target.screen.areas[index] = Area('VIEW_3D')
+        self.view3d_area = target.screen.areas[index]
+        self.window_manager = WindowManager(all_windows)
+        bpy.context.window_manager = self.window_manager
+
+        # Blender restricts bpy.data while add-ons register.
+        data, bpy.data = bpy.data, bpy._RestrictData()
+        try:
+            self.addon.register()
+        finally:
+            bpy.data = data
+        self.timer = self.addon._spacecontroller_timer
+        self.last_interval = None
+
+    @property
+    def prefs(self):
+        return self.bpy.context.preferences.addons[ADDON_NAME].preferences
+
+    @property
+    def region_3d(self):
+        return self.view3d_area.spaces.active.region_3d
+
+    def tick(self):
+        """Run one timer callback; returns the interval it asked for."""
+        self.last_interval = self.bpy.app.timers.fire(self.timer)
+        return self.last_interval
+
+    def run(self, ticks: int) -> None:
+        """Run `ticks` timer callbacks back to back (intervals are ignored)."""
+        fire = self.bpy.app.timers.fire
+        timer = self.timer
+        for _ in range(ticks):
+            fire(timer)
+
+    def wait_for_device(self, timeout: float = 5.0) -> None:
+        """Tick until the add-on has opened its device (opened off-thread).
+
+        The first tick starts an attempt with the current input source;
+        backoff is skipped so a source chosen afterwards is tried right away.
+        """
+        deadline = time.monotonic() + timeout
+        connector = self.addon._connector
+        while self.addon._device is None:
+            if connector.state == 'BACKOFF':
+                connector.reset()
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"device not opened: {self.addon._connector.last_error!r}"
+                )
+            self.tick()
+            time.sleep(0.001)
+
+    def close(self) -> None:
+        self.addon.unregister()
+        self.bpy.app.timers.unregister(self.timer)
+
+    def __enter__(self) -> "HeadlessBlender":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
@@ -0,0 +1,40 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Minimal headless stand-in for Blender's `bpy`, enough to import, register
+and drive the SpaceController add-on outside Blender.
+
+Only what the add-on touches is modelled: window manager / windows / screens /
+areas / regions / region_3d, add-on preferences with `update=` callbacks,
+timers, load_post handlers, msgbus, bpy.path and bpy.data.filepath. See
+harness.py for how a scene is assembled.
+"""
+
+from types import SimpleNamespace
+
+from . import app, msgbus, path, props, types, utils
+
+context = SimpleNamespace(
+    window_manager=None,
+    preferences=SimpleNamespace(addons={}),
+    view_layer=SimpleNamespace(objects=SimpleNamespace(active=None)),
+)
+
+data = SimpleNamespace(filepath="")
+
+
+class _RestrictData:
+    """What `bpy.data` is while add-ons register: any access raises."""
+
+    def __getattr__(self, name):
+        raise AttributeError(f"'_RestrictData' object has no attribute '{name}'")
+
+
+__all__ = ["app", "context", "data", "msgbus", "path", "props", "types", "utils"]
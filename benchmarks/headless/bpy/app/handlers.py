@@ -0,0 +1,18 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Headless bpy.app.handlers."""
+
+load_post = []
+depsgraph_update_post = []
+
+
+def persistent(fn):
+    fn._bpy_persistent = True
+    return fn
@@ -0,0 +1,39 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Headless bpy.app.timers.
+
+Timers are not run on their own: a harness calls fire() to advance them
+(see harness.py).
+"""
+
+_timers = {}   # function -> seconds until the next call (as last returned)
+
+
+def register(function, first_interval=0.0, persistent=False):
+    _timers[function] = first_interval
+
+
+def unregister(function):
+    _timers.pop(function, None)
+
+
+def is_registered(function):
+    return function in _timers
+
+
+def fire(function):
+    """Call a registered timer now; returns its next interval (None = stopped)."""
+    interval = function()
+    if interval is None:
+        _timers.pop(function, None)
+    else:
+        _timers[function] = interval
+    return interval
@@ -0,0 +1,27 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Headless bpy.msgbus: subscriptions are recorded and can be fired by hand."""
+
+_subscriptions = []
+
+
+def subscribe_rna(key, owner, args, notify, options=None):
+    _subscriptions.append((key, owner, args, notify))
+
+
+def clear_by_owner(owner):
+    _subscriptions[:] = [s for s in _subscriptions if s[1] is not owner]
+
+
+def publish(key):
+    """Call every subscriber of `key` (what Blender does on an RNA change)."""
+    for sub_key, _owner, args, notify in list(_subscriptions):
+        if sub_key == key:
+            notify(*args)
@@ -0,0 +1,20 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Headless bpy.path."""
+
+import os
+
+
+def abspath(path):
+    """Resolve a "//" path against the blend file's directory, like Blender."""
+    if path.startswith("//"):
+        import bpy
+        return os.path.join(os.path.dirname(bpy.data.filepath), path[2:])
+    return path
@@ -0,0 +1,69 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Headless bpy.props.
+
+The property functions return deferred definitions; bpy.utils.register_class
+turns the annotations of a registered class into _Property descriptors that
+store values per instance and call `update(self, context)` on assignment.
+"""
+
+
+class _Deferred:
+    def __init__(self, kind, default, update=None, **options):
+        self.kind = kind
+        self.default = default
+        self.update = update
+        self.options = options
+
+
+def FloatProperty(default=0.0, update=None, **options):
+    return _Deferred("FLOAT", float(default), update, **options)
+
+
+def BoolProperty(default=False, update=None, **options):
+    return _Deferred("BOOL", bool(default), update, **options)
+
+
+def IntProperty(default=0, update=None, **options):
+    return _Deferred("INT", int(default), update, **options)
+
+
+def EnumProperty(items=(), default=None, update=None, **options):
+    if default is None and items:
+        default = items[0][0]
+    return _Deferred("ENUM", default, update, items=items, **options)
+
+
+def StringProperty(default="", update=None, **options):
+    return _Deferred("STRING", str(default), update, **options)
+
+
+class _Property:
+    """Data descriptor created by register_class for one property."""
+
+    def __init__(self, name, deferred):
+        self.name = name
+        self.deferred = deferred
+
+    def __get__(self, obj, _owner=None):
+        if obj is None:
+            return self
+        return obj.__dict__.get(self.name, self.deferred.default)
+
+    def __set__(self, obj, value):
+        if self.deferred.kind == "ENUM":
+            valid = {item[0] for item in self.deferred.options.get("items", ())}
+            if value not in valid:
+                raise TypeError(f"enum '{self.name}' has no item {value!r}")
+        obj.__dict__[self.name] = value
+        if self.deferred.update is not None:
+            from . import context
+            self.deferred.update(obj, context)
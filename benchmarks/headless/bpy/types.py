@@ -0,0 +1,82 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Headless bpy.types: base classes plus window / screen / area data."""
+
+from mathutils import Quaternion, Vector
+
+
+class _Registrable:
+    bl_idname = ""
+    bl_label = ""
+
+
+class Operator(_Registrable):
+    def report(self, _level, message):
+        print(message)
+
+
+class Panel(_Registrable):
+    layout = None
+
+
+class AddonPreferences(_Registrable):
+    layout = None
+
+
+class Window:
+    def __init__(self, screen=None):
+        self.screen = screen
+        self.workspace = None
+
+
+class Screen:
+    def __init__(self, areas=()):
+        self.areas = list(areas)
+
+
+class Region:
+    def __init__(self, type='WINDOW'):
+        self.type = type
+
+
+class RegionView3D:
+    def __init__(self):
+        self.view_rotation = Quaternion()
+        self.view_location = Vector()
+
+
+class SpaceView3D:
+    type = 'VIEW_3D'
+
+    def __init__(self):
+        self.region_3d = RegionView3D()
+
+
+class _Spaces:
+    def __init__(self, active):
+        self.active = active
+
+
+class Area:
+    """An area; `redraws` counts tag_redraw() calls."""
+
+    def __init__(self, type='VIEW_3D'):
+        self.type = type
+        self.spaces = _Spaces(SpaceView3D() if type == 'VIEW_3D' else None)
+        self.regions = [Region('HEADER'), Region('UI'), Region('WINDOW')]
+        self.redraws = 0
+
+    def tag_redraw(self):
+        self.redraws += 1
+
+
+class WindowManager:
+    def __init__(self, windows=()):
+        self.windows = list(windows)
@@ -0,0 +1,34 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Headless bpy.utils: class registration."""
+
+from types import SimpleNamespace
+
+from .props import _Deferred, _Property
+from .types import AddonPreferences
+
+registered = []
+
+
+def register_class(cls):
+    for name, value in list(getattr(cls, "__annotations__", {}).items()):
+        if isinstance(value, _Deferred):
+            setattr(cls, name, _Property(name, value))
+    if issubclass(cls, AddonPreferences):
+        from . import context
+        context.preferences.addons[cls.bl_idname] = SimpleNamespace(preferences=cls())
+    registered.append(cls)
+
+
+def unregister_class(cls):
+    if issubclass(cls, AddonPreferences):
+        from . import context
+        context.preferences.addons.pop(cls.bl_idname, None)
+    registered.remove(cls)
@@ -0,0 +1,186 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Pure-Python stand-in for the parts of Blender's `mathutils` the add-on uses.
+
+Conventions follow mathutils: quaternions are (w, x, y, z), `q @ v` rotates
+a vector, Euler 'XYZ' applies X, then Y, then Z, matrices are row-major
+with `M @ v` for column vectors.
+"""
+
+from math import cos, sin, sqrt
+
+
+class Vector:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, seq=(0.0, 0.0, 0.0)):
+        self.x, self.y, self.z = (float(v) for v in seq)
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+    def __getitem__(self, i):
+        return (self.x, self.y, self.z)[i]
+
+    def __len__(self):
+        return 3
+
+    def __repr__(self):
+        return f"Vector(({self.x:.6f}, {self.y:.6f}, {self.z:.6f}))"
+
+    def __add__(self, other):
+        return Vector((self.x + other[0], self.y + other[1], self.z + other[2]))
+
+    def __iadd__(self, other):
+        self.x += other[0]
+        self.y += other[1]
+        self.z += other[2]
+        return self
+
+    def __sub__(self, other):
+        return Vector((self.x - other[0], self.y - other[1], self.z - other[2]))
+
+    def __neg__(self):
+        return Vector((-self.x, -self.y, -self.z))
+
+    def __mul__(self, s):
+        return Vector((self.x * s, self.y * s, self.z * s))
+
+    @property
+    def length(self):
+        return sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def copy(self):
+        return Vector((self.x, self.y, self.z))
+
+
+class Quaternion:
+    __slots__ = ("w", "x", "y", "z")
+
+    def __init__(self, seq=(1.0, 0.0, 0.0, 0.0)):
+        self.w, self.x, self.y, self.z = (float(v) for v in seq)
+
+    def __iter__(self):
+        return iter((self.w, self.x, self.y, self.z))
+
+    def __repr__(self):
+        return f"Quaternion(({self.w:.6f}, {self.x:.6f}, {self.y:.6f}, {self.z:.6f}))"
+
+    def __matmul__(self, other):
+        if isinstance(other, Quaternion):
+            w1, x1, y1, z1 = self.w, self.x, self.y, self.z
+            w2, x2, y2, z2 = other.w, other.x, other.y, other.z
+            return Quaternion((
+                w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+                w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+            ))
+        # Rotate a vector: v + w*t + u x t, t = 2 (u x v)
+        vx, vy, vz = other[0], other[1], other[2]
+        w, qx, qy, qz = self.w, self.x, self.y, self.z
+        tx = 2.0 * (qy * vz - qz * vy)
+        ty = 2.0 * (qz * vx - qx * vz)
+        tz = 2.0 * (qx * vy - qy * vx)
+        return Vector((
+            vx + w * tx + (qy * tz - qz * ty),
+            vy + w * ty + (qz * tx - qx * tz),
+            vz + w * tz + (qx * ty - qy * tx),
+        ))
+
+    def copy(self):
+        return Quaternion(self)
+
+    def inverted(self):
+        n = self.w * self.w + self.x * self.x + self.y * self.y + self.z * self.z
+        return Quaternion((self.w / n, -self.x / n, -self.y / n, -self.z / n))
+
+    def normalize(self):
+        n = sqrt(self.w * self.w + self.x * self.x + self.y * self.y + self.z * self.z)
+        self.w, self.x, self.y, self.z = self.w / n, self.x / n, self.y / n, self.z / n
+
+    def to_matrix(self):
+        w, x, y, z = self.w, self.x, self.y, self.z
+        return Matrix((
+            (1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)),
+            (2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)),
+            (2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)),
+        ))
+
+
+class Euler:
+    __slots__ = ("x", "y", "z", "order")
+
+    def __init__(self, angles=(0.0, 0.0, 0.0), order='XYZ'):
+        if order != 'XYZ':
+            raise NotImplementedError("only 'XYZ' Euler order is supported")
+        self.x, self.y, self.z = (float(v) for v in angles)
+        self.order = order
+
+    def to_quaternion(self):
+        cx, sx = cos(self.x * 0.5), sin(self.x * 0.5)
+        cy, sy = cos(self.y * 0.5), sin(self.y * 0.5)
+        cz, sz = cos(self.z * 0.5), sin(self.z * 0.5)
+        return Quaternion((
+            cx * cy * cz + sx * sy * sz,
+            sx * cy * cz - cx * sy * sz,
+            cx * sy * cz + sx * cy * sz,
+            cx * cy * sz - sx * sy * cz,
+        ))
+
+
+class Matrix:
+    __slots__ = ("rows",)
+
+    def __init__(self, rows=None):
+        if rows is None:
+            rows = [[1.0 if i == j else 0.0 for j in range(4)] for i in range(4)]
+        self.rows = [[float(v) for v in row] for row in rows]
+
+    @classmethod
+    def Identity(cls, size):
+        return cls([[1.0 if i == j else 0.0 for j in range(size)] for i in range(size)])
+
+    @classmethod
+    def Translation(cls, v):
+        m = cls.Identity(4)
+        m.rows[0][3], m.rows[1][3], m.rows[2][3] = v[0], v[1], v[2]
+        return m
+
+    def __getitem__(self, i):
+        return self.rows[i]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __repr__(self):
+        return f"Matrix({self.rows!r})"
+
+    def __matmul__(self, other):
+        if isinstance(other, Matrix):
+            cols = list(zip(*other.rows))
+            return Matrix([[sum(a * b for a, b in zip(row, col)) for col in cols] for row in self.rows])
+        v = list(other) + ([1.0] if len(self.rows) == 4 else [])
+        out = [sum(a * b for a, b in zip(row, v)) for row in self.rows]
+        return Vector(out[:3])
+
+    def copy(self):
+        return Matrix(self.rows)
+
+    def to_4x4(self):
+        m = Matrix.Identity(4)
+        for i, row in enumerate(self.rows[:3]):
+            m.rows[i][:3] = row[:3]
+        return m
+
+    @property
+    def translation(self):
+        return Vector((self.rows[0][3], self.rows[1][3], self.rows[2][3]))
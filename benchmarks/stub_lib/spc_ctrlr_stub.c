@@ -0,0 +1,109 @@
+/*
+ * blender-spacecontroller-3d-mouse
+ * Unofficial Blender add-on for SpaceController 3D mice.
+ * Copyright (c) 2025 Mikhail Krigman
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ */
+
+/*
+ * Test-only stand-in for the SpaceControl controller library.
+ *
+ * Implements the four entry points the add-on declares in
+ * SpaceControllerDevice._setup_function_signatures() with scripted data:
+ *
+ *   sample n (0-based, counted per device) has
+ *     x = n % 701 - 350,  y = -x,  z = 2 * x
+ *     a = n % 101 - 50,   b = -a,  c = 3 * a
+ *     wheel = 0, buttons = n % 3, event = n % 5
+ *     timestamp = (n + 1) ms
+ *
+ * scFetchStdData() returns 0 ("new data") for `burst` samples, then 1
+ * ("no new data") once, so a drain loop terminates. scStubConfigure() sets
+ * the device count and burst length; scStubReset() restarts the script.
+ */
+
+#include <stdbool.h>
+
+#define STUB_MAX_DEVICES 8
+
+static int g_num_devices = 1;
+static int g_burst = 4;
+static int g_connected = 0;
+static long g_sample[STUB_MAX_DEVICES];
+static int g_in_burst[STUB_MAX_DEVICES];
+
+void scStubConfigure(int num_devices, int burst)
+{
+    g_num_devices = num_devices < 0 ? 0 : (num_devices > STUB_MAX_DEVICES ? STUB_MAX_DEVICES : num_devices);
+    g_burst = burst < 1 ? 1 : burst;
+}
+
+void scStubReset(void)
+{
+    for (int i = 0; i < STUB_MAX_DEVICES; ++i) {
+        g_sample[i] = 0;
+        g_in_burst[i] = 0;
+    }
+}
+
+int scConnect2(bool useDaemon, const char *applicationName)
+{
+    (void)useDaemon;
+    (void)applicationName;
+    g_connected = 1;
+    return 0;
+}
+
+int scDisconnect(void)
+{
+    g_connected = 0;
+    return 0;
+}
+
+int scGetDevNum(int *numAll, int *numUsb, int *numOther)
+{
+    if (!g_connected)
+        return 1;
+    *numAll = g_num_devices;
+    *numUsb = g_num_devices;
+    *numOther = 0;
+    return 0;
+}
+
+int scFetchStdData(int devId,
+                   short *x, short *y, short *z,
+                   short *a, short *b, short *c,
+                   int *wheel, int *buttons, int *event,
+                   long *tvSec, long *tvUsec)
+{
+    if (!g_connected || devId < 0 || devId >= g_num_devices)
+        return 1;
+
+    if (g_in_burst[devId] >= g_burst) {
+        g_in_burst[devId] = 0;
+        return 1;  /* no new data */
+    }
+    g_in_burst[devId]++;
+
+    long n = g_sample[devId]++;
+    short t = (short)(n % 701 - 350);
+    short r = (short)(n % 101 - 50);
+    long ms = n + 1;
+
+    *x = t;
+    *y = (short)-t;
+    *z = (short)(2 * t);
+    *a = r;
+    *b = (short)-r;
+    *c = (short)(3 * r);
+    *wheel = 0;
+    *buttons = (int)(n % 3);
+    *event = (int)(n % 5);
+    *tvSec = ms / 1000;
+    *tvUsec = (ms % 1000) * 1000;
+    return 0;
+}
@@ -0,0 +1,57 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Build helper for the test-only SpaceControl stub library
+(benchmarks/stub_lib/spc_ctrlr_stub.c).
+
+    python -m benchmarks.stub_library   # builds benchmarks/stub_lib/libspc_ctrlr_stub.so
+
+build() compiles with the system C compiler ($CC, default "cc") when the
+source is newer than the library; expected_sample() mirrors the script in
+the C file so results read through the library can be checked.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Tuple
+
+STUB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub_lib")
+SOURCE = os.path.join(STUB_DIR, "spc_ctrlr_stub.c")
+LIBRARY = os.path.join(
+    STUB_DIR, "spc_ctrlr_stub.dll" if sys.platform == "win32" else "libspc_ctrlr_stub.so"
+)
+
+
+def build(force: bool = False) -> str:
+    """Compile the stub library if needed and return its path."""
+    if (
+        not force
+        and os.path.exists(LIBRARY)
+        and os.path.getmtime(LIBRARY) >= os.path.getmtime(SOURCE)
+    ):
+        return LIBRARY
+    cc = os.environ.get("CC", "cc")
+    subprocess.run(
+        [cc, "-O2", "-shared", "-fPIC", "-o", LIBRARY, SOURCE],
+        check=True,
+    )
+    return LIBRARY
+
+
+def expected_sample(n: int) -> Tuple[Tuple[int, ...], int, float]:
+    """(axes, event, timestamp) the stub returns as sample `n` of a device."""
+    t = n % 701 - 350
+    r = n % 101 - 50
+    return (t, -t, 2 * t, r, -r, 3 * r), n % 5, (n + 1) / 1000.0
+
+
+if __name__ == "__main__":
+    print(build(force=True))
@@ -0,0 +1,218 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Benchmark suite for the input-to-view pipeline of one timer tick.
+
+Each case times one stage of `_spacecontroller_timer` in the headless
+harness and reports mean / p50 / p99 time and traced bytes allocated per
+call. Results can be saved as a baseline JSON file and compared against one:
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --save benchmarks/baselines/linux-headless.json
+    python -m benchmarks.suite --compare benchmarks/baselines/linux-headless.json
+
+With --compare, the exit status is 1 if any case's p50 regressed by more
+than --threshold (default 25%).
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from ._addon import fake_device
+from .harness import HeadlessBlender
+
+Case = Callable[[], object]
+
+
+def measure(fn: Case, iterations: int, alloc_iterations: int) -> Dict[str, float]:
+    """Time `fn` per call and measure the traced bytes it allocates per call."""
+    for _ in range(min(iterations, 1000)):
+        fn()  # warm up
+
+    perf_counter_ns = time.perf_counter_ns
+    samples: List[int] = [0] * iterations
+    for i in range(iterations):
+        t0 = perf_counter_ns()
+        fn()
+        samples[i] = perf_counter_ns() - t0
+    samples.sort()
+
+    allocated = 0
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_iterations):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            allocated += peak - base
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "mean_us": sum(samples) / iterations / 1e3,
+        "p50_us": samples[iterations // 2] / 1e3,
+        "p99_us": samples[min(iterations - 1, int(iterations * 0.99))] / 1e3,
+        "alloc_bytes": allocated / alloc_iterations,
+    }
+
+
+def build_cases(blender: HeadlessBlender) -> Dict[str, Case]:
+    addon = blender.addon
+    area = blender.view3d_area
+    region3d = blender.region_3d
+    state = addon.SpaceControllerState(120.0, -40.0, 15.0, 30.0, -60.0, 5.0)
+
+    # Plain-Python fetch entry point: measures the wrapper code, not the cost
+    # of a ctypes callback standing in for the DLL.
+    device = fake_device(ffi=False)
+    fetch_state = addon.SpaceControllerState()
+    fetch_batch = addon.SpaceControllerBatch()
+
+    def fetch_read_state_into():
+        device.read_state_into(fetch_state)
+
+    def fetch_read_states():
+        device.read_states(fetch_batch, 8)
+
+    def view_lookup_scan():
+        addon._find_first_view3d()
+
+    def view_lookup_cached():
+        addon._view_target.get()
+
+    def prefs_get_prefs():
+        prefs = addon.get_prefs()
+        return (prefs.invert_x, prefs.invert_y, prefs.invert_z,
+                prefs.move_sensitivity, prefs.enable_rotation, prefs.rotate_sensitivity)
+
+    def prefs_snapshot():
+        prefs = addon._prefs
+        return (prefs.invert_x, prefs.invert_y, prefs.invert_z,
+                prefs.move_sensitivity, prefs.enable_rotation, prefs.rotate_sensitivity)
+
+    integrator = addon._view_integrator
+
+    def apply_math():
+        # The math of _apply_state_to_area, without the area checks and redraw.
+        right, up, forward, pitch, yaw, roll = addon._prefs.axis_mapping.map(state)
+        rotation = region3d.view_rotation
+        integrator.translate(rotation, region3d.view_location, right, up, forward)
+        integrator.rotate(rotation, pitch, yaw, roll)
+
+    def redraw_tag():
+        area.tag_redraw()
+
+    def apply_full():
+        addon._apply_state_to_area(area, state)
+
+    # One simulated 100 Hz sample per tick: the clock advances 10 ms per call.
+    clock = [0.0]
+    addon._device.close()
+    addon._device = addon.SimulatedBackend(rate_hz=100.0, clock=lambda: clock[0])
+    addon._device.connect()
+
+    def timer_tick():
+        clock[0] += 0.01
+        blender.tick()
+
+    return {
+        "fetch.read_state_into": fetch_read_state_into,
+        "fetch.read_states_x8": fetch_read_states,
+        "view_lookup.scan": view_lookup_scan,
+        "view_lookup.cached": view_lookup_cached,
+        "prefs.get_prefs": prefs_get_prefs,
+        "prefs.snapshot": prefs_snapshot,
+        "apply.math": apply_math,
+        "apply.redraw_tag": redraw_tag,
+        "apply.full": apply_full,
+        "tick.full": timer_tick,
+    }
+
+
+def run_suite(iterations: int, alloc_iterations: int, windows: int, areas: int) -> Dict:
+    with HeadlessBlender(windows=windows, areas_per_window=areas) as blender:
+        prefs = blender.prefs
+        prefs.backend = 'SIMULATED'
+        prefs.simulated_rate = 0.0
+        blender.wait_for_device()
+        results = {
+            name: measure(fn, iterations, alloc_iterations)
+            for name, fn in build_cases(blender).items()
+        }
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "windows": windows,
+            "areas_per_window": areas,
+            "iterations": iterations,
+        },
+        "results": results,
+    }
+
+
+def print_report(report: Dict, baseline: Dict = None, threshold: float = 0.25) -> bool:
+    """Print a table; returns False if a case regressed against `baseline`."""
+    ok = True
+    header = f"{'case':<24}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}{'alloc B':>10}"
+    if baseline:
+        header += f"{'p50 vs base':>14}"
+    print(header)
+    for name, r in report["results"].items():
+        line = (
+            f"{name:<24}{r['mean_us']:>10.3f}{r['p50_us']:>10.3f}"
+            f"{r['p99_us']:>10.3f}{r['alloc_bytes']:>10.1f}"
+        )
+        base = (baseline or {}).get("results", {}).get(name)
+        if base and base["p50_us"] > 0:
+            change = r["p50_us"] / base["p50_us"] - 1.0
+            flag = "  REGRESSION" if change > threshold else ""
+            ok = ok and not flag
+            line += f"{change:>+13.1%}{flag}"
+        print(line)
+    return ok
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="SpaceController pipeline benchmark suite")
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--alloc-iterations", type=int, default=2_000)
+    parser.add_argument("--windows", type=int, default=2)
+    parser.add_argument("--areas", type=int, default=8, help="areas per window")
+    parser.add_argument("--save", metavar="JSON", help="write results as a baseline file")
+    parser.add_argument("--compare", metavar="JSON", help="compare against a baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed p50 slow-down before a case counts as a regression")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.iterations, args.alloc_iterations, args.windows, args.areas)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    ok = print_report(report, baseline, args.threshold)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,31 +17,264 @@ bl_info = {
     "category": "3D View",
 }
 
+import atexit
+import os
+import subprocess
+import sys
+import time
+
 import bpy
+from bpy.app.handlers import persistent
 from bpy.types import Operator, Panel, AddonPreferences
-from bpy.props import FloatProperty, BoolProperty
-from mathutils import Vector, Euler
-
-from .spacecontroller_device import SpaceControllerDevice, SpaceControllerState
+from bpy.props import FloatProperty, BoolProperty, EnumProperty, IntProperty, StringProperty
+from mathutils import Matrix, Vector, Euler
+
+from .spacecontroller_device import (
+    DeviceBackend,
+    SpaceControllerBatch,
+    SpaceControllerDevice,
+    SpaceControllerState,
+)
+from .simulated_backend import SimulatedBackend
+from .spacenav_backend import DEFAULT_SOCKET_PATH, SpacenavBackend
+from .hid_backend import DEFAULT_HIDRAW_PATH, HidrawBackend
+from .evdev_backend import DEFAULT_EVDEV_PATH, EvdevBackend
+from .shm_broker import DEFAULT_BROKER_NAME, SharedMemoryBackend, launch_broker, stop_broker
+from .udp_source import DEFAULT_PORT, UdpBackend
+from .recording import RecordingBackend, ReplayBackend
+from .device_reader import DeviceReaderThread, SampleRingBuffer
+from .multi_device import DevicePoller
+from .reconnect import ReconnectController
+from .hotplug import HotplugWatcher
+from .poll_rate import IdlePollBackoff, SampleRateEstimator
+from .prefs_snapshot import PrefsSnapshot
+from .view_math import ViewIntegrator
 
 # ---------------------------------------------------------------------------
 # Global state: background device + timer
 # ---------------------------------------------------------------------------
 
-_device: SpaceControllerDevice | None = None
+_device: DeviceBackend | None = None
+_reader: DeviceReaderThread | None = None   # optional background poller
+_extra_devices = DevicePoller()  # devices beyond the first, polled in the same tick
+_connector = ReconnectController()  # opens devices off the main thread, with backoff
+_hotplug = HotplugWatcher()         # probes the device count off the main thread
+_poll_backoff = IdlePollBackoff()    # slows the timer down while nobody touches the mouse
+_rate_estimator = SampleRateEstimator()  # matches the active poll rate to the device
+_extra_motion: bool = False          # an extra device moved during the current tick
+_view_integrator = ViewIntegrator()  # allocation-free view rotation / translation
 _enabled: bool = True           # whether we actively use the device
 _addon_alive: bool = True       # set False on unregister to stop the timer
+_broker_process: subprocess.Popen | None = None  # broker started by the operator
+
+_READER_CAPACITY = 256         # ring buffer size for the background reader
+_MAX_SAMPLES_PER_TICK = 64     # cap for draining the device inline
+_ACTIVE_INTERVAL = 0.01        # poll interval while moving, without adaptive polling
+
+# Time-based motion: sensitivities are tuned for one sample per 10 ms.
+_REFERENCE_DT = 0.01
+_MAX_SAMPLE_DT = 0.1           # clamp for gaps in the device stream
+_last_sample_time: float = 0.0  # device timestamp of the last applied sample
+
+# Default motion: the mean of a tick's samples, scaled by the wall time since
+# the previous tick with samples, so speed depends on neither the device rate
+# nor the poll interval (a 10 ms tick with one sample applies that sample).
+_last_tick_time: float = 0.0    # time.perf_counter() of the last tick with samples
+_tick_scale: float = 1.0        # elapsed / _REFERENCE_DT for the current tick
+
+# Startup instrumentation: seconds per phase of the last device open.
+_register_time: float = 0.0
+_recorded_path: str = ""         # recording file opened in this session, if any
+_startup_pending: bool = False  # the first timer tick still has to start the open
+_startup_timings: dict[str, float] = {}
+
+# Reused every tick: all samples read since the last tick, and their sum.
+_batch = SpaceControllerBatch()
+_tick_state = SpaceControllerState()
+_extra_state = SpaceControllerState()
 
 
 # ---------------------------------------------------------------------------
 # Addon preferences (tuning sensitivity)
 # ---------------------------------------------------------------------------
 
+# Snapshot of the preferences used on the hot path; see prefs_snapshot.py.
+_prefs: PrefsSnapshot = PrefsSnapshot()
+
+
+def _on_prefs_update(self, _context) -> None:
+    """`update=` callback of the hot-path preferences: rebuild the snapshot."""
+    global _prefs
+    _prefs = PrefsSnapshot.from_prefs(self)
+
+
+def _on_min_poll_interval_update(self, context) -> None:
+    """Keep the poll interval bounds ordered: raising the minimum drags the maximum."""
+    if self.max_poll_interval < self.min_poll_interval:
+        self.max_poll_interval = self.min_poll_interval   # updates the snapshot
+    else:
+        _on_prefs_update(self, context)
+
+
+def _on_max_poll_interval_update(self, context) -> None:
+    """Keep the poll interval bounds ordered: lowering the maximum drags the minimum."""
+    if self.min_poll_interval > self.max_poll_interval:
+        self.min_poll_interval = self.max_poll_interval   # updates the snapshot
+    else:
+        _on_prefs_update(self, context)
+
+
+def _on_hotplug_interval_update(self, _context) -> None:
+    _hotplug.set_interval(self.hotplug_interval)
+
+
 class SpaceControllerPreferences(AddonPreferences):
     """Global settings for the SpaceController addon."""
     bl_idname = __name__
 
+    backend: EnumProperty(
+        name="Input Source",
+        items=(
+            ('SPACECONTROL', "SpaceControl Driver", "SpaceController device via the vendor DLL"),
+            ('SPACENAV', "spacenavd", "Any 3D mouse served by the spacenavd daemon (Linux)"),
+            ('HIDRAW', "Raw HID", "Read HID reports straight from a /dev/hidraw* device node"),
+            ('EVDEV', "evdev", "Generic 6-axis controller via a /dev/input/event* device (Linux)"),
+            ('SHARED', "Shared Broker", "Samples published by a broker process that owns the device, "
+                                        "so several Blender instances can share it"),
+            ('UDP', "Network (UDP / OSC)", "6-DOF samples sent over UDP by another machine or tool"),
+            ('SIMULATED', "Simulated", "Scripted random 6-DOF stream, no hardware needed"),
+            ('REPLAY', "Replay Recording", "Play back a recorded controller stream"),
+        ),
+        default='SPACENAV' if sys.platform.startswith("linux") else 'SPACECONTROL',
+        description="Where controller samples come from (applies on next device open)",
+    )   # type: ignore[valid-type]
+
+    simulated_rate: FloatProperty(
+        name="Simulated Rate (Hz)",
+        default=100.0,
+        min=0.0,
+        max=2000.0,
+        description="Sample rate of the simulated input source (0 = as fast as polled)",
+    )   # type: ignore[valid-type]
+
+    replay_path: StringProperty(
+        name="Replay File",
+        subtype='FILE_PATH',
+        default="",
+        description="Recording to play back when the input source is 'Replay Recording'",
+    )   # type: ignore[valid-type]
+
+    replay_realtime: BoolProperty(
+        name="Original Timing",
+        default=True,
+        description="Replay at the recorded timing instead of as fast as possible",
+    )   # type: ignore[valid-type]
+
+    spacenav_socket: StringProperty(
+        name="spacenavd Socket",
+        subtype='FILE_PATH',
+        default=DEFAULT_SOCKET_PATH,
+        description="Unix socket of the spacenavd daemon",
+    )   # type: ignore[valid-type]
+
+    hidraw_path: StringProperty(
+        name="HID Device",
+        subtype='FILE_PATH',
+        default=DEFAULT_HIDRAW_PATH,
+        description="hidraw device node (or a FIFO / file of recorded reports)",
+    )   # type: ignore[valid-type]
+
+    hidraw_combined: BoolProperty(
+        name="Combined Axis Report",
+        default=False,
+        description="The device sends all six axes in report 1 instead of separate translation and rotation reports",
+    )   # type: ignore[valid-type]
+
+    evdev_path: StringProperty(
+        name="Event Device",
+        subtype='FILE_PATH',
+        default=DEFAULT_EVDEV_PATH,
+        description="evdev node of the controller, e.g. /dev/input/by-id/...-event-joystick",
+    )   # type: ignore[valid-type]
+
+    broker_name: StringProperty(
+        name="Broker Name",
+        default=DEFAULT_BROKER_NAME,
+        description="Shared memory name of the device broker",
+    )   # type: ignore[valid-type]
+
+    udp_port: IntProperty(
+        name="UDP Port",
+        default=DEFAULT_PORT,
+        min=1,
+        max=65535,
+        description="Port to receive binary or OSC samples on",
+    )   # type: ignore[valid-type]
+
+    udp_remote: BoolProperty(
+        name="Accept Remote Senders",
+        default=False,
+        description="Listen on all network interfaces instead of this machine only",
+    )   # type: ignore[valid-type]
+
+    udp_mode: EnumProperty(
+        name="Per Tick",
+        items=(
+            ('LATEST', "Newest", "Use the newest sample received since the last tick"),
+            ('INTEGRATE', "Sum", "Sum all samples received since the last tick"),
+        ),
+        default='LATEST',
+        description="How datagrams queued between two ticks are combined",
+    )   # type: ignore[valid-type]
+
+    library_path: StringProperty(
+        name="Driver Library",
+        subtype='FILE_PATH',
+        default="",
+        description="Custom path of the SpaceControl library (empty = default install location)",
+    )   # type: ignore[valid-type]
+
+    hotplug_interval: FloatProperty(
+        update=_on_hotplug_interval_update,
+        name="Hot-plug Check (s)",
+        default=2.0,
+        min=0.0,
+        max=60.0,
+        description=(
+            "How often to check in the background whether a device was plugged "
+            "in or out, to reconnect automatically (0 = off)"
+        ),
+    )   # type: ignore[valid-type]
+
+    use_all_devices: BoolProperty(
+        name="Use All Devices",
+        default=False,
+        description=(
+            "Open every connected SpaceController: the first navigates the "
+            "view, the others drive the target below"
+        ),
+    )   # type: ignore[valid-type]
+
+    extra_device_target: EnumProperty(
+        update=_on_prefs_update,
+        name="Other Devices",
+        items=(
+            ('OBJECT', "Active Object", "Move and rotate the active object in view space"),
+            ('VIEW', "View", "Navigate the 3D view, like the first device"),
+        ),
+        default='OBJECT',
+        description="What devices beyond the first one control",
+    )   # type: ignore[valid-type]
+
+    record_path: StringProperty(
+        name="Record To",
+        subtype='FILE_PATH',
+        default="",
+        description="If set, every sample read from the input source is recorded to this file",
+    )   # type: ignore[valid-type]
+
     move_sensitivity: FloatProperty(
+        update=_on_prefs_update,
         name="Move Sensitivity",
         default=0.001,
         min=0.00001,
@@ -50,6 +283,7 @@ class SpaceControllerPreferences(AddonPreferences):
     )   # type: ignore[valid-type]
 
     rotate_sensitivity: FloatProperty(
+        update=_on_prefs_update,
         name="Rotate Sensitivity",
         default=0.0005,
         min=0.00001,
@@ -58,41 +292,201 @@ class SpaceControllerPreferences(AddonPreferences):
     )   # type: ignore[valid-type]
 
     invert_x: BoolProperty(
+        update=_on_prefs_update,
         name="Invert X",
         default=False,
         description="Invert X movement",
     )   # type: ignore[valid-type]
 
     invert_y: BoolProperty(
+        update=_on_prefs_update,
         name="Invert Y",
         default=False,
         description="Invert Y movement",
     )   # type: ignore[valid-type]
 
     invert_z: BoolProperty(
+        update=_on_prefs_update,
         name="Invert Z",
         default=False,
         description="Invert Z movement",
     )   # type: ignore[valid-type]
 
+    swap_yz: BoolProperty(
+        update=_on_prefs_update,
+        name="Swap Y/Z",
+        default=False,
+        description="Swap up/down and forward/backward (and the matching rotations)",
+    )   # type: ignore[valid-type]
+
+    axis_coupling: StringProperty(
+        update=_on_prefs_update,
+        name="Axis Coupling",
+        default="",
+        description=(
+            "Mix device axes into other view axes, as comma-separated "
+            "device>view:factor entries (e.g. \"ry>right:0.2\"; device axes "
+            "tx ty tz rx ry rz, view axes right up forward pitch yaw roll)"
+        ),
+    )   # type: ignore[valid-type]
+
+    response_curve: EnumProperty(
+        update=_on_prefs_update,
+        name="Response Curve",
+        items=(
+            ('LINEAR', "Linear", "Output proportional to deflection"),
+            ('DEADZONE', "Dead Zone", "Linear, ignoring small deflections"),
+            ('EXPONENTIAL', "Exponential", "Fine control near the center, fast at full deflection"),
+            ('S_CURVE', "S-Curve", "Soft start and soft saturation"),
+            ('CUSTOM', "Custom", "Piecewise linear curve through the points below"),
+        ),
+        default='LINEAR',
+        description="How axis deflection maps to motion",
+    )   # type: ignore[valid-type]
+
+    deadzone: FloatProperty(
+        update=_on_prefs_update,
+        name="Dead Zone",
+        default=0.0,
+        min=0.0,
+        max=0.5,
+        subtype='FACTOR',
+        description="Fraction of full deflection that is ignored",
+    )   # type: ignore[valid-type]
+
+    curve_exponent: FloatProperty(
+        update=_on_prefs_update,
+        name="Curve Exponent",
+        default=2.0,
+        min=1.0,
+        max=5.0,
+        description="Steepness of the exponential and S-curve responses",
+    )   # type: ignore[valid-type]
+
+    custom_curve: StringProperty(
+        update=_on_prefs_update,
+        name="Curve Points",
+        default="0.25:0.1, 0.5:0.3, 0.75:0.6",
+        description="Custom curve as comma-separated input:output pairs between 0 and 1",
+    )   # type: ignore[valid-type]
+
     enable_rotation: BoolProperty(
+        update=_on_prefs_update,
         name="Enable Rotation",
         default=True,
         description="Apply controller rotation to the 3D view",
     )   # type: ignore[valid-type]
 
+    time_based_motion: BoolProperty(
+        update=_on_prefs_update,
+        name="Frame-rate Independent Motion",
+        default=False,
+        description=(
+            "Weight each sample by the device time elapsed since the one before "
+            "it, instead of averaging the samples of each update over wall-clock time"
+        ),
+    )   # type: ignore[valid-type]
+
+    use_reader_thread: BoolProperty(
+        update=_on_prefs_update,
+        name="Background Reader Thread",
+        default=False,
+        description=(
+            "Poll the device on a background thread and buffer samples, "
+            "so a slow driver never blocks the UI"
+        ),
+    )   # type: ignore[valid-type]
+
+    adaptive_poll_rate: BoolProperty(
+        update=_on_prefs_update,
+        name="Adaptive Poll Rate",
+        default=False,
+        description=(
+            "Measure the device's sample rate and poll at the same rate while "
+            "moving (within the bounds below), instead of a fixed 100 Hz"
+        ),
+    )   # type: ignore[valid-type]
+
+    min_poll_interval: FloatProperty(
+        update=_on_min_poll_interval_update,
+        name="Min Poll Interval (s)",
+        default=0.004,
+        min=0.001,
+        max=0.1,
+        precision=3,
+        description="Shortest timer interval adaptive polling may choose",
+    )   # type: ignore[valid-type]
+
+    max_poll_interval: FloatProperty(
+        update=_on_max_poll_interval_update,
+        name="Max Poll Interval (s)",
+        default=0.02,
+        min=0.001,
+        max=0.1,
+        precision=3,
+        description="Longest timer interval adaptive polling may choose",
+    )   # type: ignore[valid-type]
+
     def draw(self, _context):
         layout = self.layout
         layout.label(text="SpaceController Settings")
         col = layout.column(align=True)
+        col.prop(self, "backend")
+        if self.backend == 'SIMULATED':
+            col.prop(self, "simulated_rate")
+        elif self.backend == 'REPLAY':
+            col.prop(self, "replay_path")
+            col.prop(self, "replay_realtime")
+        elif self.backend == 'SPACENAV':
+            col.prop(self, "spacenav_socket")
+        elif self.backend == 'HIDRAW':
+            col.prop(self, "hidraw_path")
+            col.prop(self, "hidraw_combined")
+        elif self.backend == 'EVDEV':
+            col.prop(self, "evdev_path")
+        elif self.backend == 'SHARED':
+            col.prop(self, "broker_name")
+            col.prop(self, "library_path")
+            if _broker_running():
+                col.operator(SPACECONTROLLER_OT_stop_broker.bl_idname, icon='PAUSE')
+            else:
+                col.operator(SPACECONTROLLER_OT_start_broker.bl_idname, icon='PLAY')
+        elif self.backend == 'UDP':
+            col.prop(self, "udp_port")
+            col.prop(self, "udp_remote")
+            col.prop(self, "udp_mode")
+        else:
+            col.prop(self, "library_path")
+            col.prop(self, "use_all_devices")
+            if self.use_all_devices:
+                col.prop(self, "extra_device_target")
+        col.prop(self, "record_path")
+        col.prop(self, "hotplug_interval")
+        col.separator()
         col.prop(self, "move_sensitivity")
         col.prop(self, "rotate_sensitivity")
         col.prop(self, "enable_rotation")
+        col.prop(self, "time_based_motion")
+        col.prop(self, "use_reader_thread")
+        col.prop(self, "adaptive_poll_rate")
+        if self.adaptive_poll_rate:
+            col.prop(self, "min_poll_interval")
+            col.prop(self, "max_poll_interval")
         row = col.row(align=True)
         row.label(text="Invert axes:")
         row.prop(self, "invert_x", text="X")
         row.prop(self, "invert_y", text="Y")
         row.prop(self, "invert_z", text="Z")
+        col.prop(self, "swap_yz")
+        col.prop(self, "axis_coupling")
+        col.separator()
+        col.prop(self, "response_curve")
+        if self.response_curve != 'LINEAR':
+            col.prop(self, "deadzone")
+        if self.response_curve in {'EXPONENTIAL', 'S_CURVE'}:
+            col.prop(self, "curve_exponent")
+        elif self.response_curve == 'CUSTOM':
+            col.prop(self, "custom_curve")
 
 
 def get_prefs() -> SpaceControllerPreferences:
@@ -104,10 +498,10 @@ def get_prefs() -> SpaceControllerPreferences:
 # ---------------------------------------------------------------------------
 
 def _find_first_view3d():
-    """Return (area, region, space) for the first VIEW_3D window, or (None, None, None)."""
+    """Return (window, area, region, space) of the first VIEW_3D, or four Nones."""
     wm = bpy.context.window_manager
     if wm is None:
-        return None, None, None
+        return None, None, None, None
 
     for window in wm.windows:
         screen = window.screen
@@ -118,8 +512,89 @@ def _find_first_view3d():
                 space = area.spaces.active
                 for region in area.regions:
                     if region.type == 'WINDOW':
-                        return area, region, space
-    return None, None, None
+                        return window, area, region, space
+    return None, None, None, None
+
+
+class _ViewTargetCache:
+    """Cached (area, region, space) of the VIEW_3D the controller drives.
+
+    The full window-manager scan in _find_first_view3d() only runs when the
+    cache is empty. It is emptied by invalidate(), which is hooked to file
+    loads and window screen / workspace changes, and by a cheap validity
+    check on every get().
+
+    Windows and areas are not ID blocks: Blender frees them without raising
+    ReferenceError on a stale reference, so the check never touches the
+    cached area until the path to it is confirmed. The window must still be
+    open at the same index in wm.windows, still show the cached screen, and that screen must have the same
+    number of areas (joining, splitting and maximizing all change the
+    screen or its areas). Only then is the area's type checked.
+    """
+
+    def __init__(self):
+        self._target = None
+        self._window = None
+        self._window_index = -1
+        self._screen = None
+        self._area_count = -1
+
+    def get(self):
+        target = self._target
+        if target is not None:
+            wm = bpy.context.window_manager
+            windows = wm.windows if wm is not None else ()
+            index = self._window_index
+            if index < len(windows) and windows[index] == self._window:
+                try:
+                    screen = self._window.screen
+                    if (
+                        screen == self._screen
+                        and len(screen.areas) == self._area_count
+                        and target[0].type == 'VIEW_3D'
+                    ):
+                        return target
+                except ReferenceError:
+                    pass
+            self._target = None
+
+        window, area, region, space = _find_first_view3d()
+        if area is not None:
+            self._target = (area, region, space)
+            self._window = window
+            for index, open_window in enumerate(bpy.context.window_manager.windows):
+                if open_window == window:
+                    self._window_index = index
+                    break
+            self._screen = window.screen
+            self._area_count = len(self._screen.areas)
+        return area, region, space
+
+    def invalidate(self, *_args) -> None:
+        self._target = None
+
+
+_view_target = _ViewTargetCache()
+_msgbus_owner = object()
+
+
+@persistent
+def _on_load_post(*_args):
+    # Loading a file replaces all screens and drops msgbus subscriptions.
+    _view_target.invalidate()
+    _subscribe_screen_changes()
+
+
+def _subscribe_screen_changes() -> None:
+    """Invalidate the cached view target whenever a window changes screen / workspace."""
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    for prop in ("screen", "workspace"):
+        bpy.msgbus.subscribe_rna(
+            key=(bpy.types.Window, prop),
+            owner=_msgbus_owner,
+            args=(),
+            notify=_view_target.invalidate,
+        )
 
 
 def _apply_state_to_area(area, state: SpaceControllerState) -> None:
@@ -127,126 +602,378 @@ def _apply_state_to_area(area, state: SpaceControllerState) -> None:
 
     - Translation: in view (camera) space: right / up / forward.
     - Rotation: orbit around the view pivot (RegionView3D.view_location).
+
+    A state without motion is a no-op: no view math, no redraw.
     """
-    if area is None or area.type != 'VIEW_3D':
+    if area is None or area.type != 'VIEW_3D' or not state.has_motion():
         return
 
-    prefs = get_prefs()
     space = area.spaces.active
     region3d = space.region_3d
     if region3d is None:
         return
 
+    # Inversion, sensitivity and axis assignment are precompiled into one
+    # 6x6 matrix (see PrefsSnapshot.compile_axis_mapping):
+    #   tx / ty / tz: move right / up / forward in view
+    #   rx / ry / rz: pitch (look up/down) / yaw (turn) / roll (tilt head)
+    t_right, t_up, t_forward, pitch, yaw, roll = _prefs.axis_mapping.map(state)
+
+    # Motion is integrated in place with plain float math (ViewIntegrator),
+    # so no Vector / Euler / Quaternion temporaries are built per tick.
+    rotation = region3d.view_rotation
+
     # ----------------------------------------------------------------------
     # TRANSLATION IN VIEW SPACE
     # ----------------------------------------------------------------------
-    sx = -1.0 if prefs.invert_x else 1.0
-    sy = -1.0 if prefs.invert_y else 1.0
-    sz = -1.0 if prefs.invert_z else 1.0
+    if t_right or t_up or t_forward:
+        # Move the view pivot by the view-space vector rotated into world
+        # space = pan/dolly in camera space.
+        location = region3d.view_location
+        _view_integrator.translate(rotation, location, t_right, t_up, t_forward)
+        region3d.view_location = location
 
-    move_scale = prefs.move_sensitivity
-
-    # Controller translation:
-    #   tx: move right / left in view
-    #   ty: move up   / down in view
-    #   tz: move forward / backward in view
-    t_right   = state.tx * move_scale * sx
-    t_up      = state.ty * move_scale * sy
-    t_forward = state.tz * move_scale * sz
+    # ----------------------------------------------------------------------
+    # ROTATION ABOUT PIVOT (RegionView3D.view_location)
+    # ----------------------------------------------------------------------
+    if pitch or yaw or roll:
+        # Apply rotation in view-local space:
+        _view_integrator.rotate(rotation, pitch, yaw, roll)
+        region3d.view_rotation = rotation
 
-    # Vector in *view* space (camera local)
-    v_cam = Vector((t_right, t_up, t_forward))
+    area.tag_redraw()
 
-    # Convert from view space to world space using the view rotation.
-    v_world = region3d.view_rotation @ v_cam
 
-    # Move the view pivot in world space = pan/dolly in camera space.
-    region3d.view_location += v_world
+def _apply_state_to_object(obj, area, state: SpaceControllerState) -> None:
+    """Move / rotate `obj` by a SpaceControllerState, in the view space of `area`.
 
-    # ----------------------------------------------------------------------
-    # ROTATION ABOUT PIVOT (RegionView3D.view_location)
-    # ----------------------------------------------------------------------
-    if prefs.enable_rotation:
-        rot_scale = prefs.rotate_sensitivity
+    Uses the same axis conventions as _apply_state_to_area; rotation is about
+    the object's origin.
+    """
+    if obj is None or area is None or area.type != 'VIEW_3D' or not state.has_motion():
+        return
+    region3d = area.spaces.active.region_3d
+    if region3d is None:
+        return
 
-        # Map controller rotations to view rotations:
-        #   rx: pitch (look up/down)
-        #   ry: yaw   (turn left/right)
-        #   rz: roll  (tilt head)
-        pitch = state.rx * rot_scale
-        yaw   = state.ry * rot_scale
-        roll  = state.rz * rot_scale
+    t_right, t_up, t_forward, pitch, yaw, roll = _prefs.axis_mapping.map(state)
 
-        delta_rot = Euler((pitch, yaw, roll), 'XYZ').to_quaternion()
+    view_rot = region3d.view_rotation
+    v_world = view_rot @ Vector((t_right, t_up, t_forward))
 
-        # Apply rotation in view-local space:
-        region3d.view_rotation = region3d.view_rotation @ delta_rot
+    mw = obj.matrix_world
+    origin = mw.translation.copy()
+    if pitch or yaw or roll:
+        delta_view = Euler((pitch, yaw, roll), 'XYZ').to_quaternion()
+        # View-space rotation expressed in world space.
+        delta_world = (view_rot @ delta_view @ view_rot.inverted()).to_matrix().to_4x4()
+        mw = Matrix.Translation(origin) @ delta_world @ Matrix.Translation(-origin) @ mw
 
+    obj.matrix_world = Matrix.Translation(v_world) @ mw
     area.tag_redraw()
 
 
+def _apply_extra_device_batch(batch: SpaceControllerBatch, area) -> None:
+    """DevicePoller consumer for devices beyond the first one."""
+    global _extra_motion
+    if _prefs.response_curves is not None:
+        _prefs.response_curves.apply_batch(batch)
+    batch.mean_into(_extra_state, _tick_scale)
+    if not _extra_state.has_motion():
+        return
+    _extra_motion = True
+    if _prefs.extra_device_target == 'VIEW':
+        _apply_state_to_area(area, _extra_state)
+    else:
+        _apply_state_to_object(bpy.context.view_layer.objects.active, area, _extra_state)
+
+
 # ---------------------------------------------------------------------------
 # Background timer: behaves like a "device driver" poller
 # ---------------------------------------------------------------------------
 
+def _make_backend_opener():
+    """Return a function that constructs and connects the selected input source(s).
+
+    Runs on the main thread and copies everything it needs out of the
+    preferences, because the returned function runs on the reconnect worker.
+    The function returns a list of connected backends: the first one navigates
+    the view, any others ('Use All Devices') go to the extra-device poller.
+    """
+    prefs = get_prefs()
+    kind = prefs.backend
+    all_devices = prefs.use_all_devices
+    simulated_rate = prefs.simulated_rate
+    replay_path = bpy.path.abspath(prefs.replay_path)
+    replay_realtime = prefs.replay_realtime
+    record_path = bpy.path.abspath(prefs.record_path) if prefs.record_path else ""
+    # Reconnects continue this session's recording instead of replacing it.
+    record_append = record_path == _recorded_path
+    library_path = bpy.path.abspath(prefs.library_path) if prefs.library_path else None
+    spacenav_socket = prefs.spacenav_socket or DEFAULT_SOCKET_PATH
+    hidraw_path = bpy.path.abspath(prefs.hidraw_path) if prefs.hidraw_path else DEFAULT_HIDRAW_PATH
+    hidraw_combined = prefs.hidraw_combined
+    evdev_path = bpy.path.abspath(prefs.evdev_path) if prefs.evdev_path else DEFAULT_EVDEV_PATH
+    broker_name = prefs.broker_name or DEFAULT_BROKER_NAME
+    udp_host = "0.0.0.0" if prefs.udp_remote else "127.0.0.1"
+    udp_port = prefs.udp_port
+    udp_mode = prefs.udp_mode
+
+    def open_backends() -> list[DeviceBackend]:
+        if kind == 'SPACECONTROL' and all_devices:
+            devices = SpaceControllerDevice.open_all(app_name="Blender", library_path=library_path)
+        elif kind == 'SIMULATED':
+            devices = [SimulatedBackend(rate_hz=simulated_rate)]
+        elif kind == 'REPLAY':
+            devices = [ReplayBackend(replay_path, realtime=replay_realtime)]
+        elif kind == 'SPACENAV':
+            devices = [SpacenavBackend(socket_path=spacenav_socket)]
+        elif kind == 'HIDRAW':
+            devices = [HidrawBackend(hidraw_path, combined=hidraw_combined)]
+        elif kind == 'EVDEV':
+            devices = [EvdevBackend(evdev_path)]
+        elif kind == 'SHARED':
+            devices = [SharedMemoryBackend(broker_name)]
+        elif kind == 'UDP':
+            devices = [UdpBackend(udp_host, udp_port, mode=udp_mode)]
+        else:
+            devices = [SpaceControllerDevice(app_name="Blender", library_path=library_path)]
+        try:
+            if record_path:
+                devices[0] = RecordingBackend(devices[0], record_path, append=record_append)
+            devices[0].connect()
+        except Exception:
+            # Each retry would otherwise leak the devices opened so far
+            # (open_all() and SpaceControllerDevice connect on construction).
+            for device in reversed(devices):
+                device.close()
+            raise
+        return devices
+
+    return open_backends
+
+
+def _make_backend_probe():
+    """Return a function counting attached devices without opening one, or None.
+
+    Used by the hot-plug watcher while no device is open; like
+    _make_backend_opener() it runs on the main thread, the function it
+    returns on the watcher thread. Sources without a cheap presence check
+    return None and rely on the connector's retries.
+    """
+    prefs = get_prefs()
+    kind = prefs.backend
+    if kind == 'SPACECONTROL':
+        library_path = bpy.path.abspath(prefs.library_path) if prefs.library_path else None
+        return lambda: SpaceControllerDevice.probe_device_count(library_path=library_path)
+    if kind == 'HIDRAW':
+        path = bpy.path.abspath(prefs.hidraw_path) if prefs.hidraw_path else DEFAULT_HIDRAW_PATH
+    elif kind == 'EVDEV':
+        path = bpy.path.abspath(prefs.evdev_path) if prefs.evdev_path else DEFAULT_EVDEV_PATH
+    elif kind == 'SPACENAV':
+        path = prefs.spacenav_socket or DEFAULT_SOCKET_PATH
+    else:
+        return None
+    return lambda: int(os.path.exists(path))
+
+
+def _start_reader() -> None:
+    """Start the background reader thread for the current device."""
+    global _reader
+    _reader = DeviceReaderThread(_device, SampleRingBuffer(_READER_CAPACITY))
+    _reader.start()
+
+
+def _stop_reader() -> bool:
+    """Stop the background reader thread (if any).
+
+    Returns False if the thread is still stuck in a device call; `_reader`
+    is kept then, so _close_device() can hand the device over to it.
+    """
+    global _reader
+    if _reader is not None:
+        if not _reader.stop():
+            return False
+        _reader = None
+    return True
+
+
+def _close_device() -> None:
+    """Stop the reader thread and disconnect the device (if any)."""
+    global _device, _reader, _last_sample_time, _last_tick_time
+    # The watcher may be probing the device itself: stop that first.
+    _hotplug.set_probe(None)
+    busy_reader = None if _stop_reader() else _reader
+    _reader = None
+    _last_sample_time = 0.0
+    _last_tick_time = 0.0
+    # Extra devices share the first device's connection: close them first.
+    for extra in _extra_devices.backends:
+        extra.close()
+    _extra_devices.clear()
+    if _device is not None:
+        if busy_reader is not None and busy_reader.close_on_exit(_device):
+            # Disconnecting under an in-flight driver call is unsafe: the
+            # reader closes the device when the call returns, and no new
+            # connection is opened before that.
+            print("SpaceController: device busy, closing it in the background.")
+            _connector.wait_for(busy_reader)
+        else:
+            try:
+                _device.close()
+            except Exception:
+                pass
+        _device = None
+    # Watch for the device to come back.
+    _hotplug.set_probe(_make_backend_probe() if _addon_alive else None)
+
+
+def _record_startup_timings() -> None:
+    """Collect how long opening the device took, per phase."""
+    global _register_time
+    _startup_timings.clear()
+    _startup_timings.update(_device.startup_timings)
+    _startup_timings["open (worker)"] = _connector.last_open_time
+    if _register_time:
+        # Only the first open after registering measures the startup path.
+        _startup_timings["register to ready"] = time.perf_counter() - _register_time
+        _register_time = 0.0
+    phases = ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in _startup_timings.items())
+    print(f"SpaceController: device opened ({phases}).")
+
+
 def _spacecontroller_timer():
     """Timer callback that polls the device and updates the view.
 
     This runs in the main thread but is *not* a modal operator,
     so it doesn't capture Blender input or block other tools.
     """
-    global _device, _enabled, _addon_alive
+    global _device, _addon_alive, _last_sample_time, _last_tick_time, _tick_scale, _extra_motion
+    global _startup_pending, _recorded_path
 
     # If addon is being unregistered, shut down the timer.
     if not _addon_alive:
-        if _device is not None:
-            try:
-                _device.close()
-            except Exception:
-                pass
-            _device = None
+        _close_device()
         return None  # stop timer
 
+    # register() runs while bpy.data is restricted, so the device paths can't
+    # be resolved there: the first tick starts opening and probing instead.
+    if _startup_pending:
+        _startup_pending = False
+        _connector.poll(_make_backend_opener)
+        _hotplug.set_probe(_make_backend_probe())
+
     # If user disabled the controller, just sleep.
     if not _enabled:
         return 0.5  # check again later
 
     # Ensure we have a 3D view to control.
-    area, region, space = _find_first_view3d()
+    area, region, space = _view_target.get()
     if area is None:
         # No 3D view visible yet: try again later.
         return 0.5
 
-    # Open device if needed.
+    # The hot-plug watcher saw the device count change: reconnect right away
+    # instead of waiting for a read error or the end of a backoff.
+    if _hotplug.changed:
+        _hotplug.consume()
+        if _device is not None:
+            print("SpaceController: devices changed, reconnecting.")
+            _connector.report_lost(RuntimeError("device count changed"))
+            _close_device()
+        _connector.reset()
+
+    # Open device if needed: the connector opens it on a worker thread and
+    # retries with backoff, so a missing or slow device never blocks here.
     if _device is None:
+        devices = _connector.poll(_make_backend_opener)
+        if devices is None:
+            return 0.1
+        _device = devices[0]
+        _rate_estimator.reset()
+        _poll_backoff.reset()
+        for extra in devices[1:]:
+            _extra_devices.add_route(extra, _apply_extra_device_batch)
+        _record_startup_timings()
+        _hotplug.set_probe(_device.device_count)
+        if isinstance(_device, RecordingBackend):
+            _recorded_path = _device.path
+
+    # Start / stop the background reader to match the preference.
+    use_reader = _prefs.use_reader_thread
+    if use_reader and _reader is None:
+        _start_reader()
+    elif not use_reader and _reader is not None and not _stop_reader():
+        # The reader is stuck in a device call, so the device can't be
+        # polled inline either: let the reader close it and reconnect.
+        _connector.report_lost(RuntimeError("reader thread did not stop"))
+        _close_device()
+        return 0.1
+
+    if _reader is not None:
+        # Drain everything the reader buffered since the last tick.
+        if _reader.error is not None:
+            print(f"SpaceController: error reading device: {_reader.error}")
+            _connector.report_lost(_reader.error)
+            _close_device()
+            return 0.1
+
+        _reader.ring.drain_into(_batch)
+    else:
+        # Drain the device inline. IMPORTANT: this must be *non-blocking*.
         try:
-            _device = SpaceControllerDevice(app_name="Blender")
-            print("SpaceController: device opened.")
+            _device.read_states(_batch, _MAX_SAMPLES_PER_TICK)
         except Exception as exc:
-            print(f"SpaceController: failed to open device: {exc}")
-            # Disable so we don't spam errors.
-            _enabled = False
-            return None
-
-    # Poll device. IMPORTANT: this must be *non-blocking* or have a tiny timeout.
-    try:
-        state = _device.read_state()
-    except Exception as exc:
-        print(f"SpaceController: error reading device: {exc}")
-        # On error, close device and stop.
+            print(f"SpaceController: error reading device: {exc}")
+            # On error, close the device and let the connector reconnect.
+            _connector.report_lost(exc)
+            _close_device()
+            return 0.1
+
+    now = time.perf_counter()
+    elapsed = now - _last_tick_time if _last_tick_time > 0.0 else _REFERENCE_DT
+    _tick_scale = (elapsed if elapsed < _MAX_SAMPLE_DT else _MAX_SAMPLE_DT) / _REFERENCE_DT
+
+    # Devices beyond the first are polled inline, in the same tick.
+    _extra_motion = False
+    if len(_extra_devices):
         try:
-            _device.close()
-        except Exception:
-            pass
-        _device = None
-        _enabled = False
-        return None
-
-    if state is not None:
-        _apply_state_to_area(area, state)
-
-    # Schedule next poll: 0.01s ~ 100 Hz, adjust if needed.
-    return 0.01
+            _extra_devices.poll(area, _MAX_SAMPLES_PER_TICK)
+        except Exception as exc:
+            print(f"SpaceController: error reading device: {exc}")
+            _connector.report_lost(exc)
+            _close_device()
+            return 0.1
+
+    # Integrate every sample since the last tick in one pass.
+    moving = _extra_motion
+    if len(_batch) > 0 or _extra_motion:
+        _last_tick_time = now
+    if len(_batch) > 0:
+        # Response curves are non-linear: shape each sample before summing.
+        if _prefs.response_curves is not None:
+            _prefs.response_curves.apply_batch(_batch)
+        if _prefs.time_based_motion:
+            _last_sample_time = _batch.integrate_into(
+                _tick_state, _last_sample_time, _REFERENCE_DT, _MAX_SAMPLE_DT,
+            )
+        else:
+            _batch.mean_into(_tick_state, _tick_scale)
+            _last_sample_time = _tick_state.timestamp
+        if _tick_state.has_motion():
+            moving = True
+            _apply_state_to_area(area, _tick_state)
+
+    # Schedule next poll: at the measured device rate (or 0.01s ~ 100 Hz)
+    # while moving, slower while idle.
+    if _prefs.adaptive_poll_rate:
+        _poll_backoff.active_interval = _rate_estimator.observe(
+            _batch.timestamps, len(_batch), now,
+            _prefs.min_poll_interval, _prefs.max_poll_interval,
+        )
+    else:
+        _poll_backoff.active_interval = _ACTIVE_INTERVAL
+    return _poll_backoff.next_interval(moving)
 
 
 # ---------------------------------------------------------------------------
@@ -261,6 +988,9 @@ class SPACECONTROLLER_OT_toggle(Operator):
     def execute(self, _context):
         global _enabled
         _enabled = not _enabled
+        if _enabled:
+            # Don't make the user wait out a long backoff after re-enabling.
+            _connector.reset()
         self.report(
             {'INFO'},
             f"SpaceController {'enabled' if _enabled else 'disabled'}."
@@ -268,6 +998,58 @@ class SPACECONTROLLER_OT_toggle(Operator):
         return {'FINISHED'}
 
 
+def _broker_running() -> bool:
+    return _broker_process is not None and _broker_process.poll() is None
+
+
+def _stop_broker() -> None:
+    """Shut down the broker started from this session (if any), releasing its device."""
+    global _broker_process
+    process, _broker_process = _broker_process, None
+    if process is not None:
+        stop_broker(process)
+
+
+class SPACECONTROLLER_OT_start_broker(Operator):
+    """Start a broker process that owns the device and shares its samples."""
+    bl_idname = "spacecontroller.start_broker"
+    bl_label = "Start Broker"
+
+    def execute(self, _context):
+        global _broker_process
+        if _broker_running():
+            self.report({'INFO'}, "SpaceController broker is already running.")
+            return {'CANCELLED'}
+        _stop_broker()   # reap one that exited on its own
+        prefs = get_prefs()
+        args = ["--name", prefs.broker_name or DEFAULT_BROKER_NAME]
+        if prefs.library_path:
+            args += ["--library-path", bpy.path.abspath(prefs.library_path)]
+        try:
+            _broker_process = launch_broker(args)
+        except OSError as exc:
+            self.report({'ERROR'}, f"Could not start the broker: {exc}")
+            return {'CANCELLED'}
+        # The broker needs a moment to come up; connect without waiting out a backoff.
+        _connector.reset()
+        self.report({'INFO'}, "SpaceController broker started.")
+        return {'FINISHED'}
+
+
+class SPACECONTROLLER_OT_stop_broker(Operator):
+    """Stop the broker process started from this Blender session."""
+    bl_idname = "spacecontroller.stop_broker"
+    bl_label = "Stop Broker"
+
+    def execute(self, _context):
+        if _broker_process is None:
+            self.report({'INFO'}, "No SpaceController broker was started from here.")
+            return {'CANCELLED'}
+        _stop_broker()
+        self.report({'INFO'}, "SpaceController broker stopped.")
+        return {'FINISHED'}
+
+
 class VIEW3D_PT_spacecontroller_panel(Panel):
     """Panel in the 3D View's N-panel."""
     bl_label = "SpaceController"
@@ -284,6 +1066,28 @@ class VIEW3D_PT_spacecontroller_panel(Panel):
         icon = 'CHECKMARK' if _enabled else 'CANCEL'
         row = col.row(align=True)
         row.label(text=f"Status: {status}", icon=icon)
+        if _enabled and _device is None:
+            if _connector.state == 'BACKOFF':
+                col.label(text=f"Device: retrying in {_connector.retry_in():.0f} s")
+            else:
+                col.label(text="Device: connecting...")
+        if _connector.failures or _connector.reconnects:
+            col.label(
+                text=f"Reconnects: {_connector.reconnects}  Failures: {_connector.failures}"
+            )
+        if _hotplug.count is not None:
+            col.label(text=f"Devices attached: {_hotplug.count}")
+        if _prefs.adaptive_poll_rate and _rate_estimator.rate > 0.0:
+            col.label(text=(
+                f"Device rate: {_rate_estimator.rate:.0f} Hz "
+                f"(±{_rate_estimator.error * 100:.1f} %)"
+            ))
+            col.label(text=f"Polling at: {1.0 / _poll_backoff.interval:.0f} Hz")
+        if _startup_timings:
+            box = col.box()
+            box.label(text="Device startup:")
+            for name, seconds in _startup_timings.items():
+                box.label(text=f"{name}: {seconds * 1000:.1f} ms")
 
         # Toggle button
         col.operator(
@@ -303,34 +1107,63 @@ class VIEW3D_PT_spacecontroller_panel(Panel):
 classes = (
     SpaceControllerPreferences,
     SPACECONTROLLER_OT_toggle,
+    SPACECONTROLLER_OT_start_broker,
+    SPACECONTROLLER_OT_stop_broker,
     VIEW3D_PT_spacecontroller_panel,
 )
 
 
 def register():
-    global _addon_alive, _enabled, _device
+    global _addon_alive, _enabled, _device, _connector, _prefs, _register_time, _startup_pending
+    global _recorded_path
     _addon_alive = True
     _enabled = True
     _device = None
+    _connector = ReconnectController()
 
     for cls in classes:
         bpy.utils.register_class(cls)
 
+    _prefs = PrefsSnapshot.from_prefs(get_prefs())
+
+    _view_target.invalidate()
+    _subscribe_screen_changes()
+    bpy.app.handlers.load_post.append(_on_load_post)
+
+    # The first tick starts opening the device on the connector's worker
+    # thread; later ticks pick it up once it is ready.
+    _register_time = time.perf_counter()
+    _startup_timings.clear()
+    _startup_pending = True
+    _recorded_path = ""
+
+    _hotplug.set_interval(get_prefs().hotplug_interval)
+    _hotplug.set_probe(None)
+    _hotplug.start()
+
+    # Blender may exit without unregistering add-ons; don't leave the
+    # broker holding the device behind.
+    atexit.register(_stop_broker)
+
     # Start background timer once.
-    bpy.app.timers.register(_spacecontroller_timer, first_interval=1.0)
+    bpy.app.timers.register(_spacecontroller_timer, first_interval=0.0)
 
 
 def unregister():
-    global _addon_alive, _device
+    global _addon_alive
     _addon_alive = False
 
     # Timer will see _addon_alive == False and clean up device
-    if _device is not None:
-        try:
-            _device.close()
-        except Exception:
-            pass
-        _device = None
+    _connector.shutdown()
+    _hotplug.stop()
+    _close_device()
+    _stop_broker()
+    atexit.unregister(_stop_broker)
+
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    _view_target.invalidate()
 
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
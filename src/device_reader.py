@@ -0,0 +1,202 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+Background reader thread for SpaceController devices.
+
+The reader polls the device on its own thread and pushes samples into a
+fixed-size ring buffer. Blender's timer drains the buffer on the main thread
+without blocking, so a slow driver call never stalls the UI and samples that
+arrive between timer ticks are kept.
+"""
+
+from typing import Optional
+
+import threading
+
+from .spacecontroller_device import SpaceControllerBatch, SpaceControllerState
+
+
+class SampleRingBuffer:
+    """
+    Fixed-capacity, lock-protected ring buffer of SpaceControllerState.
+
+    All slots are preallocated; push() and drain_into() copy field values
+    instead of passing state objects around. When the buffer is full the
+    oldest sample is overwritten.
+
+    Counters:
+    - pushed:    samples written in total
+    - dropped:   samples overwritten before the consumer drained them
+    - overflows: number of times the buffer ran full (one per episode)
+    """
+
+    def __init__(self, capacity: int = 256):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._slots = [SpaceControllerState() for _ in range(capacity)]
+        self._capacity = capacity
+        self._head = 0   # next slot to read
+        self._count = 0
+        self._lock = threading.Lock()
+        self._overflowing = False
+        self.pushed = 0
+        self.dropped = 0
+        self.overflows = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._count
+
+    def push(self, state: SpaceControllerState) -> None:
+        """Copy `state` into the buffer (producer side, may block briefly)."""
+        with self._lock:
+            capacity = self._capacity
+            if self._count == capacity:
+                # Full: overwrite the oldest sample.
+                slot = self._slots[self._head]
+                self._head = (self._head + 1) % capacity
+                self.dropped += 1
+                if not self._overflowing:
+                    self._overflowing = True
+                    self.overflows += 1
+            else:
+                slot = self._slots[(self._head + self._count) % capacity]
+                self._count += 1
+
+            slot.tx = state.tx
+            slot.ty = state.ty
+            slot.tz = state.tz
+            slot.rx = state.rx
+            slot.ry = state.ry
+            slot.rz = state.rz
+            slot.event = state.event
+            slot.timestamp = state.timestamp
+            self.pushed += 1
+
+    def drain_into(self, batch: SpaceControllerBatch, max_samples: Optional[int] = None) -> int:
+        """
+        Move pending samples into `batch` (cleared first), oldest first.
+
+        Never blocks: if the producer currently holds the lock, nothing is
+        drained and 0 is returned (the samples are picked up next time).
+
+        Returns:
+            Number of samples written to `batch`.
+        """
+        batch.clear()
+        if not self._lock.acquire(blocking=False):
+            return 0
+        try:
+            n = self._count if max_samples is None else min(self._count, max_samples)
+            capacity = self._capacity
+            head = self._head
+            append = batch.append
+            for i in range(n):
+                append(self._slots[(head + i) % capacity])
+            self._head = (head + n) % capacity
+            self._count -= n
+            if self._count < capacity:
+                self._overflowing = False
+            return n
+        finally:
+            self._lock.release()
+
+    def clear(self) -> None:
+        """Discard all pending samples (counters are kept)."""
+        with self._lock:
+            self._head = 0
+            self._count = 0
+            self._overflowing = False
+
+
+class DeviceReaderThread(threading.Thread):
+    """
+    Daemon thread that polls a device and pushes new samples into a ring buffer.
+
+    The device must not be used from any other thread while the reader runs.
+    If the device raises, the exception is stored in `error` and the thread
+    exits; the owner is expected to check it and close the device.
+
+    A device call can stall (that is what the thread is for), so stop() may
+    return while the thread is still inside one. The owner must not close the
+    device then: close_on_exit() hands it to the thread, which closes it once
+    the call returns.
+    """
+
+    def __init__(self, device, ring: SampleRingBuffer, idle_sleep: float = 0.001):
+        super().__init__(name="SpaceControllerReader", daemon=True)
+        self._device = device
+        self._ring = ring
+        self._idle_sleep = idle_sleep
+        self._stop_event = threading.Event()
+        self._exit_lock = threading.Lock()
+        self._exited = False
+        self._close_on_exit = None
+        self.error: Optional[BaseException] = None
+
+    @property
+    def ring(self) -> SampleRingBuffer:
+        return self._ring
+
+    def run(self) -> None:
+        scratch = SpaceControllerState()
+        read_into = self._device.read_state_into
+        push = self._ring.push
+        stop_event = self._stop_event
+        try:
+            while not stop_event.is_set():
+                if read_into(scratch):
+                    push(scratch)
+                else:
+                    # No new data: sleep briefly instead of spinning.
+                    stop_event.wait(self._idle_sleep)
+        except Exception as exc:
+            self.error = exc
+        finally:
+            with self._exit_lock:
+                self._exited = True
+                device = self._close_on_exit
+                self._close_on_exit = None
+            if device is not None:
+                try:
+                    device.close()
+                except Exception:
+                    pass
+
+    def stop(self, timeout: float = 0.5) -> bool:
+        """
+        Ask the thread to exit and wait (bounded) for it to finish.
+
+        Returns:
+            True if the thread has finished, False if it is still inside a
+            device call.
+        """
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+        return not self.is_alive()
+
+    def close_on_exit(self, device) -> bool:
+        """
+        Have the thread close `device` when it exits.
+
+        Returns:
+            False if the thread has already exited; the caller closes the
+            device itself then.
+        """
+        with self._exit_lock:
+            if self._exited:
+                return False
+            self._close_on_exit = device
+            return True
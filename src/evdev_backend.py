@@ -0,0 +1,238 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+Linux evdev input source (`/dev/input/event*`).
+
+Reads `struct input_event` records (timeval, type, code, value) in batches
+through FdReader and folds them into one SpaceControllerState per
+SYN_REPORT frame:
+
+- EV_ABS X/Y/Z/RX/RY/RZ set an axis (normalised to +-full_scale using the
+  range the kernel reports for the axis) and keep it until it changes;
+- EV_REL X/Y/Z/RX/RY/RZ add to an axis for the current frame only;
+- EV_KEY buttons set or clear a bit of the button mask in `event`;
+- SYN_DROPPED discards events up to the next SYN_REPORT, as the kernel
+  documentation requires.
+"""
+
+from typing import Callable
+
+import struct
+import time
+
+from .fd_reader import FdReader
+from .spacecontroller_device import BUTTON_BITS, DeviceBackend, SpaceControllerState
+
+try:
+    import fcntl
+except ImportError:  # not on Windows
+    fcntl = None
+
+DEFAULT_EVDEV_PATH = "/dev/input/event0"
+
+INPUT_EVENT = struct.Struct("llHHi")   # struct input_event, native layout
+EV_SYN = 0x00
+EV_KEY = 0x01
+EV_REL = 0x02
+EV_ABS = 0x03
+SYN_REPORT = 0
+SYN_DROPPED = 3
+BTN_MISC = 0x100       # BTN_0 ...
+BTN_JOYSTICK = 0x120   # BTN_TRIGGER ...
+
+_AXIS_COUNT = 6        # X, Y, Z, RX, RY, RZ: codes 0-5 for both ABS and REL
+_ABSINFO = struct.Struct("6i")  # value, minimum, maximum, fuzz, flat, resolution
+
+
+def _eviocgabs(axis: int) -> int:
+    """ioctl request number of EVIOCGABS(axis)."""
+    return (2 << 30) | (_ABSINFO.size << 16) | (ord("E") << 8) | (0x40 + axis)
+
+
+def _button_bit(code: int) -> int:
+    """Bit of the button mask for a key code, or -1 for other keys."""
+    if BTN_JOYSTICK <= code < BTN_JOYSTICK + BUTTON_BITS:
+        return code - BTN_JOYSTICK
+    if BTN_MISC <= code < BTN_JOYSTICK:
+        return code - BTN_MISC
+    return -1
+
+
+class EvdevBackend(DeviceBackend):
+    """
+    Device read from an evdev node or a file of recorded input_event structs.
+
+    Args:
+        source:      path (or open file descriptor) of the event device.
+        full_scale:  device units an absolute axis at its limit maps to.
+        repeat_held: absolute axes only report changes, so a stick held at
+                     a constant deflection goes quiet. With this enabled, a
+                     poll without new frames repeats the held position once
+                     (timestamped with `clock`), so the view keeps moving.
+        max_events:  buffer size in events.
+        clock:       time source matching the event timestamps
+                     (evdev uses CLOCK_REALTIME unless told otherwise).
+
+    Samples are timestamped with the time of their SYN_REPORT.
+    """
+
+    def __init__(
+        self,
+        source: str | int = DEFAULT_EVDEV_PATH,
+        full_scale: float = 350.0,
+        repeat_held: bool = True,
+        max_events: int = 256,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__()
+        self._reader = FdReader(source, buffer_size=INPUT_EVENT.size * max_events)
+        self._full_scale = full_scale
+        self._repeat_held = repeat_held
+        self._clock = clock
+
+        self._center = [0.0] * _AXIS_COUNT
+        self._flat = [0.0] * _AXIS_COUNT   # raw dead band around the center
+        self._scale = [1.0] * _AXIS_COUNT
+        self._abs = [0.0] * _AXIS_COUNT    # absolute axes, persistent
+        self._rel = [0.0] * _AXIS_COUNT    # relative axes, current frame only
+        self._buttons = 0
+        self._dirty = False       # the current frame has changes
+        self._dropping = False    # discarding events after SYN_DROPPED
+        self._returned = False    # the previous poll returned a sample
+        self.dropped = 0          # SYN_DROPPED frames
+
+    @property
+    def reads(self) -> int:
+        return self._reader.reads
+
+    def connect(self) -> None:
+        if self._reader.is_open:
+            return
+        self._reader.open()
+        self._abs = [0.0] * _AXIS_COUNT
+        self._rel = [0.0] * _AXIS_COUNT
+        self._buttons = 0
+        self._dirty = self._dropping = self._returned = False
+        self._query_axis_ranges()
+
+    def read_state_into(self, state: SpaceControllerState) -> bool:
+        reader = self._reader
+        if not reader.is_open:
+            return False
+
+        buffer = reader.buffer
+        size = INPUT_EVENT.size
+        while True:
+            if reader.available() < size:
+                if reader.fill():
+                    continue
+                return self._repeat_held_state(state)
+
+            sec, usec, kind, code, value = INPUT_EVENT.unpack_from(buffer, reader.start)
+            reader.consume(size)
+
+            if kind == EV_SYN:
+                if code == SYN_REPORT:
+                    if self._dropping:
+                        self._dropping = False
+                        self._dirty = False
+                        self._clear_rel()
+                    elif self._dirty:
+                        self._emit(state, sec + usec * 1e-6)
+                        return True
+                elif code == SYN_DROPPED:
+                    self._dropping = True
+                    self.dropped += 1
+                continue
+            if self._dropping:
+                continue
+
+            if kind == EV_ABS:
+                if code < _AXIS_COUNT:
+                    self._abs[code] = self._normalize(code, value)
+                    self._dirty = True
+            elif kind == EV_REL:
+                if code < _AXIS_COUNT:
+                    self._rel[code] += value
+                    self._dirty = True
+            elif kind == EV_KEY:
+                bit = _button_bit(code)
+                if bit >= 0:
+                    if value:   # 1 = press, 2 = autorepeat
+                        self._buttons |= 1 << bit
+                    else:
+                        self._buttons &= ~(1 << bit)
+                    self._dirty = True
+
+    def close(self) -> None:
+        self._reader.close()
+
+    # ------------------------------------------------------------------
+    # Frame handling
+    # ------------------------------------------------------------------
+    def _emit(self, state: SpaceControllerState, timestamp: float) -> None:
+        absolute = self._abs
+        rel = self._rel
+        state.tx = absolute[0] + rel[0]
+        state.ty = absolute[1] + rel[1]
+        state.tz = absolute[2] + rel[2]
+        state.rx = absolute[3] + rel[3]
+        state.ry = absolute[4] + rel[4]
+        state.rz = absolute[5] + rel[5]
+        state.event = self._buttons
+        state.timestamp = timestamp
+        self._clear_rel()
+        self._dirty = False
+        self._returned = True
+
+    def _repeat_held_state(self, state: SpaceControllerState) -> bool:
+        """No new frame: report the held absolute position once per drain."""
+        if self._returned or not self._repeat_held or not any(self._abs):
+            self._returned = False
+            return False
+        state.tx, state.ty, state.tz, state.rx, state.ry, state.rz = self._abs
+        state.event = self._buttons
+        state.timestamp = self._clock()
+        self._returned = True
+        return True
+
+    def _clear_rel(self) -> None:
+        rel = self._rel
+        for i in range(_AXIS_COUNT):
+            rel[i] = 0.0
+
+    def _normalize(self, axis: int, value: int) -> float:
+        offset = value - self._center[axis]
+        if -self._flat[axis] <= offset <= self._flat[axis]:
+            return 0.0
+        return offset * self._scale[axis]
+
+    def _query_axis_ranges(self) -> None:
+        """Read the absolute axis ranges (EVIOCGABS); identity if unavailable."""
+        self._center = [0.0] * _AXIS_COUNT
+        self._flat = [0.0] * _AXIS_COUNT
+        self._scale = [1.0] * _AXIS_COUNT
+        if fcntl is None:
+            return
+        info = bytearray(_ABSINFO.size)
+        for axis in range(_AXIS_COUNT):
+            try:
+                fcntl.ioctl(self._reader.fileno(), _eviocgabs(axis), info)
+            except OSError:
+                continue    # not an evdev node, or the device lacks this axis
+            value, minimum, maximum, _fuzz, flat, _resolution = _ABSINFO.unpack_from(info)
+            if maximum <= minimum:
+                continue
+            self._center[axis] = (minimum + maximum) / 2.0
+            # At least half a step, so an odd-sized range still rests at 0.
+            self._flat[axis] = max(float(flat), 0.5)
+            self._scale[axis] = self._full_scale / ((maximum - minimum) / 2.0)
+            self._abs[axis] = self._normalize(axis, value)
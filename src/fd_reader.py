@@ -0,0 +1,129 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+Batched, non-blocking reads from a file descriptor.
+
+Shared by the backends that read device nodes directly. One read() fills a
+reused buffer with as many records as the source hands out; the backend
+decodes them in place with struct.unpack_from() and consume()s them. A
+trailing partial record stays in the buffer until the next fill().
+"""
+
+from typing import Optional
+
+import io
+import os
+
+
+class FdReader:
+    """
+    Reader for a device node, FIFO or regular file.
+
+    Args:
+        source:      path to open, or an already open file descriptor (which
+                     is made non-blocking but not closed by close()).
+        buffer_size: bytes requested per read().
+
+    End of file is not an error: a regular file or a FIFO without writers
+    simply has no new data (`at_eof` is set). Read errors, e.g. a device
+    that was unplugged, raise RuntimeError.
+    """
+
+    def __init__(self, source: str | int, buffer_size: int = 4096):
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        self._source = source
+        self._file: Optional[io.FileIO] = None
+        self.buffer = bytearray(buffer_size)
+        self._view = memoryview(self.buffer)
+        self.start = 0      # offset of the first unconsumed byte
+        self.end = 0        # offset behind the last byte read
+        self.at_eof = False
+        self.reads = 0      # read() calls that returned data
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def fileno(self) -> int:
+        if self._file is None:
+            raise ValueError("reader is not open")
+        return self._file.fileno()
+
+    def open(self) -> None:
+        if self._file is not None:
+            return
+        source = self._source
+        nonblock = getattr(os, "O_NONBLOCK", 0)
+        try:
+            if isinstance(source, int):
+                fd = source
+                closefd = False
+                if nonblock:
+                    os.set_blocking(fd, False)
+            else:
+                fd = os.open(source, os.O_RDONLY | nonblock)
+                closefd = True
+        except OSError as exc:
+            raise RuntimeError(f"Could not open {source}: {exc}") from exc
+        self._file = io.FileIO(fd, "rb", closefd=closefd)
+        self.start = self.end = 0
+        self.at_eof = False
+
+    def available(self) -> int:
+        """Number of buffered, unconsumed bytes."""
+        return self.end - self.start
+
+    def consume(self, count: int) -> None:
+        self.start += count
+
+    def fill(self) -> int:
+        """
+        Read once into the free part of the buffer.
+
+        Returns:
+            Number of bytes read; 0 if no data is pending (or at end of file).
+        """
+        if self._file is None:
+            return 0
+
+        # Move the unconsumed remainder (at most a partial record) to the front.
+        remainder = self.end - self.start
+        if remainder and self.start:
+            self._view[:remainder] = self._view[self.start:self.end]
+        self.start = 0
+        self.end = remainder
+        if remainder == len(self.buffer):
+            return 0    # buffer full of one oversized record; caller must consume
+
+        try:
+            count = self._file.readinto(self._view[remainder:])
+        except OSError as exc:
+            raise RuntimeError(f"Error reading {self._source}: {exc}") from exc
+        if count is None:
+            return 0    # would block: nothing pending
+        if count == 0:
+            self.at_eof = True
+            return 0
+
+        self.at_eof = False
+        self.reads += 1
+        self.end += count
+        return count
+
+    def close(self) -> None:
+        file = self._file
+        self._file = None
+        if file is not None:
+            try:
+                file.close()
+            except OSError:
+                pass
@@ -0,0 +1,154 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+Raw HID input source (`/dev/hidraw*`).
+
+Decodes the 6-DOF report layout used by 3D mice, without any driver:
+
+    report 1:  translation x, y, z    (3 x int16, little endian)
+               or all six axes        (6 x int16, "combined" devices)
+    report 2:  rotation rx, ry, rz    (3 x int16)
+    report 3:  button bitmask         (`button_bytes` bytes)
+
+Reports are read in batches through FdReader and decoded in place with
+struct.unpack_from(). A hidraw node returns one report per read(); a FIFO or
+a file of recorded report bytes returns as many as fit into the buffer.
+"""
+
+from typing import Optional
+
+import struct
+
+from .fd_reader import FdReader
+from .spacecontroller_device import BUTTON_MASK, DeviceBackend, SpaceControllerState
+
+DEFAULT_HIDRAW_PATH = "/dev/hidraw0"
+
+REPORT_TRANSLATION = 1
+REPORT_ROTATION = 2
+REPORT_BUTTONS = 3
+
+_AXES3 = struct.Struct("<3h")
+_AXES6 = struct.Struct("<6h")
+_BUTTON_FORMATS = {1: "<B", 2: "<H", 4: "<I"}
+
+
+class HidrawBackend(DeviceBackend):
+    """
+    Device read from a hidraw node, FIFO or recording.
+
+    Args:
+        source:       path (or open file descriptor) to read reports from.
+        combined:     report 1 carries all six axes (12 data bytes).
+        button_bytes: size of the button report payload.
+        max_reports:  buffer size in reports.
+
+    A sample is produced for every report that completes the axis state:
+    report 2 (split devices), report 1 (combined devices) and report 3
+    (buttons, as a zero-motion sample). `event` carries the button mask.
+    HID has no timestamps, so samples have timestamp 0.0 ("unknown").
+
+    Reports with an unknown id cannot be resynchronised in a byte stream;
+    the rest of the buffered data is discarded and counted in `skipped`.
+    """
+
+    def __init__(
+        self,
+        source: str | int = DEFAULT_HIDRAW_PATH,
+        combined: bool = False,
+        button_bytes: int = 2,
+        max_reports: int = 64,
+    ):
+        super().__init__()
+        if button_bytes not in _BUTTON_FORMATS:
+            raise ValueError("button_bytes must be 1, 2 or 4")
+        self._combined = combined
+        self._button_mask = struct.Struct(_BUTTON_FORMATS[button_bytes])
+        self._translation_size = 1 + (_AXES6.size if combined else _AXES3.size)
+        self._rotation_size = 1 + _AXES3.size
+        self._buttons_size = 1 + button_bytes
+        largest = max(self._translation_size, self._rotation_size, self._buttons_size)
+        self._reader = FdReader(source, buffer_size=largest * max_reports)
+
+        self._translation = (0, 0, 0)
+        self._buttons = 0
+        self.skipped = 0    # bytes discarded after unknown report ids
+
+    @property
+    def reads(self) -> int:
+        return self._reader.reads
+
+    def connect(self) -> None:
+        if self._reader.is_open:
+            return
+        self._reader.open()
+        self._translation = (0, 0, 0)
+        self._buttons = 0
+
+    def read_state_into(self, state: SpaceControllerState) -> bool:
+        reader = self._reader
+        if not reader.is_open:
+            return False
+
+        buffer = reader.buffer
+        while True:
+            available = reader.available()
+            if available:
+                offset = reader.start
+                report_id = buffer[offset]
+                size = self._report_size(report_id)
+                if size is None:
+                    self.skipped += available
+                    reader.consume(available)
+                    continue
+                if size <= available:
+                    reader.consume(size)
+                    if self._decode(report_id, offset + 1, state):
+                        return True
+                    continue
+            if not reader.fill():
+                return False
+
+    def close(self) -> None:
+        self._reader.close()
+
+    # ------------------------------------------------------------------
+    # Report decoding
+    # ------------------------------------------------------------------
+    def _decode(self, report_id: int, offset: int, state: SpaceControllerState) -> bool:
+        """Decode one report payload; returns True if it completed a sample."""
+        buffer = self._reader.buffer
+        if report_id == REPORT_TRANSLATION:
+            if not self._combined:
+                self._translation = _AXES3.unpack_from(buffer, offset)
+                return False
+            (state.tx, state.ty, state.tz,
+             state.rx, state.ry, state.rz) = _AXES6.unpack_from(buffer, offset)
+        elif report_id == REPORT_ROTATION:
+            state.tx, state.ty, state.tz = self._translation
+            state.rx, state.ry, state.rz = _AXES3.unpack_from(buffer, offset)
+        else:
+            self._buttons = self._button_mask.unpack_from(buffer, offset)[0] & BUTTON_MASK
+            state.tx = state.ty = state.tz = 0.0
+            state.rx = state.ry = state.rz = 0.0
+
+        state.event = self._buttons
+        state.timestamp = 0.0
+        return True
+
+    def _report_size(self, report_id: int) -> Optional[int]:
+        if report_id == REPORT_TRANSLATION:
+            return self._translation_size
+        if report_id == REPORT_ROTATION:
+            return self._rotation_size
+        if report_id == REPORT_BUTTONS:
+            return self._buttons_size
+        return None
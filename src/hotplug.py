@@ -0,0 +1,107 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+Hot-plug detection.
+
+A background thread calls a probe (e.g. the device's scGetDevNum, or a
+check whether a device node exists) every few seconds and raises a flag
+when the reported device count changes. The Blender timer only reads that
+flag, so watching costs nothing per tick and never calls the driver from
+the UI thread.
+"""
+
+from typing import Callable, Optional
+
+import threading
+
+# Returns the number of attached devices, or None if it can't tell right now.
+Probe = Callable[[], Optional[int]]
+
+
+class HotplugWatcher:
+    """
+    Periodically probes the device count on a daemon thread.
+
+    - set_probe(probe): what to call; None pauses probing. Switching the
+      probe forgets the previous count, so the first result of a new probe
+      only sets the baseline.
+    - changed: set when a probe reports a different count than the one
+      before; the consumer clears it with consume().
+    - set_interval(seconds): time between probes; 0 pauses probing.
+
+    A probe that raises counts as "no devices" (error kept in last_error).
+    """
+
+    def __init__(self, interval: float = 2.0):
+        self.interval = interval
+        self._probe: Optional[Probe] = None
+        self._stop = False
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.count: Optional[int] = None    # last probed device count
+        self.changed = False
+        self.probes = 0
+        self.last_error: Optional[BaseException] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop = False
+        self._wake.clear()
+        self._thread = threading.Thread(target=self._run, name="SpaceControllerHotplug", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self._stop = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def set_interval(self, interval: float) -> None:
+        self.interval = interval
+        self._wake.set()   # don't sit out the previous (longer) interval
+
+    def set_probe(self, probe: Optional[Probe]) -> None:
+        self._probe = probe
+        self.count = None
+
+    def consume(self) -> bool:
+        """Return True once after the device count changed."""
+        if not self.changed:
+            return False
+        self.changed = False
+        return True
+
+    def _run(self) -> None:
+        while True:
+            interval = self.interval
+            # With probing paused, wait until set_interval() or stop().
+            self._wake.wait(interval if interval > 0 else None)
+            self._wake.clear()
+            if self._stop:
+                return
+            probe = self._probe
+            if probe is None or self.interval <= 0:
+                continue
+            try:
+                count = probe()
+            except Exception as exc:
+                self.last_error = exc
+                count = 0
+            self.probes += 1
+            if count is None or probe is not self._probe:
+                continue    # unknown, or the probe was switched meanwhile
+            previous = self.count
+            self.count = count
+            if previous is not None and count != previous:
+                self.changed = True
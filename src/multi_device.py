@@ -0,0 +1,75 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+Polling several input devices in one loop.
+
+Each device is bound to a consumer ("route"). DevicePoller.poll() drains
+every device into its own reusable batch and hands non-empty batches to the
+route's consumer together with a caller-supplied context (e.g. the target
+area), so all devices share one timer tick.
+"""
+
+from typing import Any, Callable, List
+
+from .spacecontroller_device import DeviceBackend, SpaceControllerBatch
+
+BatchConsumer = Callable[[SpaceControllerBatch, Any], None]
+
+
+class _Route:
+    __slots__ = ("backend", "consumer", "batch")
+
+    def __init__(self, backend: DeviceBackend, consumer: BatchConsumer):
+        self.backend = backend
+        self.consumer = consumer
+        self.batch = SpaceControllerBatch()
+
+
+class DevicePoller:
+    """Batched polling of several backends, each routed to its own consumer."""
+
+    def __init__(self):
+        self._routes: List[_Route] = []
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    @property
+    def backends(self) -> List[DeviceBackend]:
+        return [route.backend for route in self._routes]
+
+    def add_route(self, backend: DeviceBackend, consumer: BatchConsumer) -> None:
+        """Send every batch read from `backend` to `consumer`."""
+        self._routes.append(_Route(backend, consumer))
+
+    def clear(self) -> None:
+        """Forget all routes (backends are not closed)."""
+        self._routes.clear()
+
+    def poll(self, context: Any = None, max_samples: int = 64) -> int:
+        """
+        Drain every device once and pass each non-empty batch, plus `context`,
+        to its route's consumer.
+
+        Exceptions from a backend propagate; the caller decides whether to
+        close the devices.
+
+        Returns:
+            Total number of samples read.
+        """
+        total = 0
+        for route in self._routes:
+            batch = route.backend.read_states(route.batch, max_samples)
+            n = len(batch)
+            if n:
+                total += n
+                route.consumer(batch, context)
+        return total
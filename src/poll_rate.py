@@ -0,0 +1,191 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+Timer interval control for the device poller.
+"""
+
+import math
+
+
+class IdlePollBackoff:
+    """
+    Adaptive poll interval that backs off while the controller is idle.
+
+    After `grace_ticks` consecutive ticks without motion, the interval grows
+    by `ramp` per tick up to `idle_interval`. The first tick with motion snaps
+    it back to `active_interval`.
+    """
+
+    def __init__(
+        self,
+        active_interval: float = 0.01,
+        idle_interval: float = 0.1,
+        grace_ticks: int = 50,
+        ramp: float = 1.25,
+    ):
+        self.active_interval = active_interval
+        self.idle_interval = idle_interval
+        self.grace_ticks = grace_ticks
+        self.ramp = ramp
+        self.interval = active_interval
+        self._idle_ticks = 0
+
+    @property
+    def idle(self) -> bool:
+        """True once the grace period without motion has passed."""
+        return self._idle_ticks >= self.grace_ticks
+
+    def next_interval(self, moving: bool) -> float:
+        """Record one tick (with or without motion) and return the next interval."""
+        if moving:
+            self._idle_ticks = 0
+            self.interval = self.active_interval
+        else:
+            self._idle_ticks += 1
+            if self._idle_ticks >= self.grace_ticks:
+                interval = self.interval * self.ramp
+                self.interval = interval if interval < self.idle_interval else self.idle_interval
+        return self.interval
+
+    def reset(self) -> None:
+        """Back to full rate (e.g. after a reconnect)."""
+        self._idle_ticks = 0
+        self.interval = self.active_interval
+
+
+class SampleRateEstimator:
+    """
+    Measures the device sample rate and picks the poll interval matching it.
+
+    observe() is called once per tick with the samples read in that tick:
+
+    - `period` is an exponentially weighted average of the intervals between
+      consecutive device timestamps. Samples without timestamps (0.0) fall
+      back to the weighted wall-clock time per tick divided by the weighted
+      number of samples per tick. Gaps longer than `max_gap` (the device was
+      idle) are ignored.
+    - `hit_ratio` is the weighted share of ticks that found new data.
+
+    The chosen `interval` is the estimated period, clamped to the bounds.
+    A driver that only keeps its newest sample looks exactly as fast as the
+    poller: every tick finds data and the measured period equals the poll
+    interval. In that case the interval is shortened by `probe_step` per
+    tick until ticks start coming back empty, which reveals the real rate.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 0.01,
+        smoothing: float = 0.1,
+        max_gap: float = 0.25,
+        probe_step: float = 0.8,
+    ):
+        self.initial_interval = initial_interval
+        self.smoothing = smoothing
+        self.max_gap = max_gap
+        self.probe_step = probe_step
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all measurements (e.g. after a reconnect)."""
+        self.interval = self.initial_interval
+        self.period = 0.0       # estimated sample period (s), 0 = unknown yet
+        self.jitter = 0.0       # weighted standard deviation of the period (s)
+        self.hit_ratio = 0.0
+        self.samples = 0
+        self._variance = 0.0
+        self._last_timestamp = 0.0
+        self._last_tick = 0.0
+        self._timed = True
+        self._tick_samples = 0.0
+        self._tick_time = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Estimated device sample rate in Hz (0 = unknown)."""
+        return 1.0 / self.period if self.period > 0.0 else 0.0
+
+    @property
+    def error(self) -> float:
+        """Relative standard error of the rate estimate (0.01 = 1 %)."""
+        if self.period <= 0.0:
+            return 0.0
+        alpha = self.smoothing
+        return self.jitter * math.sqrt(alpha / (2.0 - alpha)) / self.period
+
+    def observe(self, timestamps, count: int, now: float,
+                min_interval: float, max_interval: float) -> float:
+        """
+        Record one tick and return the next poll interval.
+
+        Args:
+            timestamps:   device timestamps of the samples read this tick
+                          (e.g. SpaceControllerBatch.timestamps).
+            count:        number of samples read this tick.
+            now:          wall-clock time of the tick (time.perf_counter()).
+            min_interval: lower bound of the returned interval.
+            max_interval: upper bound of the returned interval.
+
+        Raises ValueError if min_interval > max_interval.
+        """
+        if min_interval > max_interval:
+            raise ValueError("min_interval must not exceed max_interval")
+        alpha = self.smoothing
+        self.hit_ratio += alpha * ((1.0 if count else 0.0) - self.hit_ratio)
+        if count:
+            self.samples += count
+            timed = False
+            previous = self._last_timestamp
+            for i in range(count):
+                timestamp = timestamps[i]
+                if timestamp <= 0.0:
+                    continue
+                if previous > 0.0:
+                    self._add_period(timestamp - previous)
+                previous = timestamp
+                timed = True
+            self._last_timestamp = previous
+            self._timed = timed
+
+        elapsed = now - self._last_tick
+        self._last_tick = now
+        if not self._timed and 0.0 < elapsed <= self.max_gap:
+            # Ratio of weighted sums: unbiased while polling faster than the
+            # device, where each sample shows up in exactly one tick.
+            self._tick_samples += alpha * (count - self._tick_samples)
+            self._tick_time += alpha * (elapsed - self._tick_time)
+            if count:
+                self._add_period(self._tick_time / self._tick_samples)
+
+        interval = self.interval
+        if self.period > 0.0:
+            if self.hit_ratio > 0.95 and abs(self.period - interval) < interval * 0.1:
+                interval *= self.probe_step
+            else:
+                interval = self.period
+        if interval < min_interval:
+            interval = min_interval
+        elif interval > max_interval:
+            interval = max_interval
+        self.interval = interval
+        return interval
+
+    def _add_period(self, dt: float) -> None:
+        if dt <= 0.0 or dt > self.max_gap:
+            return
+        if self.period <= 0.0:
+            self.period = dt
+            return
+        alpha = self.smoothing
+        diff = dt - self.period
+        self.period += alpha * diff
+        self._variance = (1.0 - alpha) * (self._variance + alpha * diff * diff)
+        self.jitter = math.sqrt(self._variance)
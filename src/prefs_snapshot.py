@@ -0,0 +1,145 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+Immutable copy of the add-on preferences read on the per-tick hot path.
+
+Reading an AddonPreferences property goes through bpy.context, the add-on
+dict and RNA on every access. The timer reads a PrefsSnapshot instead, which
+is rebuilt only when a preference changes (from the properties' `update=`
+callbacks), so the hot path reads plain slot attributes.
+"""
+
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from .view_math import (
+    DEVICE_AXES, VIEW_AXES, AxisMapping, ResponseCurves, build_response_table,
+)
+
+_DERIVED = ("axis_mapping", "response_curves")
+
+
+@lru_cache(maxsize=8)
+def _response_table(curve: str, deadzone: float, exponent: float,
+                    points: Tuple[Tuple[float, float], ...]):
+    # Cached: the snapshot is rebuilt on every preference change, but the
+    # 65,536-entry table only when the curve settings themselves change.
+    return build_response_table(curve, deadzone, exponent, points)
+
+
+def parse_curve_points(text: str) -> Tuple[Tuple[float, float], ...]:
+    """Parse "x:y, x:y, ..." (values in [0, 1]); invalid text gives no points."""
+    points = []
+    try:
+        for item in text.replace(";", ",").split(","):
+            if item.strip():
+                x, y = item.split(":")
+                points.append((min(max(float(x), 0.0), 1.0), min(max(float(y), 0.0), 1.0)))
+    except ValueError:
+        return ()
+    return tuple(points)
+
+
+def parse_axis_coupling(text: str) -> Optional[Tuple[Tuple[float, ...], ...]]:
+    """
+    Parse "device>view:factor, ..." (e.g. "ry>right:0.2") into a 6x6 coupling
+    matrix (rows: view axes, columns: device axes); empty or invalid text
+    gives None.
+    """
+    matrix = [[0.0] * 6 for _ in range(6)]
+    found = False
+    try:
+        for item in text.replace(";", ",").split(","):
+            if not item.strip():
+                continue
+            axes, factor = item.split(":")
+            source, target = axes.split(">")
+            column = DEVICE_AXES.index(source.strip().lower())
+            row = VIEW_AXES.index(target.strip().lower())
+            matrix[row][column] += float(factor)
+            found = True
+    except ValueError:
+        return None
+    return tuple(tuple(row) for row in matrix) if found else None
+
+
+@dataclass(frozen=True, slots=True)
+class PrefsSnapshot:
+    """Hot-path preferences (field names match SpaceControllerPreferences)."""
+    move_sensitivity: float = 0.001
+    rotate_sensitivity: float = 0.0005
+    invert_x: bool = False
+    invert_y: bool = False
+    invert_z: bool = False
+    enable_rotation: bool = True
+    time_based_motion: bool = False
+    use_reader_thread: bool = False
+    extra_device_target: str = 'OBJECT'
+    swap_yz: bool = False
+    axis_coupling: str = ""
+    response_curve: str = 'LINEAR'
+    deadzone: float = 0.0
+    curve_exponent: float = 2.0
+    custom_curve: str = ""
+    adaptive_poll_rate: bool = False
+    min_poll_interval: float = 0.004
+    max_poll_interval: float = 0.02
+
+    # Derived from the values above; never read from the preferences.
+    axis_mapping: AxisMapping = field(default=None, compare=False, repr=False)
+    response_curves: Optional[ResponseCurves] = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self):
+        if self.max_poll_interval < self.min_poll_interval:
+            # Saved preferences may predate the ordering kept by the UI.
+            object.__setattr__(self, "max_poll_interval", self.min_poll_interval)
+        if self.axis_mapping is None:
+            object.__setattr__(self, "axis_mapping", self.compile_axis_mapping())
+        if self.response_curves is None:
+            object.__setattr__(self, "response_curves", self.compile_response_curves())
+
+    @classmethod
+    def from_prefs(cls, prefs) -> "PrefsSnapshot":
+        """Copy the matching attributes of an AddonPreferences instance."""
+        return cls(**{
+            f.name: getattr(prefs, f.name) for f in fields(cls) if f.name not in _DERIVED
+        })
+
+    def compile_axis_mapping(self) -> AxisMapping:
+        """Fold inversion, sensitivity, axis swaps and coupling into one 6x6 matrix."""
+        if self.swap_yz:
+            # Up <-> forward, and the matching rotations (pitch stays).
+            source_axes = (0, 2, 1, 3, 5, 4)
+        else:
+            source_axes = (0, 1, 2, 3, 4, 5)
+        return AxisMapping.compile(
+            move_scale=self.move_sensitivity,
+            rotate_scale=self.rotate_sensitivity,
+            invert=(self.invert_x, self.invert_y, self.invert_z, False, False, False),
+            source_axes=source_axes,
+            coupling=parse_axis_coupling(self.axis_coupling),
+            enable_rotation=self.enable_rotation,
+        )
+
+    def compile_response_curves(self) -> Optional[ResponseCurves]:
+        """Lookup tables for the response curve, or None for a plain linear response."""
+        if self.response_curve == 'LINEAR' or (
+            self.response_curve == 'DEADZONE' and self.deadzone <= 0.0
+        ):
+            return None
+        table = _response_table(
+            self.response_curve,
+            min(max(self.deadzone, 0.0), 0.95),
+            self.curve_exponent,
+            parse_curve_points(self.custom_curve),
+        )
+        return ResponseCurves((table,) * 6)
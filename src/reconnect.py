@@ -0,0 +1,227 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+Reconnect state machine for input devices.
+
+Opening a device (loading the DLL, connecting to the driver) runs on a worker
+thread; the Blender timer only calls the non-blocking poll(). Failed or lost
+connections are retried with exponential backoff and jitter instead of
+disabling the add-on.
+"""
+
+from typing import Any, Callable, Optional
+
+import random
+import threading
+import time
+
+DISCONNECTED = 'DISCONNECTED'   # no device, next poll() starts an attempt
+CONNECTING = 'CONNECTING'       # worker thread is opening the device
+CONNECTED = 'CONNECTED'         # device handed out to the caller
+BACKOFF = 'BACKOFF'             # waiting before the next attempt
+
+OpenFn = Callable[[], Any]
+
+
+class ReconnectController:
+    """
+    Opens devices off the main thread and retries with backoff.
+
+    Usage from the main thread:
+    - poll(make_opener): returns the opened device once, else None. When an
+      attempt is due, `make_opener()` is called on the main thread (so it
+      may read Blender data) and the function it returns runs on a worker.
+    - report_lost(exc): the device failed; schedule a reconnect.
+    - shutdown(): stop; a device opened by an in-flight attempt is closed.
+
+    An attempt that takes longer than `timeout` seconds counts as failed
+    (TimeoutError). Its worker can't be interrupted, so it is left to finish
+    in the background and whatever it opens is closed; no new attempt starts
+    while it is still running. wait_for(thread) does the same for other
+    threads that may still be inside a driver call (e.g. a stalled reader
+    that closes the old device when it returns).
+
+    Counters: attempts, failures, reconnects (successful opens after a
+    lost connection), last_error, last_open_time (duration of the last
+    finished attempt in seconds).
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        jitter: float = 0.25,
+        timeout: Optional[float] = 10.0,
+        rng: Optional[random.Random] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._jitter = jitter
+        self._timeout = timeout
+        self._rng = rng or random.Random()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._busy: list[threading.Thread] = []   # timed-out workers, stalled readers
+        self._generation = 0            # identifies the current attempt
+        self._started_at = 0.0
+        self._result: Any = None
+        self._error: Optional[BaseException] = None
+        self._done = False
+        self._shutdown = False
+        self._retry_at = 0.0
+        self._consecutive_failures = 0
+        self._was_connected = False
+
+        self.state = DISCONNECTED
+        self.attempts = 0
+        self.failures = 0
+        self.reconnects = 0
+        self.last_error: Optional[BaseException] = None
+        self.last_open_time = 0.0
+
+    def retry_in(self) -> float:
+        """Seconds until the next attempt (0 if not waiting)."""
+        if self.state != BACKOFF:
+            return 0.0
+        return max(0.0, self._retry_at - self._clock())
+
+    def poll(self, make_opener: Callable[[], OpenFn]) -> Any:
+        """Advance the state machine; returns a freshly opened device or None."""
+        if self._shutdown:
+            return None
+
+        if self.state == BACKOFF and self._clock() >= self._retry_at:
+            self.state = DISCONNECTED
+
+        if self.state == DISCONNECTED:
+            self._busy = [thread for thread in self._busy if thread.is_alive()]
+            if self._busy:
+                # A thread is still stuck in the driver; don't pile up.
+                self._retry_at = self._clock() + self._base_delay
+                self.state = BACKOFF
+                return None
+            self._start_attempt(make_opener())
+            return None
+
+        if self.state == CONNECTING:
+            with self._lock:
+                if self._done:
+                    result, error = self._result, self._error
+                    self._result = self._error = None
+                else:
+                    if self._timeout is None or self._clock() - self._started_at <= self._timeout:
+                        return None
+                    # Give up on this attempt; its worker discards the result.
+                    self._busy.append(self._worker)
+                    self._generation += 1
+                    result = None
+                    error = TimeoutError(
+                        f"Opening the device took longer than {self._timeout:g} s."
+                    )
+                self._worker = None
+
+            if error is not None:
+                self._on_failure(error)
+                return None
+
+            self.state = CONNECTED
+            self._consecutive_failures = 0
+            if self._was_connected:
+                self.reconnects += 1
+            self._was_connected = True
+            return result
+
+        return None
+
+    def report_lost(self, error: Optional[BaseException] = None) -> None:
+        """The connected device failed: retry after the first backoff step."""
+        if self.state != CONNECTED:
+            return
+        self.last_error = error
+        self._consecutive_failures = 0
+        self._schedule_retry()
+
+    def wait_for(self, thread: threading.Thread) -> None:
+        """Start no attempt while `thread` is still running."""
+        self._busy.append(thread)
+
+    def reset(self) -> None:
+        """Retry immediately (e.g. after the user re-enabled the add-on)."""
+        if self.state == BACKOFF:
+            self.state = DISCONNECTED
+            self._consecutive_failures = 0
+
+    def shutdown(self) -> None:
+        """Stop reconnecting. An attempt still in flight closes its device."""
+        self._shutdown = True
+        with self._lock:
+            if self._worker is not None and self._done:
+                _close_quietly(self._result)
+                self._result = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _start_attempt(self, opener: OpenFn) -> None:
+        self.attempts += 1
+        self.state = CONNECTING
+        self._started_at = self._clock()
+        with self._lock:
+            self._done = False
+            self._result = self._error = None
+            self._generation += 1
+            worker = threading.Thread(
+                target=self._run, args=(opener, self._generation),
+                name="SpaceControllerConnect", daemon=True,
+            )
+            self._worker = worker
+        worker.start()
+
+    def _run(self, opener: OpenFn, generation: int) -> None:
+        result, error = None, None
+        started = self._clock()
+        try:
+            result = opener()
+        except Exception as exc:
+            error = exc
+        with self._lock:
+            self.last_open_time = self._clock() - started
+            if self._shutdown or generation != self._generation:
+                # Nobody will pick this up any more (shut down or timed out).
+                _close_quietly(result)
+                return
+            self._result, self._error = result, error
+            self._done = True
+
+    def _on_failure(self, error: BaseException) -> None:
+        self.failures += 1
+        self.last_error = error
+        self._schedule_retry()
+        self._consecutive_failures += 1
+
+    def _schedule_retry(self) -> None:
+        delay = min(self._max_delay, self._base_delay * (2 ** self._consecutive_failures))
+        delay *= 1.0 + self._rng.uniform(-self._jitter, self._jitter)
+        self._retry_at = self._clock() + delay
+        self.state = BACKOFF
+
+
+def _close_quietly(device: Any) -> None:
+    """Close a device, or every device in a list, ignoring errors."""
+    if device is None:
+        return
+    for d in device if isinstance(device, (list, tuple)) else (device,):
+        try:
+            d.close()
+        except Exception:
+            pass
@@ -0,0 +1,265 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+Recording and replay of raw controller streams.
+
+File format (all little-endian):
+- 16-byte header: magic b"SCRC", uint16 version, uint16 record size,
+  8 reserved bytes.
+- Fixed-width 24-byte records: int64 timestamp (microseconds), int32 event,
+  six int16 axes (tx, ty, tz, rx, ry, rz).
+
+Fixed-width records let a recording be memory-mapped and indexed directly.
+"""
+
+from typing import Callable, Optional
+
+import mmap
+import struct
+import time
+
+from .spacecontroller_device import DeviceBackend, SpaceControllerState
+
+MAGIC = b"SCRC"
+VERSION = 1
+HEADER = struct.Struct("<4sHH8x")
+RECORD = struct.Struct("<qi6h")
+
+
+def _axis(value: float) -> int:
+    """Round a device axis value to the int16 range the device reports."""
+    v = int(round(value))
+    return 32767 if v > 32767 else -32768 if v < -32768 else v
+
+
+def _recorded_count(path: str) -> Optional[int]:
+    """Number of whole records in the recording at `path`, None if it isn't one."""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+            size = f.seek(0, 2)
+    except OSError:
+        return None
+    if len(header) < HEADER.size or header != HEADER.pack(MAGIC, VERSION, RECORD.size):
+        return None
+    return (size - HEADER.size) // RECORD.size
+
+
+class StreamRecorder:
+    """
+    Append SpaceControllerState samples to a recording file.
+
+    Writes are buffered; flush() hands them to the OS, so a crash loses at
+    most what was written since the last flush. With `append=True` an
+    existing recording is continued instead of replaced.
+    """
+
+    def __init__(self, path: str, append: bool = False):
+        count = _recorded_count(path) if append else None
+        if count is None:
+            self._file = open(path, "wb")
+            self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+            self._file.flush()
+            count = 0
+        else:
+            self._file = open(path, "r+b")
+            self._file.seek(HEADER.size + count * RECORD.size)
+            self._file.truncate()   # drop a record torn by a crash
+        self._pending = False
+        self.count = count
+
+    def write(self, state: SpaceControllerState) -> None:
+        self._file.write(RECORD.pack(
+            int(round(state.timestamp * 1e6)),
+            state.event,
+            _axis(state.tx), _axis(state.ty), _axis(state.tz),
+            _axis(state.rx), _axis(state.ry), _axis(state.rz),
+        ))
+        self._pending = True
+        self.count += 1
+
+    def flush(self) -> None:
+        if self._pending:
+            self._file.flush()
+            self._pending = False
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "StreamRecorder":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+class StreamRecording:
+    """Read-only, memory-mapped view of a recording file."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            size = f.seek(0, 2)
+            if size < HEADER.size:
+                raise RuntimeError(f"'{path}' is not a SpaceController recording (too short).")
+            # mmap can't map empty files; a header-only recording maps fine.
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, record_size = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise RuntimeError(f"'{path}' is not a SpaceController recording.")
+        if version != VERSION or record_size != RECORD.size:
+            self._mm.close()
+            raise RuntimeError(
+                f"Unsupported recording format (version {version}, record size {record_size})."
+            )
+        self._count = (len(self._mm) - HEADER.size) // RECORD.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def timestamp(self, index: int) -> float:
+        """Device timestamp of sample `index` in seconds."""
+        return struct.unpack_from("<q", self._mm, HEADER.size + index * RECORD.size)[0] * 1e-6
+
+    def read_into(self, index: int, state: SpaceControllerState) -> None:
+        """Decode sample `index` into `state`."""
+        usec, event, tx, ty, tz, rx, ry, rz = RECORD.unpack_from(
+            self._mm, HEADER.size + index * RECORD.size
+        )
+        state.tx = float(tx)
+        state.ty = float(ty)
+        state.tz = float(tz)
+        state.rx = float(rx)
+        state.ry = float(ry)
+        state.rz = float(rz)
+        state.event = event
+        state.timestamp = usec * 1e-6
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+class RecordingBackend(DeviceBackend):
+    """
+    Pass-through backend that records every sample of another backend.
+
+    The recording is flushed whenever the inner backend runs out of new
+    data, i.e. once per drained burst rather than once per sample. Only the
+    first connect() starts a new file (unless `append` is set); reconnecting
+    continues it, so a dropped device doesn't wipe the session.
+    """
+
+    def __init__(self, inner: DeviceBackend, path: str, append: bool = False):
+        super().__init__()
+        self._inner = inner
+        self._path = path
+        self._append = append
+        self._recorder: Optional[StreamRecorder] = None
+
+    @property
+    def inner(self) -> DeviceBackend:
+        return self._inner
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def connect(self) -> None:
+        self._inner.connect()
+        self.startup_timings = self._inner.startup_timings
+        if self._recorder is None:
+            self._recorder = StreamRecorder(self._path, append=self._append)
+            self._append = True
+
+    def read_state_into(self, state: SpaceControllerState) -> bool:
+        recorder = self._recorder
+        if not self._inner.read_state_into(state):
+            if recorder is not None:
+                recorder.flush()
+            return False
+        if recorder is not None:
+            recorder.write(state)
+        return True
+
+    def device_count(self) -> Optional[int]:
+        return self._inner.device_count()
+
+    def close(self) -> None:
+        self._inner.close()
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+
+class ReplayBackend(DeviceBackend):
+    """
+    Backend that plays a recording back.
+
+    With `realtime=True` samples are released at their original spacing
+    (relative to connect()); otherwise every fetch returns the next sample,
+    for as-fast-as-possible regression and benchmark runs. With `loop=True`
+    playback restarts at the end instead of running dry.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        realtime: bool = True,
+        loop: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__()
+        self._path = path
+        self._realtime = realtime
+        self._loop = loop
+        self._clock = clock
+        self._recording: Optional[StreamRecording] = None
+        self._index = 0
+        self._start_time = 0.0
+        self._time_offset = 0.0   # recording time that maps to _start_time
+
+    def connect(self) -> None:
+        if self._recording is not None:
+            return
+        self._recording = StreamRecording(self._path)
+        self._restart()
+
+    def _restart(self) -> None:
+        self._index = 0
+        self._start_time = self._clock()
+        recording = self._recording
+        self._time_offset = recording.timestamp(0) if len(recording) else 0.0
+
+    def read_state_into(self, state: SpaceControllerState) -> bool:
+        recording = self._recording
+        if recording is None or len(recording) == 0:
+            return False
+
+        if self._index >= len(recording):
+            if not self._loop:
+                return False
+            self._restart()
+
+        if self._realtime:
+            elapsed = self._clock() - self._start_time
+            if recording.timestamp(self._index) - self._time_offset > elapsed:
+                return False
+
+        recording.read_into(self._index, state)
+        self._index += 1
+        return True
+
+    def close(self) -> None:
+        if self._recording is not None:
+            self._recording.close()
+            self._recording = None
@@ -0,0 +1,376 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+Shared-memory device broker.
+
+Only one process can own the driver connection. The broker owns the device
+and publishes every sample into a `multiprocessing.shared_memory` ring;
+any number of Blender instances read it with SharedMemoryBackend instead
+of opening the device themselves.
+
+Layout (little-endian):
+- 32-byte header: magic b"SCSM", uint16 version, uint16 record size,
+  uint32 capacity, uint32 flags, uint64 sequence (samples published so
+  far), float64 heartbeat (broker wall-clock time).
+- `capacity` slots in the recording record format (see recording.py);
+  sample n lives in slot n % capacity.
+
+There is a single writer. It fills the slot first and then bumps the
+sequence; a reader that finds its slot may have been rewritten while it
+was decoding (sequence caught up to within `capacity` of it) skips the
+sample.
+"""
+
+from typing import Callable, Optional, Sequence
+
+import argparse
+import os
+import signal
+import struct
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+from .recording import RECORD, _axis
+from .spacecontroller_device import (
+    DeviceBackend,
+    SpaceControllerBatch,
+    SpaceControllerDevice,
+    SpaceControllerState,
+)
+
+DEFAULT_BROKER_NAME = "spacecontroller"
+
+MAGIC = b"SCSM"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIQd")
+FLAG_CLOSED = 1
+STALE_AFTER = 2.0   # seconds without a heartbeat before a broker counts as dead
+
+_FLAGS = struct.Struct("<I")
+_SEQUENCE = struct.Struct("<Q")
+_HEARTBEAT = struct.Struct("<d")
+_FLAGS_OFFSET = 12
+_SEQUENCE_OFFSET = 16
+_HEARTBEAT_OFFSET = 24
+
+
+def _open(name: str, create: bool = False, size: int = 0) -> shared_memory.SharedMemory:
+    """
+    Open a block that the multiprocessing resource tracker leaves alone.
+
+    The tracker unlinks every block a process touched when that process
+    exits, which would pull the ring away from all other processes. The
+    broker unlinks the block itself, and a block left behind by a crashed
+    broker is reclaimed through its stale heartbeat.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, create=create, size=size, track=False)
+    except TypeError:  # Python < 3.13
+        shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+    if os.name == "posix":
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _unlink(shm: shared_memory.SharedMemory) -> None:
+    if os.name == "posix" and getattr(shm, "_track", True):
+        # unlink() unregisters the block from the tracker on Python < 3.13.
+        resource_tracker.register(shm._name, "shared_memory")
+    shm.unlink()
+
+
+class SharedMemoryBroker:
+    """
+    Publishing side of the ring. Owns the shared memory block.
+
+    Args:
+        name:     shared memory name readers attach to.
+        capacity: number of sample slots.
+
+    A block left behind by a broker that shut down or died is reused; one
+    whose broker is still running raises RuntimeError.
+    """
+
+    def __init__(self, name: str = DEFAULT_BROKER_NAME, capacity: int = 1024):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        size = HEADER.size + capacity * RECORD.size
+        try:
+            self._shm = _open(name, create=True, size=size)
+        except FileExistsError:
+            stale = _open(name)
+            flags = _FLAGS.unpack_from(stale.buf, _FLAGS_OFFSET)[0]
+            heartbeat = _HEARTBEAT.unpack_from(stale.buf, _HEARTBEAT_OFFSET)[0]
+            if not flags & FLAG_CLOSED and time.time() - heartbeat < STALE_AFTER:
+                stale.close()
+                raise RuntimeError(f"A SpaceController broker '{name}' is already running.")
+            _unlink(stale)
+            stale.close()
+            self._shm = _open(name, create=True, size=size)
+
+        self.name = name
+        self.capacity = capacity
+        self.sequence = 0
+        HEADER.pack_into(self._shm.buf, 0, MAGIC, VERSION, RECORD.size, capacity, 0, 0, time.time())
+
+    def publish(self, state: SpaceControllerState) -> None:
+        buf = self._shm.buf
+        sequence = self.sequence
+        RECORD.pack_into(
+            buf, HEADER.size + (sequence % self.capacity) * RECORD.size,
+            int(round(state.timestamp * 1e6)),
+            state.event,
+            _axis(state.tx), _axis(state.ty), _axis(state.tz),
+            _axis(state.rx), _axis(state.ry), _axis(state.rz),
+        )
+        self.sequence = sequence + 1
+        _SEQUENCE.pack_into(buf, _SEQUENCE_OFFSET, sequence + 1)
+
+    def heartbeat(self) -> None:
+        _HEARTBEAT.pack_into(self._shm.buf, _HEARTBEAT_OFFSET, time.time())
+
+    def close(self) -> None:
+        """Mark the ring closed (readers disconnect) and remove it."""
+        if self._shm is None:
+            return
+        _FLAGS.pack_into(self._shm.buf, _FLAGS_OFFSET, FLAG_CLOSED)
+        try:
+            _unlink(self._shm)
+        except FileNotFoundError:
+            pass
+        self._shm.close()
+        self._shm = None
+
+    def __enter__(self) -> "SharedMemoryBroker":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+class SharedMemoryBackend(DeviceBackend):
+    """
+    Device samples read from a broker's ring.
+
+    Samples are decoded directly from the shared buffer. Reading starts at
+    the newest sample at connect() time. A reader that falls more than
+    `capacity` samples behind skips ahead and counts the lost samples in
+    `dropped`. If the broker shuts down or its heartbeat is older than
+    `stale_after` seconds, reads raise RuntimeError so the add-on's
+    reconnect logic takes over.
+    """
+
+    def __init__(
+        self,
+        name: str = DEFAULT_BROKER_NAME,
+        stale_after: float = STALE_AFTER,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__()
+        self._name = name
+        self._stale_after = stale_after
+        self._clock = clock
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._capacity = 0
+        self._cursor = 0
+        self.dropped = 0
+
+    def connect(self) -> None:
+        if self._shm is not None:
+            return
+        try:
+            shm = _open(self._name)
+        except FileNotFoundError as exc:
+            raise RuntimeError(f"No SpaceController broker '{self._name}' is running.") from exc
+
+        magic, version, record_size, capacity, flags, sequence, _ = HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            shm.close()
+            raise RuntimeError(f"'{self._name}' is not a compatible SpaceController broker.")
+        if flags & FLAG_CLOSED:
+            shm.close()
+            raise RuntimeError(f"SpaceController broker '{self._name}' has shut down.")
+
+        self._shm = shm
+        self._capacity = capacity
+        self._cursor = sequence
+
+    def read_state_into(self, state: SpaceControllerState) -> bool:
+        shm = self._shm
+        if shm is None:
+            return False
+        buf = shm.buf
+        capacity = self._capacity
+
+        while True:
+            sequence = _SEQUENCE.unpack_from(buf, _SEQUENCE_OFFSET)[0]
+            cursor = self._cursor
+            if cursor >= sequence:
+                self._check_broker(buf)
+                return False
+            if sequence - cursor >= capacity:
+                # Overrun: the oldest slot may already be rewritten for `sequence`.
+                self.dropped += sequence - capacity + 1 - cursor
+                cursor = sequence - capacity + 1
+
+            usec, event, tx, ty, tz, rx, ry, rz = RECORD.unpack_from(
+                buf, HEADER.size + (cursor % capacity) * RECORD.size
+            )
+            self._cursor = cursor + 1
+            # The slot may have been reused while it was decoded.
+            if _SEQUENCE.unpack_from(buf, _SEQUENCE_OFFSET)[0] - cursor >= capacity:
+                self.dropped += 1
+                continue
+
+            state.tx = float(tx)
+            state.ty = float(ty)
+            state.tz = float(tz)
+            state.rx = float(rx)
+            state.ry = float(ry)
+            state.rz = float(rz)
+            state.event = event
+            state.timestamp = usec * 1e-6
+            return True
+
+    def close(self) -> None:
+        shm = self._shm
+        self._shm = None
+        if shm is not None:
+            shm.close()
+
+    def _check_broker(self, buf) -> None:
+        if _FLAGS.unpack_from(buf, _FLAGS_OFFSET)[0] & FLAG_CLOSED:
+            raise RuntimeError(f"SpaceController broker '{self._name}' has shut down.")
+        heartbeat = _HEARTBEAT.unpack_from(buf, _HEARTBEAT_OFFSET)[0]
+        if self._clock() - heartbeat > self._stale_after:
+            raise RuntimeError(f"SpaceController broker '{self._name}' stopped responding.")
+
+
+# ---------------------------------------------------------------------------
+# Broker process
+# ---------------------------------------------------------------------------
+
+def run_broker(
+    open_source: Callable[[], DeviceBackend],
+    name: str = DEFAULT_BROKER_NAME,
+    capacity: int = 1024,
+    interval: float = 0.002,
+    retry_delay: float = 1.0,
+    stop: Optional[threading.Event] = None,
+) -> None:
+    """
+    Publish samples from `open_source()` until `stop` is set (or Ctrl+C).
+
+    The source is reopened after `retry_delay` seconds if opening or reading
+    it fails, so the broker survives an unplugged device.
+    """
+    stop = stop or threading.Event()
+    batch = SpaceControllerBatch()
+    state = SpaceControllerState()
+    source: Optional[DeviceBackend] = None
+    with SharedMemoryBroker(name, capacity) as broker:
+        print(f"SpaceController: broker '{name}' running.")
+        try:
+            while not stop.is_set():
+                broker.heartbeat()
+                if source is None:
+                    try:
+                        source = open_source()
+                        source.connect()
+                    except Exception as exc:
+                        print(f"SpaceController: broker could not open device: {exc}")
+                        source = None
+                        stop.wait(retry_delay)
+                        continue
+                try:
+                    source.read_states(batch, capacity)
+                except Exception as exc:
+                    print(f"SpaceController: broker lost device: {exc}")
+                    source.close()
+                    source = None
+                    continue
+                for i in range(len(batch)):
+                    batch.get_into(i, state)
+                    broker.publish(state)
+                stop.wait(interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if source is not None:
+                source.close()
+    print(f"SpaceController: broker '{name}' stopped.")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="SpaceController shared-memory broker")
+    parser.add_argument("--name", default=DEFAULT_BROKER_NAME)
+    parser.add_argument("--capacity", type=int, default=1024)
+    parser.add_argument("--interval", type=float, default=0.002, help="poll interval (s)")
+    parser.add_argument("--library-path", default=None)
+    parser.add_argument(
+        "--simulated", type=float, default=None, metavar="RATE_HZ",
+        help="publish a simulated stream instead of opening the device",
+    )
+    args = parser.parse_args(argv)
+
+    if args.simulated is not None:
+        from .simulated_backend import SimulatedBackend
+
+        def open_source() -> DeviceBackend:
+            return SimulatedBackend(rate_hz=args.simulated)
+    else:
+        def open_source() -> DeviceBackend:
+            return SpaceControllerDevice(app_name="Blender broker", library_path=args.library_path)
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda _signum, _frame: stop.set())
+    try:
+        run_broker(open_source, args.name, args.capacity, args.interval, stop=stop)
+    except RuntimeError as exc:
+        print(f"SpaceController: {exc}")
+        return 1
+    return 0
+
+
+# Runs main() with this add-on's directory mounted as a package, without
+# importing the add-on's __init__ (which needs bpy).
+_BOOTSTRAP = (
+    "import importlib, sys, types\n"
+    "package = types.ModuleType({package!r})\n"
+    "package.__path__ = [{path!r}]\n"
+    "sys.modules[{package!r}] = package\n"
+    "sys.exit(importlib.import_module({module!r}).main(sys.argv[1:]))\n"
+)
+
+
+def launch_broker(args: Sequence[str] = (), python: Optional[str] = None) -> subprocess.Popen:
+    """Start the broker as a separate process; `args` are main() arguments."""
+    package = "_spacecontroller_broker"
+    code = _BOOTSTRAP.format(
+        package=package,
+        path=os.path.dirname(os.path.abspath(__file__)),
+        module=f"{package}.shm_broker",
+    )
+    return subprocess.Popen([python or sys.executable, "-c", code, *args])
+
+
+def stop_broker(process: subprocess.Popen, timeout: float = 5.0) -> None:
+    """Ask a launched broker to shut down, and reap it (killing it if it hangs)."""
+    if process.poll() is None:
+        process.terminate()   # SIGTERM: main() closes the device and the segment
+        try:
+            process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    process.wait()
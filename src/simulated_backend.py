@@ -0,0 +1,141 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+Simulated 6-DOF input source.
+
+Produces a deterministic stream of samples at a configurable rate, either
+from a script (a sequence of axis tuples that is cycled) or from a seeded
+random walk. Works on every platform and needs no hardware, so the whole
+input pipeline can be exercised and load-tested.
+"""
+
+from typing import Callable, Optional, Sequence
+
+import random
+import time
+
+from .spacecontroller_device import DeviceBackend, SpaceControllerState
+
+
+class SimulatedBackend(DeviceBackend):
+    """
+    Simulated device producing `rate_hz` samples per second of `clock` time.
+
+    Args:
+        rate_hz:     sample rate; 0 means "a new sample on every fetch"
+                     (useful for load tests).
+        script:      optional sequence of (tx, ty, tz, rx, ry, rz[, event])
+                     tuples, replayed in a loop. Without a script a seeded
+                     random walk in [-amplitude, amplitude] is generated.
+        seed:        random seed for the random walk.
+        amplitude:   axis range of the random walk (device units).
+        max_backlog: at most this many overdue samples are delivered after a
+                     stall; older ones are skipped, like a driver would.
+        clock:       time source in seconds (injectable for tests).
+
+    Timestamps are synthetic (sample index / rate), so a run with a scripted
+    clock is fully reproducible.
+    """
+
+    def __init__(
+        self,
+        rate_hz: float = 100.0,
+        script: Optional[Sequence[Sequence[float]]] = None,
+        seed: int = 0,
+        amplitude: float = 350.0,
+        max_backlog: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__()
+        if rate_hz < 0:
+            raise ValueError("rate_hz must not be negative")
+        if script is not None and len(script) == 0:
+            raise ValueError("script must not be empty")
+        self._rate_hz = rate_hz
+        self._script = script
+        self._seed = seed
+        self._amplitude = amplitude
+        self._max_backlog = max_backlog
+        self._clock = clock
+        self._connected = False
+        self._start_time = 0.0
+        self._index = 0          # index of the next sample to emit
+        self._rng = random.Random(seed)
+        self._walk = [0.0] * 6
+
+    @property
+    def samples_emitted(self) -> int:
+        return self._index
+
+    def connect(self) -> None:
+        if self._connected:
+            return
+        self._connected = True
+        self._start_time = self._clock()
+        self._index = 0
+        self._rng.seed(self._seed)
+        self._walk = [0.0] * 6
+
+    def read_state_into(self, state: SpaceControllerState) -> bool:
+        if not self._connected:
+            return False
+
+        rate = self._rate_hz
+        if rate > 0.0:
+            due = int((self._clock() - self._start_time) * rate)
+            if self._index >= due:
+                return False
+            if due - self._index > self._max_backlog:
+                self._skip_to(due - self._max_backlog)
+            timestamp = (self._index + 1) / rate
+        else:
+            timestamp = 0.0
+
+        self._fill(state)
+        state.timestamp = timestamp
+        self._index += 1
+        return True
+
+    def close(self) -> None:
+        self._connected = False
+
+    # ------------------------------------------------------------------
+    # Sample generation
+    # ------------------------------------------------------------------
+    def _fill(self, state: SpaceControllerState) -> None:
+        script = self._script
+        if script is not None:
+            row = script[self._index % len(script)]
+            state.tx, state.ty, state.tz, state.rx, state.ry, state.rz = (
+                float(v) for v in row[:6]
+            )
+            state.event = int(row[6]) if len(row) > 6 else 0
+            return
+
+        walk = self._walk
+        amplitude = self._amplitude
+        step = amplitude * 0.05
+        uniform = self._rng.uniform
+        for i in range(6):
+            v = walk[i] + uniform(-step, step)
+            walk[i] = amplitude if v > amplitude else -amplitude if v < -amplitude else v
+        state.tx, state.ty, state.tz, state.rx, state.ry, state.rz = walk
+        state.event = 0
+
+    def _skip_to(self, index: int) -> None:
+        """Advance the stream to `index` without emitting the skipped samples."""
+        if self._script is None:
+            scratch = SpaceControllerState()
+            while self._index < index:
+                # Keep the random walk identical to an unskipped run.
+                self._fill(scratch)
+                self._index += 1
+        self._index = index
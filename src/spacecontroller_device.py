@@ -13,48 +13,427 @@ Minimal Python wrapper for the SpaceController DLL.
 
 This file is completely independent from the original Blender plugin.
 It only uses the vendor DLL (spc_ctrlr_32/64.dll) via ctypes.
+
+It also defines DeviceBackend, the interface every input source implements
+(the vendor DLL here, simulated and other sources in their own modules).
 """
 
+from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 import ctypes
+import os
 import sys
 import platform
+import threading
+import time
+
+# Environment variable overriding the controller library path (any platform).
+LIBRARY_PATH_ENV = "SPACECONTROLLER_LIBRARY"
+
+# Driver connections are opened from worker threads (reconnect, hot-plug
+# probes) and polled from the main or reader thread: the lock serialises
+# every driver call, so a fetch or device count never runs concurrently
+# with scDisconnect. The counter tracks how many connections this process
+# holds.
+_driver_lock = threading.Lock()
+_driver_connections = 0
+
+# Backends that decode buttons report them as a bit mask in `event`, which
+# the driver API types as a signed C int: only the low 31 bits are usable.
+BUTTON_BITS = 31
+BUTTON_MASK = (1 << BUTTON_BITS) - 1
 
 
 @dataclass
 class SpaceControllerState:
     """Single snapshot of controller state."""
-    tx: float  # translation X
-    ty: float  # translation Y
-    tz: float  # translation Z
-    rx: float  # rotation X
-    ry: float  # rotation Y
-    rz: float  # rotation Z
-    event: int  # event / buttons (raw int from DLL)
+    tx: float = 0.0  # translation X
+    ty: float = 0.0  # translation Y
+    tz: float = 0.0  # translation Z
+    rx: float = 0.0  # rotation X
+    ry: float = 0.0  # rotation Y
+    rz: float = 0.0  # rotation Z
+    event: int = 0  # event / buttons (raw int from DLL)
+    timestamp: float = 0.0  # device time in seconds (tvSec + tvUsec), 0.0 if unknown
+
+    def has_motion(self) -> bool:
+        """True if any of the six axes is non-zero."""
+        return bool(self.tx or self.ty or self.tz or self.rx or self.ry or self.rz)
 
 
-class SpaceControllerDevice:
+class SpaceControllerBatch:
+    """
+    Compact batch of controller samples, stored column-wise in arrays.
+
+    `axes` holds six floats per sample (tx, ty, tz, rx, ry, rz), `events` one
+    int and `timestamps` one float per sample. A batch is meant to be reused: clear() keeps the
+    arrays, so refilling it every tick does not allocate once it has grown.
+    """
+
+    __slots__ = ("axes", "events", "timestamps")
+
+    def __init__(self):
+        self.axes = array("d")
+        self.events = array("i")
+        self.timestamps = array("d")
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def clear(self) -> None:
+        del self.axes[:]
+        del self.events[:]
+        del self.timestamps[:]
+
+    def append(self, state: SpaceControllerState) -> None:
+        axes = self.axes
+        axes.append(state.tx)
+        axes.append(state.ty)
+        axes.append(state.tz)
+        axes.append(state.rx)
+        axes.append(state.ry)
+        axes.append(state.rz)
+        self.events.append(state.event)
+        self.timestamps.append(state.timestamp)
+
+    def get_into(self, index: int, state: SpaceControllerState) -> None:
+        """Copy sample `index` into `state`."""
+        axes = self.axes
+        base = index * 6
+        state.tx = axes[base]
+        state.ty = axes[base + 1]
+        state.tz = axes[base + 2]
+        state.rx = axes[base + 3]
+        state.ry = axes[base + 4]
+        state.rz = axes[base + 5]
+        state.event = self.events[index]
+        state.timestamp = self.timestamps[index]
+
+    def sum_into(self, state: SpaceControllerState) -> None:
+        """
+        Integrate the whole batch into `state`: axes are summed, event and
+        timestamp are taken from the newest sample. Leaves `state` untouched
+        if empty.
+        """
+        n = len(self.events)
+        if n == 0:
+            return
+        axes = self.axes
+        state.tx = sum(axes[0::6])
+        state.ty = sum(axes[1::6])
+        state.tz = sum(axes[2::6])
+        state.rx = sum(axes[3::6])
+        state.ry = sum(axes[4::6])
+        state.rz = sum(axes[5::6])
+        state.event = self.events[n - 1]
+        state.timestamp = self.timestamps[n - 1]
+
+    def mean_into(self, state: SpaceControllerState, scale: float = 1.0) -> None:
+        """
+        Like sum_into(), but the axes are the mean of the batch times `scale`,
+        so the result doesn't depend on how many samples arrived.
+        """
+        n = len(self.events)
+        if n == 0:
+            return
+        self.sum_into(state)
+        factor = scale / n
+        state.tx *= factor
+        state.ty *= factor
+        state.tz *= factor
+        state.rx *= factor
+        state.ry *= factor
+        state.rz *= factor
+
+    def integrate_into(
+        self,
+        state: SpaceControllerState,
+        previous_timestamp: float,
+        reference_dt: float,
+        max_dt: float,
+    ) -> float:
+        """
+        Time-weighted integration of the batch into `state`.
+
+        Each sample is weighted by the device time elapsed since the sample
+        before it, relative to `reference_dt` (the interval the sensitivity
+        settings are tuned for). Gaps are clamped to `max_dt`, so a pause in
+        the stream doesn't turn into a jump. Samples without a timestamp, or
+        when there is no previous timestamp, count as one reference interval.
+
+        Returns:
+            Timestamp of the newest sample (or `previous_timestamp` if empty),
+            to be passed back in on the next call.
+        """
+        n = len(self.events)
+        if n == 0:
+            return previous_timestamp
+
+        axes = self.axes
+        timestamps = self.timestamps
+        tx = ty = tz = rx = ry = rz = 0.0
+        prev = previous_timestamp
+        for i in range(n):
+            t = timestamps[i]
+            if t > 0.0 and prev > 0.0:
+                dt = t - prev
+                if dt < 0.0:
+                    dt = 0.0
+                elif dt > max_dt:
+                    dt = max_dt
+                weight = dt / reference_dt
+            else:
+                weight = 1.0
+            if t > 0.0:
+                prev = t
+
+            base = i * 6
+            tx += axes[base] * weight
+            ty += axes[base + 1] * weight
+            tz += axes[base + 2] * weight
+            rx += axes[base + 3] * weight
+            ry += axes[base + 4] * weight
+            rz += axes[base + 5] * weight
+
+        state.tx = tx
+        state.ty = ty
+        state.tz = tz
+        state.rx = rx
+        state.ry = ry
+        state.rz = rz
+        state.event = self.events[n - 1]
+        state.timestamp = timestamps[n - 1]
+        return prev
+
+
+class _StdDataBuffer(ctypes.Structure):
+    """Preallocated output buffer for scFetchStdData (one field per out-pointer)."""
+    _fields_ = [
+        ("x", ctypes.c_short),
+        ("y", ctypes.c_short),
+        ("z", ctypes.c_short),
+        ("a", ctypes.c_short),
+        ("b", ctypes.c_short),
+        ("c", ctypes.c_short),
+        ("wheel", ctypes.c_int),
+        ("buttons", ctypes.c_int),
+        ("event", ctypes.c_int),
+        ("tv_sec", ctypes.c_long),
+        ("tv_usec", ctypes.c_long),
+    ]
+
+
+class DeviceBackend(ABC):
+    """
+    Interface of a 6-DOF input source.
+
+    Lifecycle: construct, connect(), then poll with read_state_into() /
+    read_states(), and finally close(). connect() must be idempotent.
+    Subclasses implement connect(), read_state_into() and close(); the
+    other read methods are built on read_state_into().
+    """
+
+    def __init__(self):
+        self._batch_scratch = SpaceControllerState()
+        # Seconds spent in each phase of the last connect(), for diagnostics.
+        self.startup_timings: dict[str, float] = {}
+
+    @abstractmethod
+    def connect(self) -> None:
+        """Open the input source. Raises RuntimeError on failure."""
+
+    @abstractmethod
+    def read_state_into(self, state: SpaceControllerState) -> bool:
+        """
+        Poll the next sample into `state`.
+
+        Returns:
+            True if `state` was updated with new data, False if there was
+            no new data (`state` is left untouched).
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the input source. Must not raise."""
+
+    def device_count(self) -> int:
+        """Number of devices available through this input source."""
+        return 1
+
+    def read_state(self) -> Optional[SpaceControllerState]:
+        """
+        Poll current state from the device.
+
+        Returns:
+            SpaceControllerState if new data was read, or None if there
+            was no new data / an error occurred.
+        """
+        state = SpaceControllerState()
+        if not self.read_state_into(state):
+            return None
+        return state
+
+    def read_states(
+        self,
+        batch: Optional[SpaceControllerBatch] = None,
+        max_samples: int = 64,
+    ) -> SpaceControllerBatch:
+        """
+        Drain all pending samples from the device.
+
+        Calls read_state_into() until it reports no new data or `max_samples`
+        samples were read. Pass a batch to reuse it (it is cleared first).
+
+        Returns:
+            The filled batch (possibly empty).
+        """
+        if batch is None:
+            batch = SpaceControllerBatch()
+        else:
+            batch.clear()
+
+        scratch = self._batch_scratch
+        read_into = self.read_state_into
+        append = batch.append
+        for _ in range(max_samples):
+            if not read_into(scratch):
+                break
+            append(scratch)
+        return batch
+
+
+class SpaceControllerDevice(DeviceBackend):
     """
     Minimal interface to a SpaceController device via the SpaceControl DLL.
 
     Workflow:
-    - __init__(): load DLL, connect, pick first device
+    - __init__(): load DLL, connect, pick device `device_index` (via connect())
+    - open_all(): one connection, one SpaceControllerDevice per device
     - read_state(): poll current state (or return None if nothing)
+    - read_state_into(): same, but fills an existing state (no allocations)
+    - read_states(): drain every pending sample into a batch
     - close(): disconnect cleanly
     """
 
-    def __init__(self, app_name: str = "Blender"):
-        self._lib = self._load_library()
-        self._setup_function_signatures()
-        self._device_id = self._connect_and_get_first_device(app_name)
+    def __init__(
+        self,
+        app_name: str = "Blender",
+        device_index: int = 0,
+        library_path: Optional[str] = None,
+    ):
+        super().__init__()
+        self._app_name = app_name
+        self._device_index = device_index
+        self._library_path = library_path
+        self._device_id: Optional[int] = None
+        self._owns_connection = True
+        self._holds_connection = False
+        self.connect()
+
+    @classmethod
+    def open_all(
+        cls,
+        app_name: str = "Blender",
+        library_path: Optional[str] = None,
+    ) -> List["SpaceControllerDevice"]:
+        """
+        Connect once and open every device the driver reports.
+
+        The first device owns the driver connection; the others share its
+        library handle, so close them before (or together with) the first.
+        """
+        primary = cls(app_name=app_name, device_index=0, library_path=library_path)
+        devices = [primary]
+        try:
+            for index in range(1, primary.device_count()):
+                devices.append(primary._open_sibling(index))
+        except Exception:
+            for device in reversed(devices):
+                device.close()
+            raise
+        return devices
+
+    def _open_sibling(self, index: int) -> "SpaceControllerDevice":
+        """Open device `index` on this device's driver connection."""
+        sibling = self.__class__.__new__(self.__class__)
+        DeviceBackend.__init__(sibling)
+        sibling._app_name = self._app_name
+        sibling._device_index = index
+        sibling._library_path = self._library_path
+        sibling._owns_connection = False
+        sibling._holds_connection = False
+        sibling._lib = self._lib
+        sibling._setup_fetch_buffer()
+        sibling._device_id = index
+        return sibling
+
+    def connect(self) -> None:
+        """Load the DLL, connect to the driver and select the device."""
+        global _driver_connections
+        if self._device_id is not None:
+            return
+        self.startup_timings.clear()
+        with _driver_lock:
+            start = time.perf_counter()
+            self._lib = self._load_library()
+            self._setup_function_signatures()
+            self.startup_timings["load library"] = time.perf_counter() - start
+            self._device_id = self._connect_and_select_device(self._app_name, self._device_index)
+            self._holds_connection = True
+            _driver_connections += 1
+
+    @classmethod
+    def probe_device_count(
+        cls,
+        app_name: str = "Blender",
+        library_path: Optional[str] = None,
+    ) -> Optional[int]:
+        """
+        Count attached devices through a short-lived driver connection.
+
+        Meant for hot-plug detection while no device is open. Returns None
+        if this process already holds a connection (use device_count() on
+        the open device instead) and 0 if the driver can't be reached.
+        """
+        with _driver_lock:
+            if _driver_connections:
+                return None
+            probe = cls.__new__(cls)
+            DeviceBackend.__init__(probe)
+            probe._library_path = library_path
+            probe._lib = probe._load_library()
+            probe._setup_function_signatures()
+            if probe._lib.scConnect2(False, app_name.encode("ascii")) != 0:
+                return 0
+            try:
+                return probe._get_device_count()
+            except RuntimeError:
+                return 0
+            finally:
+                probe._lib.scDisconnect()
 
     # ------------------------------------------------------------------
     # DLL loading and function signatures
     # ------------------------------------------------------------------
     def _load_library(self) -> ctypes.CDLL:
-        """Load the SpaceControl controller DLL depending on platform."""
+        """Load the SpaceControl controller DLL depending on platform.
+
+        An explicit `library_path` (or the SPACECONTROLLER_LIBRARY environment
+        variable) is loaded as-is on any platform, e.g. a test build of the
+        library on Linux.
+        """
+        custom_path = self._library_path or os.environ.get(LIBRARY_PATH_ENV)
+        if custom_path:
+            try:
+                return ctypes.CDLL(custom_path)
+            except OSError as exc:
+                raise RuntimeError(
+                    f"Could not load SpaceController library at '{custom_path}': {exc}"
+                ) from exc
+
         if sys.platform != "win32":
             raise RuntimeError("This simple wrapper currently only supports Windows.")
 
@@ -113,18 +492,54 @@ class SpaceControllerDevice:
         ]
         self._lib.scFetchStdData.restype = ctypes.c_int
 
+        self._setup_fetch_buffer()
+
+    def _setup_fetch_buffer(self) -> None:
+        """Allocate the per-device buffer that scFetchStdData writes into."""
+        # Fetch buffer reused by every read: one Structure plus fixed typed
+        # pointers into its fields, so a poll doesn't build any ctypes objects.
+        buf = _StdDataBuffer()
+        self._fetch_buffer = buf
+        self._fetch_pointers = tuple(
+            ctypes.pointer(ctype.from_buffer(buf, getattr(_StdDataBuffer, name).offset))
+            for name, ctype in _StdDataBuffer._fields_
+        )
+        self._last_timestamp = 0.0
+
     # ------------------------------------------------------------------
     # Connection / device discovery
     # ------------------------------------------------------------------
-    def _connect_and_get_first_device(self, app_name: str) -> int:
-        """Connect to the SpaceControl daemon/driver and pick the first device."""
+    def _connect_and_select_device(self, app_name: str, index: int) -> int:
+        """Connect to the SpaceControl daemon/driver and check device `index` exists."""
+        start = time.perf_counter()
         result = self._lib.scConnect2(
             ctypes.c_bool(False),                      # don't use daemon (same as original plugin)
             ctypes.c_char_p(app_name.encode("ascii")), # identify as "Blender"
         )
+        self.startup_timings["connect"] = time.perf_counter() - start
         if result != 0:
             raise RuntimeError(f"scConnect2 failed with status {result}")
 
+        try:
+            start = time.perf_counter()
+            num_all = self._get_device_count()
+            self.startup_timings["device count"] = time.perf_counter() - start
+            if num_all <= 0:
+                raise RuntimeError("No SpaceController devices found.")
+            if index >= num_all:
+                raise RuntimeError(
+                    f"SpaceController device {index} not found ({num_all} connected)."
+                )
+        except RuntimeError:
+            # Don't leave the driver connected when no device can be used.
+            self._lib.scDisconnect()
+            raise
+
+        # The C API uses 0-based device indices.
+        return index
+
+    def _get_device_count(self) -> int:
+        """Call scGetDevNum and return the total number of devices."""
         num_all = ctypes.c_int()
         num_usb = ctypes.c_int()
         num_other = ctypes.c_int()
@@ -136,73 +551,76 @@ class SpaceControllerDevice:
         )
         if status != 0:
             raise RuntimeError(f"scGetDevNum failed with status {status}")
-
-        if num_all.value <= 0:
-            raise RuntimeError("No SpaceController devices found.")
-
-        # The C API uses 0-based device indices. We just take the first one.
-        return 0
+        return num_all.value
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
-    def read_state(self) -> Optional[SpaceControllerState]:
+    def read_state_into(self, state: SpaceControllerState) -> bool:
         """
-        Poll current state from the device.
+        Poll current state into an existing SpaceControllerState.
+
+        Uses the preallocated fetch buffer, so steady-state polling does not
+        create ctypes objects or a new state per call.
 
         Returns:
-            SpaceControllerState if new data was read, or None if there
-            was no new data / an error occurred.
+            True if `state` was updated with new data, False if there was
+            no new data / an error occurred (`state` is left untouched).
         """
-        if self._device_id is None:
-            return None
-
-        x = ctypes.c_short()
-        y = ctypes.c_short()
-        z = ctypes.c_short()
-        a = ctypes.c_short()
-        b = ctypes.c_short()
-        c = ctypes.c_short()
-        wheel = ctypes.c_int()
-        buttons = ctypes.c_int()
-        event = ctypes.c_int()
-        tv_sec = ctypes.c_long()
-        tv_usec = ctypes.c_long()
-
-        status = self._lib.scFetchStdData(
-            ctypes.c_int(self._device_id),
-            ctypes.byref(x),
-            ctypes.byref(y),
-            ctypes.byref(z),
-            ctypes.byref(a),
-            ctypes.byref(b),
-            ctypes.byref(c),
-            ctypes.byref(wheel),
-            ctypes.byref(buttons),
-            ctypes.byref(event),
-            ctypes.byref(tv_sec),
-            ctypes.byref(tv_usec),
-        )
+        # acquire() / release() rather than `with`: entering a `with` block
+        # allocates a bound __exit__ method on every fetch.
+        _driver_lock.acquire()
+        try:
+            device_id = self._device_id
+            if device_id is None:
+                return False
+            status = self._lib.scFetchStdData(device_id, *self._fetch_pointers)
+        finally:
+            _driver_lock.release()
 
         # According to the original code: status == 0 means "OK".
         if status != 0:
-            return None
-
-        return SpaceControllerState(
-            tx=float(x.value),
-            ty=float(y.value),
-            tz=float(z.value),
-            rx=float(a.value),
-            ry=float(b.value),
-            rz=float(c.value),
-            event=int(event.value),
-        )
+            return False
+
+        # A repeated device timestamp means the driver handed back the
+        # previous sample again, i.e. there is no new data.
+        buf = self._fetch_buffer
+        timestamp = buf.tv_sec + buf.tv_usec * 1e-6
+        if timestamp and timestamp == self._last_timestamp:
+            return False
+        self._last_timestamp = timestamp
+
+        state.tx = float(buf.x)
+        state.ty = float(buf.y)
+        state.tz = float(buf.z)
+        state.rx = float(buf.a)
+        state.ry = float(buf.b)
+        state.rz = float(buf.c)
+        state.event = buf.event
+        state.timestamp = timestamp
+        return True
+
+    def device_count(self) -> Optional[int]:
+        """Number of devices the driver currently reports, None once closed."""
+        with _driver_lock:
+            if self._device_id is None:
+                return None
+            return self._get_device_count()
 
     def close(self) -> None:
-        """Disconnect from the driver."""
-        try:
-            if hasattr(self, "_lib"):
+        """Disconnect from the driver (only the device owning the connection)."""
+        global _driver_connections
+        if not self._owns_connection:
+            self._device_id = None
+            return
+        with _driver_lock:
+            self._device_id = None
+            if not self._holds_connection:
+                return
+            self._holds_connection = False
+            _driver_connections -= 1
+            try:
                 self._lib.scDisconnect()
-        except Exception:
-            # We don't care if disconnect fails on shutdown.
-            pass
+            except Exception:
+                # We don't care if disconnect fails on shutdown.
+                pass
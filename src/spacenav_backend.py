@@ -0,0 +1,177 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+spacenavd input source (Linux / BSD).
+
+Talks the spacenavd client protocol directly over its Unix domain socket,
+so no vendor library is needed. Every event is eight native ints:
+
+    motion:          0, x, y, z, rx, ry, rz, period (ms since last motion)
+    button press:    1, button, 0, ...
+    button release:  2, button, 0, ...
+
+The socket is non-blocking. Events are received in batches into one reused
+buffer and decoded in place, so draining N events costs one recv() call
+(plus the final one that reports "no more data"), not one per event.
+"""
+
+from typing import Callable
+
+import socket
+import struct
+import time
+
+from .spacecontroller_device import BUTTON_BITS, DeviceBackend, SpaceControllerState
+
+DEFAULT_SOCKET_PATH = "/var/run/spnav.sock"
+
+EVENT = struct.Struct("8i")
+EVENT_MOTION = 0
+EVENT_BUTTON_PRESS = 1
+EVENT_BUTTON_RELEASE = 2
+
+_INTS_PER_EVENT = 8
+
+
+class SpacenavBackend(DeviceBackend):
+    """
+    Device connected through a running spacenavd.
+
+    Args:
+        socket_path: path of the spacenavd socket.
+        max_events:  events received per recv() call (buffer size).
+        clock:       time source used as the timestamp origin.
+
+    Motion events become samples with the six axes in device units and a
+    timestamp built from the accumulated event periods. Button events become
+    zero-motion samples; `event` carries the current button mask (bit n set
+    while button n is held) on every sample.
+    """
+
+    def __init__(
+        self,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        max_events: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__()
+        if max_events < 1:
+            raise ValueError("max_events must be at least 1")
+        self._socket_path = socket_path
+        self._clock = clock
+        self._sock: socket.socket | None = None
+
+        # Receive buffer: complete events are decoded straight from `_ints`.
+        self._buffer = bytearray(EVENT.size * max_events)
+        self._view = memoryview(self._buffer)
+        self._ints = self._view.cast("i")
+        self._head = 0      # index of the next event to decode
+        self._count = 0     # complete events in the buffer
+        self._filled = 0    # bytes in the buffer (may end in a partial event)
+
+        self._buttons = 0
+        self._time = 0.0
+        self.receives = 0   # recv() calls that returned data
+
+    def connect(self) -> None:
+        if self._sock is not None:
+            return
+        family = getattr(socket, "AF_UNIX", None)
+        if family is None:
+            raise RuntimeError("spacenavd needs Unix domain socket support.")
+
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            sock.connect(self._socket_path)
+        except OSError as exc:
+            sock.close()
+            raise RuntimeError(
+                f"Could not connect to spacenavd at {self._socket_path}: {exc}"
+            ) from exc
+        sock.setblocking(False)
+
+        self._sock = sock
+        self._head = self._count = self._filled = 0
+        self._buttons = 0
+        self._time = self._clock()
+        print(f"SpaceController: connected to spacenavd at {self._socket_path}")
+
+    def read_state_into(self, state: SpaceControllerState) -> bool:
+        if self._sock is None:
+            return False
+
+        ints = self._ints
+        while True:
+            if self._head >= self._count and not self._receive():
+                return False
+            base = self._head * _INTS_PER_EVENT
+            self._head += 1
+            kind = ints[base]
+
+            if kind == EVENT_MOTION:
+                state.tx = ints[base + 1]
+                state.ty = ints[base + 2]
+                state.tz = ints[base + 3]
+                state.rx = ints[base + 4]
+                state.ry = ints[base + 5]
+                state.rz = ints[base + 6]
+                self._time += ints[base + 7] * 0.001
+            elif kind == EVENT_BUTTON_PRESS or kind == EVENT_BUTTON_RELEASE:
+                button = ints[base + 1]
+                if 0 <= button < BUTTON_BITS:
+                    if kind == EVENT_BUTTON_PRESS:
+                        self._buttons |= 1 << button
+                    else:
+                        self._buttons &= ~(1 << button)
+                state.tx = state.ty = state.tz = 0.0
+                state.rx = state.ry = state.rz = 0.0
+            else:
+                continue  # unknown event type: skip it
+
+            state.event = self._buttons
+            state.timestamp = self._time
+            return True
+
+    def close(self) -> None:
+        sock = self._sock
+        self._sock = None
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Socket I/O
+    # ------------------------------------------------------------------
+    def _receive(self) -> bool:
+        """Refill the buffer with one recv(); returns False if nothing arrived."""
+        # Keep a trailing partial event: move it to the front and append.
+        consumed = self._count * EVENT.size
+        partial = self._filled - consumed
+        if partial and consumed:
+            self._view[:partial] = self._view[consumed:self._filled]
+        self._head = self._count = 0
+        self._filled = partial
+
+        try:
+            received = self._sock.recv_into(self._view[partial:])
+        except (BlockingIOError, InterruptedError):
+            return False
+        except OSError as exc:
+            raise RuntimeError(f"spacenavd connection failed: {exc}") from exc
+        if received == 0:
+            raise RuntimeError("spacenavd closed the connection.")
+
+        self.receives += 1
+        self._filled += received
+        self._count = self._filled // EVENT.size
+        return self._count > 0
@@ -0,0 +1,213 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+UDP input source for remote 6-DOF streams.
+
+A machine with the mouse (or any tool) sends one datagram per sample to the
+Blender session. Two encodings are accepted:
+
+- binary: b"SC6D" followed by a recording record (see recording.py):
+  int64 timestamp (microseconds), int32 buttons, six int16 axes;
+- OSC: a message to `address` with type tags ",ffffffi" (six axes and the
+  buttons) or ",ffffff".
+
+Every poll drains all queued datagrams with recv_into() on a non-blocking
+socket and one reused buffer, and reports a single sample: the newest one
+('LATEST') or the sum of all of them ('INTEGRATE').
+"""
+
+from typing import Optional
+
+import socket
+import struct
+
+from .recording import RECORD, _axis
+from .spacecontroller_device import DeviceBackend, SpaceControllerState
+
+DEFAULT_PORT = 57130
+DEFAULT_OSC_ADDRESS = "/spacecontroller"
+
+MAGIC = b"SC6D"
+PACKET = struct.Struct("<4s" + RECORD.format.lstrip("<"))
+_OSC_AXES_BUTTONS = struct.Struct(">6fi")
+_OSC_AXES = struct.Struct(">6f")
+
+MODE_LATEST = 'LATEST'
+MODE_INTEGRATE = 'INTEGRATE'
+
+
+def _osc_string(text: str) -> bytes:
+    """OSC string: ASCII, NUL-terminated, padded to a multiple of 4 bytes."""
+    data = text.encode("ascii") + b"\0"
+    return data + b"\0" * (-len(data) % 4)
+
+
+def encode_binary(state: SpaceControllerState) -> bytes:
+    return PACKET.pack(
+        MAGIC,
+        int(round(state.timestamp * 1e6)),
+        state.event,
+        _axis(state.tx), _axis(state.ty), _axis(state.tz),
+        _axis(state.rx), _axis(state.ry), _axis(state.rz),
+    )
+
+
+def encode_osc(state: SpaceControllerState, address: str = DEFAULT_OSC_ADDRESS) -> bytes:
+    return _osc_string(address) + _osc_string(",ffffffi") + _OSC_AXES_BUTTONS.pack(
+        state.tx, state.ty, state.tz, state.rx, state.ry, state.rz, state.event,
+    )
+
+
+def send_state(
+    sock: socket.socket,
+    target: tuple[str, int],
+    state: SpaceControllerState,
+    osc: bool = False,
+) -> None:
+    """Send one sample to a UdpBackend listening at `target` (host, port)."""
+    sock.sendto(encode_osc(state) if osc else encode_binary(state), target)
+
+
+class UdpBackend(DeviceBackend):
+    """
+    Samples received as UDP datagrams.
+
+    Args:
+        host:        address to bind ("127.0.0.1" = this machine only,
+                     "0.0.0.0" = all interfaces).
+        port:        UDP port to bind.
+        mode:        'LATEST' keeps the newest datagram of a poll (pairs well
+                     with frame-rate independent motion); 'INTEGRATE' sums
+                     the axes of all of them, like the timer sums a batch.
+        osc_address: OSC address pattern samples are sent to.
+
+    Datagrams that are neither encoding are counted in `invalid` and ignored.
+    Samples without a timestamp (OSC) have timestamp 0.0.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        mode: str = MODE_LATEST,
+        osc_address: str = DEFAULT_OSC_ADDRESS,
+        buffer_size: int = 512,
+    ):
+        super().__init__()
+        if mode not in (MODE_LATEST, MODE_INTEGRATE):
+            raise ValueError(f"unknown mode {mode!r}")
+        self._address = (host, port)
+        self._integrate = mode == MODE_INTEGRATE
+        self._sock: Optional[socket.socket] = None
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+
+        address = _osc_string(osc_address)
+        self._osc_full = address + _osc_string(",ffffffi")
+        self._osc_axes = address + _osc_string(",ffffff")
+
+        self.datagrams = 0  # valid datagrams received
+        self.invalid = 0
+
+    @property
+    def port(self) -> int:
+        """Bound port (useful with port 0 = any free port)."""
+        if self._sock is None:
+            return self._address[1]
+        return self._sock.getsockname()[1]
+
+    def connect(self) -> None:
+        if self._sock is not None:
+            return
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.bind(self._address)
+        except OSError as exc:
+            sock.close()
+            raise RuntimeError(
+                f"Could not listen on UDP {self._address[0]}:{self._address[1]}: {exc}"
+            ) from exc
+        sock.setblocking(False)
+        self._sock = sock
+        print(f"SpaceController: listening on UDP {self._address[0]}:{self.port}")
+
+    def read_state_into(self, state: SpaceControllerState) -> bool:
+        sock = self._sock
+        if sock is None:
+            return False
+
+        recv_into = sock.recv_into
+        buffer = self._buffer
+        integrate = self._integrate
+        received = 0
+        sample = None
+        tx = ty = tz = rx = ry = rz = 0.0
+        while True:
+            try:
+                size = recv_into(buffer)
+            except (BlockingIOError, InterruptedError):
+                break
+            except ConnectionResetError:
+                continue    # Windows reports ICMP errors of earlier datagrams
+            except OSError as exc:
+                raise RuntimeError(f"UDP receive failed: {exc}") from exc
+
+            decoded = self._decode(size)
+            if decoded is None:
+                self.invalid += 1
+                continue
+            sample = decoded
+            received += 1
+            if integrate:
+                tx += decoded[0]
+                ty += decoded[1]
+                tz += decoded[2]
+                rx += decoded[3]
+                ry += decoded[4]
+                rz += decoded[5]
+
+        if sample is None:
+            return False
+        self.datagrams += received
+        if integrate:
+            state.tx, state.ty, state.tz, state.rx, state.ry, state.rz = tx, ty, tz, rx, ry, rz
+        else:
+            state.tx, state.ty, state.tz, state.rx, state.ry, state.rz = sample[:6]
+        state.event = sample[6]
+        state.timestamp = sample[7]
+        return True
+
+    def close(self) -> None:
+        sock = self._sock
+        self._sock = None
+        if sock is not None:
+            sock.close()
+
+    # ------------------------------------------------------------------
+    # Decoding
+    # ------------------------------------------------------------------
+    def _decode(self, size: int) -> Optional[tuple]:
+        """(tx, ty, tz, rx, ry, rz, buttons, timestamp) of the datagram, or None."""
+        buffer = self._buffer
+        view = self._view
+        if size == PACKET.size and view[:4] == MAGIC:
+            _, usec, event, tx, ty, tz, rx, ry, rz = PACKET.unpack_from(buffer)
+            return tx, ty, tz, rx, ry, rz, event, usec * 1e-6
+
+        header = self._osc_full
+        if size == len(header) + _OSC_AXES_BUTTONS.size and view[:len(header)] == header:
+            tx, ty, tz, rx, ry, rz, event = _OSC_AXES_BUTTONS.unpack_from(buffer, len(header))
+            return tx, ty, tz, rx, ry, rz, event, 0.0
+        header = self._osc_axes
+        if size == len(header) + _OSC_AXES.size and view[:len(header)] == header:
+            tx, ty, tz, rx, ry, rz = _OSC_AXES.unpack_from(buffer, len(header))
+            return tx, ty, tz, rx, ry, rz, 0, 0.0
+        return None
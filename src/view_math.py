@@ -0,0 +1,289 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+
+"""
+Pure-Python math for turning controller samples into view motion.
+
+No bpy / mathutils imports, so everything here also runs outside Blender.
+"""
+
+from array import array
+from math import cos, sin, sqrt
+from typing import List, Optional, Sequence, Tuple
+
+from .spacecontroller_device import SpaceControllerBatch, SpaceControllerState
+
+# Input axes (device) and output axes (view space) of an AxisMapping.
+DEVICE_AXES = ("tx", "ty", "tz", "rx", "ry", "rz")
+VIEW_AXES = ("right", "up", "forward", "pitch", "yaw", "roll")
+
+Matrix6 = Tuple[Tuple[float, ...], ...]
+
+
+class AxisMapping:
+    """
+    6x6 matrix from raw device axes (tx, ty, tz, rx, ry, rz) to view motion
+    (right, up, forward, pitch, yaw, roll).
+
+    Inversion, sensitivity, axis swaps and cross-axis coupling are all folded
+    into the matrix once, so mapping a sample is a single matrix-vector
+    product, written out so that it builds no temporaries. The mapping is
+    linear, so a batch is mapped by mapping its sum (or mean) once.
+    """
+
+    __slots__ = ("matrix",)
+
+    def __init__(self, matrix: Sequence[Sequence[float]]):
+        if len(matrix) != 6 or any(len(row) != 6 for row in matrix):
+            raise ValueError("axis mapping must be a 6x6 matrix")
+        self.matrix: Matrix6 = tuple(tuple(float(v) for v in row) for row in matrix)
+
+    @classmethod
+    def compile(
+        cls,
+        move_scale: float,
+        rotate_scale: float,
+        invert: Sequence[bool] = (False,) * 6,
+        source_axes: Sequence[int] = (0, 1, 2, 3, 4, 5),
+        coupling: Optional[Sequence[Sequence[float]]] = None,
+        enable_rotation: bool = True,
+    ) -> "AxisMapping":
+        """
+        Build a mapping from settings.
+
+        Args:
+            move_scale / rotate_scale: sensitivity of rows 0-2 / 3-5.
+            invert:       per output axis, flip its sign.
+            source_axes:  output axis i reads device axis source_axes[i]
+                          (a permutation, e.g. (0, 2, 1, 3, 5, 4) swaps Y/Z).
+            coupling:     optional 6x6 matrix added before scaling, to mix a
+                          fraction of one device axis into another output.
+            enable_rotation: if False, the rotation rows are zero.
+        """
+        if sorted(source_axes) != list(range(6)):
+            raise ValueError("source_axes must be a permutation of 0..5")
+        rows: List[List[float]] = []
+        for i in range(6):
+            row = [1.0 if j == source_axes[i] else 0.0 for j in range(6)]
+            if coupling is not None:
+                row = [v + c for v, c in zip(row, coupling[i])]
+            scale = move_scale if i < 3 else (rotate_scale if enable_rotation else 0.0)
+            if invert[i]:
+                scale = -scale
+            rows.append([v * scale for v in row])
+        return cls(rows)
+
+    def map(self, state: SpaceControllerState) -> Tuple[float, ...]:
+        """Map one sample: (right, up, forward, pitch, yaw, roll)."""
+        tx, ty, tz = state.tx, state.ty, state.tz
+        rx, ry, rz = state.rx, state.ry, state.rz
+        a, b, c, d, e, f = self.matrix
+        return (
+            a[0] * tx + a[1] * ty + a[2] * tz + a[3] * rx + a[4] * ry + a[5] * rz,
+            b[0] * tx + b[1] * ty + b[2] * tz + b[3] * rx + b[4] * ry + b[5] * rz,
+            c[0] * tx + c[1] * ty + c[2] * tz + c[3] * rx + c[4] * ry + c[5] * rz,
+            d[0] * tx + d[1] * ty + d[2] * tz + d[3] * rx + d[4] * ry + d[5] * rz,
+            e[0] * tx + e[1] * ty + e[2] * tz + e[3] * rx + e[4] * ry + e[5] * rz,
+            f[0] * tx + f[1] * ty + f[2] * tz + f[3] * rx + f[4] * ry + f[5] * rz,
+        )
+
+
+# ---------------------------------------------------------------------------
+# In-place view integration (no mathutils temporaries)
+# ---------------------------------------------------------------------------
+
+class ViewIntegrator:
+    """
+    Applies view-space motion to a view rotation / location in place.
+
+    Works on anything with w/x/y/z (quaternion) and x/y/z (vector) float
+    attributes, e.g. mathutils.Quaternion / Vector, using plain float math:
+    no Vector, Euler or intermediate Quaternion objects are created per tick.
+    The quaternion is renormalised every `renormalize_every` rotations to
+    keep floating-point drift bounded.
+    """
+
+    __slots__ = ("renormalize_every", "_steps")
+
+    def __init__(self, renormalize_every: int = 32):
+        self.renormalize_every = renormalize_every
+        self._steps = 0
+
+    @staticmethod
+    def translate(q, loc, right: float, up: float, forward: float) -> None:
+        """loc += q @ (right, up, forward), i.e. move in view space."""
+        w, qx, qy, qz = q.w, q.x, q.y, q.z
+        # v' = v + w * t + u x t, with t = 2 * (u x v)
+        tx = 2.0 * (qy * forward - qz * up)
+        ty = 2.0 * (qz * right - qx * forward)
+        tz = 2.0 * (qx * up - qy * right)
+        loc.x += right + w * tx + (qy * tz - qz * ty)
+        loc.y += up + w * ty + (qz * tx - qx * tz)
+        loc.z += forward + w * tz + (qx * ty - qy * tx)
+
+    def rotate(self, q, pitch: float, yaw: float, roll: float) -> None:
+        """q = q @ Euler((pitch, yaw, roll), 'XYZ').to_quaternion(), in place."""
+        hx, hy, hz = 0.5 * pitch, 0.5 * yaw, 0.5 * roll
+        cx, sx = cos(hx), sin(hx)
+        cy, sy = cos(hy), sin(hy)
+        cz, sz = cos(hz), sin(hz)
+        # Delta quaternion of an XYZ Euler rotation (Z @ Y @ X).
+        dw = cx * cy * cz + sx * sy * sz
+        dx = sx * cy * cz - cx * sy * sz
+        dy = cx * sy * cz + sx * cy * sz
+        dz = cx * cy * sz - sx * sy * cz
+
+        w, x, y, z = q.w, q.x, q.y, q.z
+        nw = w * dw - x * dx - y * dy - z * dz
+        nx = w * dx + x * dw + y * dz - z * dy
+        ny = w * dy - x * dz + y * dw + z * dx
+        nz = w * dz + x * dy - y * dx + z * dw
+
+        self._steps += 1
+        if self._steps >= self.renormalize_every:
+            self._steps = 0
+            inv = 1.0 / sqrt(nw * nw + nx * nx + ny * ny + nz * nz)
+            nw *= inv
+            nx *= inv
+            ny *= inv
+            nz *= inv
+
+        q.w = nw
+        q.x = nx
+        q.y = ny
+        q.z = nz
+
+
+# ---------------------------------------------------------------------------
+# Response curves (lookup tables over the 16-bit axis range)
+# ---------------------------------------------------------------------------
+
+RESPONSE_CURVES = ('LINEAR', 'DEADZONE', 'EXPONENTIAL', 'S_CURVE', 'CUSTOM')
+
+TABLE_SIZE = 1 << 16
+
+
+def _curve_function(curve: str, deadzone: float, exponent: float,
+                    points: Sequence[Tuple[float, float]]):
+    """Return g: [0, 1] -> [0, 1] with g(1) == 1 for the given settings."""
+    span = 1.0 - deadzone
+
+    def dead(u: float) -> float:
+        return 0.0 if u <= deadzone else (u - deadzone) / span
+
+    if curve == 'EXPONENTIAL':
+        return lambda u: dead(u) ** exponent
+    if curve == 'S_CURVE':
+        def s_curve(u: float) -> float:
+            w = dead(u)
+            a = w ** exponent
+            b = (1.0 - w) ** exponent
+            return a / (a + b) if a + b else 0.0
+        return s_curve
+    if curve == 'CUSTOM':
+        knots = [(0.0, 0.0)] + sorted((float(x), float(y)) for x, y in points) + [(1.0, 1.0)]
+
+        def custom(u: float) -> float:
+            w = dead(u)
+            for (x0, y0), (x1, y1) in zip(knots, knots[1:]):
+                if w <= x1:
+                    return y0 if x1 <= x0 else y0 + (y1 - y0) * (w - x0) / (x1 - x0)
+            return 1.0
+        return custom
+    # LINEAR / DEADZONE
+    return dead
+
+
+def build_response_table(
+    curve: str = 'LINEAR',
+    deadzone: float = 0.0,
+    exponent: float = 2.0,
+    points: Sequence[Tuple[float, float]] = (),
+    full_scale: float = 350.0,
+) -> array:
+    """
+    Precompute a response curve for every 16-bit axis value.
+
+    The table is indexed by the value's two's-complement bit pattern, i.e.
+    `table[table_index(v)]`. Values are normalised by `full_scale` (the
+    device's nominal maximum deflection), shaped by the curve and scaled back,
+    so full deflection keeps its magnitude and the sensitivity settings stay
+    meaningful. Beyond full scale the response continues linearly.
+
+    Args:
+        curve:    one of RESPONSE_CURVES.
+        deadzone: fraction of full scale that maps to zero.
+        exponent: shape of 'EXPONENTIAL' / 'S_CURVE'.
+        points:   (input, output) pairs in [0, 1] for 'CUSTOM', piecewise
+                  linear between (0, 0) and (1, 1).
+    """
+    if curve not in RESPONSE_CURVES:
+        raise ValueError(f"unknown response curve {curve!r}")
+    if not 0.0 <= deadzone < 1.0:
+        raise ValueError("deadzone must be in [0, 1)")
+    g = _curve_function(curve, deadzone, exponent, points)
+
+    half = TABLE_SIZE // 2
+    positive = [0.0] * (half + 1)   # response for magnitudes 0 .. 32768
+    for v in range(half + 1):
+        u = v / full_scale
+        positive[v] = full_scale * (g(u) if u <= 1.0 else u)
+
+    table = array("d", bytes(8 * TABLE_SIZE))
+    for i in range(TABLE_SIZE):
+        v = i if i < half else i - TABLE_SIZE
+        table[i] = positive[v] if v >= 0 else -positive[-v]
+    return table
+
+
+def table_index(v: float) -> int:
+    """Round `v`, clamp it to the 16-bit range and return its table index."""
+    if -32768.0 < v < 32767.0:
+        return round(v) & 0xFFFF
+    if v >= 32767.0:
+        return 32767
+    if v <= -32768.0:
+        return 32768
+    return 0    # NaN
+
+
+class ResponseCurves:
+    """
+    Per-axis response lookup tables (tx, ty, tz, rx, ry, rz).
+
+    Applying a curve is one table index per axis value. Axes with identical
+    settings share a table.
+    """
+
+    __slots__ = ("tables",)
+
+    def __init__(self, tables: Sequence[array]):
+        if len(tables) != 6:
+            raise ValueError("need one table per axis")
+        self.tables = tuple(tables)
+
+    def apply(self, state: SpaceControllerState) -> None:
+        """Shape the six axes of `state` in place."""
+        t = self.tables
+        index = table_index
+        state.tx = t[0][index(state.tx)]
+        state.ty = t[1][index(state.ty)]
+        state.tz = t[2][index(state.tz)]
+        state.rx = t[3][index(state.rx)]
+        state.ry = t[4][index(state.ry)]
+        state.rz = t[5][index(state.rz)]
+
+    def apply_batch(self, batch: SpaceControllerBatch) -> None:
+        """Shape every axis value of `batch` in place."""
+        axes = batch.axes
+        index = table_index
+        for j, table in enumerate(self.tables):
+            for k in range(j, len(axes), 6):
+                axes[k] = table[index(axes[k])]
@@ -0,0 +1,53 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""
+Shared fixtures.
+
+Add-on modules are imported through benchmarks/_addon.py (without the
+Blender-only `__init__.py`); the full add-on runs in the headless harness
+(benchmarks/harness.py).
+
+Run from the repository root:
+
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks._addon import addon_module  # noqa: E402
+from benchmarks.harness import HeadlessBlender  # noqa: E402
+
+
+@pytest.fixture
+def device_module():
+    return addon_module("spacecontroller_device")
+
+
+@pytest.fixture
+def blender():
+    """A registered add-on in a headless session; the caller picks the backend."""
+    with HeadlessBlender() as session:
+        yield session
+
+
+@pytest.fixture
+def simulated_blender(blender):
+    """Headless session polling the simulated backend at one sample per fetch."""
+    blender.prefs.backend = 'SIMULATED'
+    blender.prefs.simulated_rate = 0.0
+    blender.wait_for_device()
+    return blender
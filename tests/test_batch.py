@@ -0,0 +1,89 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Time-weighted integration of a SpaceControllerBatch."""
+
+import random
+
+import pytest
+
+REFERENCE_DT = 1 / 60
+MAX_DT = 0.1
+
+AXES = ("tx", "ty", "tz", "rx", "ry", "rz")
+
+
+def _axes(state):
+    return tuple(getattr(state, axis) for axis in AXES)
+
+
+def _samples(device_module, timestamps, seed=1):
+    rng = random.Random(seed)
+    return [
+        device_module.SpaceControllerState(
+            **{axis: float(rng.randint(-350, 350)) for axis in AXES},
+            event=i, timestamp=t,
+        )
+        for i, t in enumerate(timestamps)
+    ]
+
+
+def _batch(device_module, samples):
+    batch = device_module.SpaceControllerBatch()
+    for sample in samples:
+        batch.append(sample)
+    return batch
+
+
+def _integrate_one_by_one(device_module, samples, previous):
+    """Integrate every sample as a batch of its own and sum the results."""
+    total = [0.0] * 6
+    state = device_module.SpaceControllerState()
+    for sample in samples:
+        previous = _batch(device_module, [sample]).integrate_into(state, previous, REFERENCE_DT, MAX_DT)
+        total = [a + b for a, b in zip(total, _axes(state))]
+    return tuple(total), previous
+
+
+@pytest.mark.parametrize("previous, timestamps", [
+    (0.0, [0.01 * (i + 1) for i in range(10)]),          # no previous timestamp
+    (1.0, [1.0 + 0.004 * (i + 1) for i in range(10)]),   # faster than the reference
+    (1.0, [1.5, 1.51, 1.52]),                            # gap clamped to MAX_DT
+    (1.0, [1.02, 1.01, 1.03]),                           # out of order
+    (1.0, [1.02, 0.0, 1.04, 0.0]),                       # samples without timestamps
+])
+def test_integrating_a_batch_matches_summing_its_samples(device_module, previous, timestamps):
+    samples = _samples(device_module, timestamps)
+    state = device_module.SpaceControllerState()
+    last = _batch(device_module, samples).integrate_into(state, previous, REFERENCE_DT, MAX_DT)
+    expected, expected_last = _integrate_one_by_one(device_module, samples, previous)
+    assert _axes(state) == pytest.approx(expected)
+    assert last == expected_last
+    assert state.event == samples[-1].event
+    assert state.timestamp == timestamps[-1]
+
+
+def test_sample_weights(device_module):
+    samples = [
+        device_module.SpaceControllerState(tx=1.0, timestamp=t)
+        for t in (1.0 + REFERENCE_DT / 2, 0.0, 2.0, 1.5)
+    ]
+    state = device_module.SpaceControllerState()
+    last = _batch(device_module, samples).integrate_into(state, 1.0, REFERENCE_DT, MAX_DT)
+    # Half an interval, no timestamp, a clamped gap, a step back in time.
+    assert state.tx == pytest.approx(0.5 + 1.0 + MAX_DT / REFERENCE_DT + 0.0)
+    assert last == 1.5
+
+
+def test_empty_batch_leaves_the_state_alone(device_module):
+    state = device_module.SpaceControllerState(tx=3.0, rz=-2.0, event=4, timestamp=7.0)
+    batch = device_module.SpaceControllerBatch()
+    assert batch.integrate_into(state, 1.25, REFERENCE_DT, MAX_DT) == 1.25
+    assert (_axes(state), state.event, state.timestamp) == ((3.0, 0.0, 0.0, 0.0, 0.0, -2.0), 4, 7.0)
+    assert _integrate_one_by_one(device_module, [], 1.25) == ((0.0,) * 6, 1.25)
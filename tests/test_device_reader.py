@@ -0,0 +1,115 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Background reader thread, ring buffer, and closing a device it is stuck in."""
+
+import threading
+
+import pytest
+
+from benchmarks._addon import addon_module
+
+
+@pytest.fixture
+def reader_module():
+    return addon_module("device_reader")
+
+
+class StallingBackend(addon_module("spacecontroller_device").DeviceBackend):
+    """Returns one sample per fetch until `stall` is set, then blocks in the fetch."""
+
+    def __init__(self):
+        super().__init__()
+        self.stall = threading.Event()
+        self.stalled = threading.Event()    # a fetch is blocked right now
+        self.release = threading.Event()
+        self.closed = False
+        self.closed_during_fetch = False
+
+    def connect(self) -> None:
+        pass
+
+    def read_state_into(self, state) -> bool:
+        if self.stall.is_set():
+            self.stalled.set()
+            self.release.wait(5.0)
+            self.stalled.clear()
+            return False
+        state.tx = 1.0
+        return True
+
+    def close(self) -> None:
+        self.closed_during_fetch = self.stalled.is_set()
+        self.closed = True
+
+
+def test_ring_buffer_overwrites_the_oldest(reader_module, device_module):
+    ring = reader_module.SampleRingBuffer(capacity=4)
+    state = device_module.SpaceControllerState()
+    for i in range(6):
+        state.tx = float(i)
+        ring.push(state)
+    batch = device_module.SpaceControllerBatch()
+    assert ring.drain_into(batch) == 4
+    assert list(batch.axes[0::6]) == [2.0, 3.0, 4.0, 5.0]
+    assert (ring.dropped, ring.overflows) == (2, 1)
+
+
+def test_stalled_reader_closes_the_device_when_the_call_returns(reader_module):
+    device = StallingBackend()
+    reader = reader_module.DeviceReaderThread(device, reader_module.SampleRingBuffer(16))
+    reader.start()
+    device.stall.set()
+    assert device.stalled.wait(2.0)
+
+    assert not reader.stop(timeout=0.05)
+    assert reader.close_on_exit(device)
+    assert not device.closed
+
+    device.release.set()
+    reader.join(2.0)
+    assert device.closed
+    assert not device.closed_during_fetch
+
+
+def test_close_on_exit_refused_after_exit(reader_module):
+    device = StallingBackend()
+    reader = reader_module.DeviceReaderThread(device, reader_module.SampleRingBuffer(16))
+    reader.start()
+    assert reader.stop()
+    assert not reader.close_on_exit(device)
+
+
+def test_addon_does_not_close_a_device_in_use(blender, monkeypatch):
+    addon = blender.addon
+    device = StallingBackend()
+    monkeypatch.setattr(addon, "_make_backend_opener", lambda: lambda: [device])
+    blender.prefs.use_reader_thread = True
+    blender.wait_for_device()
+    blender.tick()   # starts the reader
+    assert addon._reader is not None
+
+    device.stall.set()
+    assert device.stalled.wait(2.0)
+    addon._connector.report_lost(RuntimeError("test"))
+    addon._close_device()
+    assert not device.closed
+
+    # No new connection while the old one is still in use.
+    addon._connector.reset()
+    blender.tick()
+    assert addon._connector.state == 'BACKOFF'
+
+    device.release.set()
+    for _ in range(200):
+        if device.closed:
+            break
+        threading.Event().wait(0.01)
+    assert device.closed
+    assert not device.closed_during_fetch
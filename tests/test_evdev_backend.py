@@ -0,0 +1,73 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""EvdevBackend fed with a file of recorded input_event structs."""
+
+import pytest
+
+from benchmarks._addon import addon_module
+from benchmarks.bench_evdev import frame
+
+
+@pytest.fixture
+def ev():
+    return addon_module("evdev_backend")
+
+
+def _samples(backend, state_cls) -> list[tuple]:
+    state = state_cls()
+    out = []
+    while backend.read_state_into(state):
+        out.append((state.tx, state.ty, state.tz, state.rx, state.ry, state.rz,
+                    state.event, round(state.timestamp, 6)))
+    return out
+
+
+@pytest.fixture
+def events_file(ev, tmp_path):
+    abs_, rel, key = ev.EV_ABS, ev.EV_REL, ev.EV_KEY
+    path = tmp_path / "events.bin"
+    path.write_bytes(
+        frame(ev, 10.0, (abs_, 0, 100), (abs_, 5, -50), (rel, 2, 7))
+        + frame(ev, 10.01, (abs_, 1, 20), (key, ev.BTN_MISC + 1, 1))
+        + frame(ev, 10.02)   # empty frame: no sample
+        + ev.INPUT_EVENT.pack(10, 30000, ev.EV_SYN, ev.SYN_DROPPED, 0)
+        + frame(ev, 10.03, (abs_, 0, 999))   # discarded
+        + frame(ev, 10.04, (rel, 3, -4), (key, ev.BTN_MISC + 1, 0))
+    )
+    return str(path)
+
+
+def test_frames_fold_into_samples(ev, device_module, events_file):
+    backend = ev.EvdevBackend(events_file, clock=lambda: 99.0)
+    backend.connect()
+    state_cls = device_module.SpaceControllerState
+
+    # Absolute axes persist, relative axes reset per SYN_REPORT.
+    assert _samples(backend, state_cls) == [
+        (100, 0, 7, 0, 0, -50, 0, 10.0),
+        (100, 20, 0, 0, 0, -50, 2, 10.01),
+        (100, 20, 0, -4, 0, -50, 0, 10.04),
+    ]
+    assert backend.dropped == 1
+    assert backend.reads == 1
+
+    # Later drains without new frames repeat the held position once each.
+    held = [(100, 20, 0, 0, 0, -50, 0, 99.0)]
+    assert _samples(backend, state_cls) == held
+    assert _samples(backend, state_cls) == held
+    backend.close()
+
+
+def test_held_position_not_repeated_when_disabled(ev, device_module, events_file):
+    backend = ev.EvdevBackend(events_file, repeat_held=False)
+    backend.connect()
+    _samples(backend, device_module.SpaceControllerState)
+    assert _samples(backend, device_module.SpaceControllerState) == []
+    backend.close()
@@ -0,0 +1,82 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""HidrawBackend fed with recorded report bytes from files and pipes."""
+
+import os
+
+import pytest
+
+from benchmarks._addon import addon_module
+from benchmarks.bench_hidraw import (
+    buttons_report, combined_report, rotation_report, translation_report,
+)
+
+
+@pytest.fixture
+def hid():
+    return addon_module("hid_backend")
+
+
+def _samples(backend, state_cls) -> list[tuple]:
+    state = state_cls()
+    out = []
+    while backend.read_state_into(state):
+        out.append((state.tx, state.ty, state.tz, state.rx, state.ry, state.rz, state.event))
+    return out
+
+
+def test_split_layout_from_a_file(hid, device_module, tmp_path):
+    path = tmp_path / "reports.bin"
+    path.write_bytes(
+        translation_report(10, -20, 300)
+        + rotation_report(-1, 2, -350)
+        + buttons_report(0b101)
+        + translation_report(5, 0, 0)
+        + rotation_report(0, 0, 7)
+    )
+    backend = hid.HidrawBackend(str(path))
+    backend.connect()
+    got = _samples(backend, device_module.SpaceControllerState)
+    backend.close()
+
+    assert got == [
+        (10, -20, 300, -1, 2, -350, 0),
+        (0, 0, 0, 0, 0, 0, 5),
+        (5, 0, 0, 0, 0, 7, 5),
+    ]
+    assert backend.reads == 1
+
+
+def test_combined_layout_skips_unknown_reports(hid, device_module, tmp_path):
+    path = tmp_path / "reports.bin"
+    path.write_bytes(combined_report(1, 2, 3, 4, 5, 6) + b"\x09garbage")
+    backend = hid.HidrawBackend(str(path), combined=True)
+    backend.connect()
+    got = _samples(backend, device_module.SpaceControllerState)
+    backend.close()
+
+    assert got == [(1, 2, 3, 4, 5, 6, 0)]
+    assert backend.skipped == 8
+
+
+def test_report_split_across_pipe_writes(hid, device_module):
+    read_fd, write_fd = os.pipe()
+    try:
+        backend = hid.HidrawBackend(read_fd)
+        backend.connect()
+        report = translation_report(7, 8, 9) + rotation_report(1, 1, 1)
+        os.write(write_fd, report[:5])
+        assert _samples(backend, device_module.SpaceControllerState) == []
+        os.write(write_fd, report[5:])
+        assert _samples(backend, device_module.SpaceControllerState) == [(7, 8, 9, 1, 1, 1, 0)]
+        backend.close()
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
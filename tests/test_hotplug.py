@@ -0,0 +1,69 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Hot-plug watcher, and handing the probe over when the device closes."""
+
+import threading
+
+from benchmarks._addon import addon_module
+
+
+def test_watcher_flags_a_changed_count():
+    counts = iter([1, 1, 2])
+    probed = threading.Event()
+
+    def probe():
+        count = next(counts, None)
+        if count is None:
+            probed.set()
+        return count
+
+    watcher = addon_module("hotplug").HotplugWatcher(interval=0.001)
+    watcher.set_probe(probe)
+    watcher.start()
+    try:
+        assert probed.wait(2.0)
+    finally:
+        watcher.stop()
+    assert watcher.consume()
+    assert watcher.count == 2
+    assert not watcher.consume()
+
+
+class ProbedBackend(addon_module("spacecontroller_device").DeviceBackend):
+    """Remembers which probe the add-on's watcher held when it was closed."""
+
+    def __init__(self, watcher):
+        super().__init__()
+        self._watcher = watcher
+        self.closed = False
+        self.probe_at_close = "not closed"
+
+    def connect(self) -> None:
+        pass
+
+    def read_state_into(self, state) -> bool:
+        return False
+
+    def close(self) -> None:
+        self.probe_at_close = self._watcher._probe
+        self.closed = True
+
+
+def test_probe_is_dropped_before_the_device_closes(blender, monkeypatch):
+    addon = blender.addon
+    device = ProbedBackend(addon._hotplug)
+    monkeypatch.setattr(addon, "_make_backend_opener", lambda: lambda: [device])
+    blender.wait_for_device()
+    assert addon._hotplug._probe == device.device_count
+
+    addon._connector.report_lost(RuntimeError("test"))
+    addon._close_device()
+    assert device.closed
+    assert device.probe_at_close is None
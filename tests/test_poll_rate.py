@@ -0,0 +1,93 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Idle backoff and the sample-rate estimator behind the adaptive poll interval."""
+
+import pytest
+
+from benchmarks._addon import addon_module
+
+MIN_INTERVAL = 0.002
+MAX_INTERVAL = 0.05
+
+
+@pytest.fixture
+def poll_rate():
+    return addon_module("poll_rate")
+
+
+def test_idle_backoff_ramps_up_and_snaps_back(poll_rate):
+    backoff = poll_rate.IdlePollBackoff(active_interval=0.01, idle_interval=0.1, grace_ticks=3)
+    assert [backoff.next_interval(False) for _ in range(3)][-1] > 0.01
+    for _ in range(50):
+        backoff.next_interval(False)
+    assert backoff.idle
+    assert backoff.interval == 0.1
+    assert backoff.next_interval(True) == 0.01
+    assert not backoff.idle
+
+
+def _scripted(poll_rate, rate_hz: float, queued: bool, timestamps: bool, seconds: float = 5.0):
+    """Poll a device of `rate_hz` on a scripted clock; returns the estimator."""
+    estimator = poll_rate.SampleRateEstimator()
+    now = 0.0
+    last = 0
+    while now < seconds:
+        now += estimator.interval
+        produced = int(now * rate_hz)
+        new = list(range(last + 1, produced + 1))
+        last = produced
+        if not queued:
+            new = new[-1:]
+        stamps = [index / rate_hz if timestamps else 0.0 for index in new]
+        estimator.observe(stamps, len(new), now, MIN_INTERVAL, MAX_INTERVAL)
+    return estimator
+
+
+@pytest.mark.parametrize("rate_hz", [60.0, 125.0, 250.0])
+@pytest.mark.parametrize("queued", [True, False], ids=["queued", "newest-only"])
+@pytest.mark.parametrize("timestamps", [True, False], ids=["timestamps", "untimed"])
+def test_estimates_the_device_rate(poll_rate, rate_hz, queued, timestamps):
+    estimator = _scripted(poll_rate, rate_hz, queued, timestamps)
+    assert estimator.rate == pytest.approx(rate_hz, rel=0.02 if timestamps else 0.15)
+    assert 1.0 / estimator.interval == pytest.approx(rate_hz, rel=0.25)
+
+
+def test_interval_is_clamped_to_the_bounds(poll_rate):
+    estimator = _scripted(poll_rate, 1000.0, True, True)
+    assert estimator.rate == pytest.approx(1000.0)
+    assert estimator.interval == MIN_INTERVAL
+
+
+def test_inverted_bounds_are_rejected(poll_rate):
+    with pytest.raises(ValueError):
+        poll_rate.SampleRateEstimator().observe([], 0, 1.0, MAX_INTERVAL, MIN_INTERVAL)
+
+
+def test_preferences_keep_the_bounds_ordered(blender):
+    prefs = blender.prefs
+    prefs.min_poll_interval = 0.05
+    assert prefs.max_poll_interval == 0.05
+    prefs.max_poll_interval = 0.003
+    assert prefs.min_poll_interval == 0.003
+    snapshot = blender.addon._prefs
+    assert (snapshot.min_poll_interval, snapshot.max_poll_interval) == (0.003, 0.003)
+
+
+def test_snapshot_orders_stale_bounds():
+    snapshot = addon_module("prefs_snapshot").PrefsSnapshot(min_poll_interval=0.03, max_poll_interval=0.01)
+    assert snapshot.max_poll_interval == 0.03
+
+
+def test_idle_gaps_do_not_count_as_slow_samples(poll_rate):
+    estimator = poll_rate.SampleRateEstimator()
+    estimator.observe([1.0, 1.01], 2, 1.0, MIN_INTERVAL, MAX_INTERVAL)
+    estimator.observe([], 0, 1.5, MIN_INTERVAL, MAX_INTERVAL)
+    estimator.observe([3.0, 3.01], 2, 3.0, MIN_INTERVAL, MAX_INTERVAL)
+    assert estimator.rate == pytest.approx(100.0)
@@ -0,0 +1,191 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""ReconnectController backoff, timeouts and counters on a scripted clock."""
+
+import random
+import threading
+
+import pytest
+
+from benchmarks._addon import addon_module
+
+
+@pytest.fixture
+def reconnect():
+    return addon_module("reconnect")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeDevice:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _fail():
+    raise OSError("no device")
+
+
+def _attempt(controller, opener):
+    """Run one attempt to completion; returns what poll() handed out."""
+    assert controller.poll(lambda: opener) is None
+    controller._worker.join(5.0)
+    return controller.poll(lambda: opener)
+
+
+def test_backoff_doubles_up_to_the_cap(reconnect):
+    clock = FakeClock()
+    controller = reconnect.ReconnectController(
+        base_delay=1.0, max_delay=8.0, jitter=0.0, clock=clock,
+    )
+    delays = []
+    for _ in range(6):
+        _attempt(controller, _fail)
+        assert controller.state == reconnect.BACKOFF
+        delays.append(controller.retry_in())
+        clock.now += delays[-1]
+    assert delays == [1.0, 2.0, 4.0, 8.0, 8.0, 8.0]
+    assert (controller.attempts, controller.failures) == (6, 6)
+    assert isinstance(controller.last_error, OSError)
+
+
+def test_no_attempt_before_the_backoff_expires(reconnect):
+    clock = FakeClock()
+    controller = reconnect.ReconnectController(base_delay=1.0, jitter=0.0, clock=clock)
+    _attempt(controller, _fail)
+    clock.now += 0.5
+    assert controller.poll(lambda: _fail) is None
+    assert controller.attempts == 1
+    assert controller.retry_in() == 0.5
+
+    controller.reset()
+    _attempt(controller, _fail)
+    assert controller.attempts == 2
+    assert controller.retry_in() == 1.0
+
+
+def test_jitter_stays_in_bounds_and_follows_the_seed(reconnect):
+    def delays(seed):
+        controller = reconnect.ReconnectController(
+            base_delay=2.0, jitter=0.25, rng=random.Random(seed), clock=FakeClock(),
+        )
+        result = []
+        for _ in range(20):
+            _attempt(controller, _fail)
+            result.append(controller.retry_in())
+            controller.reset()
+        return result
+
+    first = delays(7)
+    assert all(1.5 <= delay <= 2.5 for delay in first)
+    assert len(set(first)) > 1
+    assert delays(7) == first
+
+
+def test_connect_timeout_fails_and_waits_for_the_stuck_worker(reconnect):
+    clock = FakeClock()
+    release = threading.Event()
+    device = FakeDevice()
+
+    def stuck():
+        release.wait(5.0)
+        return device
+
+    controller = reconnect.ReconnectController(
+        base_delay=1.0, jitter=0.0, timeout=5.0, clock=clock,
+    )
+    assert controller.poll(lambda: stuck) is None
+    worker = controller._worker
+    clock.now += 5.0
+    assert controller.poll(lambda: stuck) is None
+    assert controller.state == reconnect.CONNECTING
+
+    clock.now += 0.1
+    assert controller.poll(lambda: stuck) is None
+    assert controller.state == reconnect.BACKOFF
+    assert isinstance(controller.last_error, TimeoutError)
+    assert controller.failures == 1
+
+    # The timed-out worker is still inside the driver: no second attempt.
+    clock.now += controller.retry_in()
+    assert controller.poll(lambda: stuck) is None
+    assert controller.state == reconnect.BACKOFF
+    assert controller.attempts == 1
+
+    # When it finally returns, its device is closed instead of handed out.
+    release.set()
+    worker.join(5.0)
+    assert device.closed
+    clock.now += controller.retry_in()
+    assert controller.poll(lambda: _fail) is None
+    assert controller.attempts == 2
+
+
+def test_busy_thread_delays_the_next_attempt(reconnect):
+    clock = FakeClock()
+    controller = reconnect.ReconnectController(base_delay=1.0, jitter=0.0, clock=clock)
+    release = threading.Event()
+    reader = threading.Thread(target=release.wait, args=(5.0,), daemon=True)
+    reader.start()
+    controller.wait_for(reader)
+
+    assert controller.poll(lambda: _fail) is None
+    assert controller.state == reconnect.BACKOFF
+    assert controller.attempts == 0
+    assert controller.retry_in() == 1.0
+
+    release.set()
+    reader.join(5.0)
+    clock.now += 1.0
+    assert controller.poll(lambda: _fail) is None
+    assert controller.attempts == 1
+
+
+def test_lost_connection_counts_a_reconnect(reconnect):
+    clock = FakeClock()
+    controller = reconnect.ReconnectController(base_delay=1.0, jitter=0.0, clock=clock)
+    first = FakeDevice()
+    assert _attempt(controller, lambda: first) is first
+    assert controller.state == reconnect.CONNECTED
+    assert controller.reconnects == 0
+
+    error = OSError("unplugged")
+    controller.report_lost(error)
+    assert controller.state == reconnect.BACKOFF
+    assert controller.last_error is error
+    assert controller.retry_in() == 1.0
+
+    # Failures after the loss back off from the first step again.
+    clock.now += 1.0
+    _attempt(controller, _fail)
+    assert controller.retry_in() == 1.0
+    clock.now += 1.0
+    second = FakeDevice()
+    assert _attempt(controller, lambda: second) is second
+    assert (controller.attempts, controller.failures, controller.reconnects) == (3, 1, 1)
+
+
+def test_shutdown_closes_a_device_opened_in_flight(reconnect):
+    controller = reconnect.ReconnectController(clock=FakeClock())
+    device = FakeDevice()
+    assert controller.poll(lambda: lambda: device) is None
+    controller._worker.join(5.0)
+    controller.shutdown()
+    assert device.closed
+    assert controller.poll(lambda: _fail) is None
@@ -0,0 +1,138 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Recording a backend's stream and replaying it."""
+
+import pytest
+
+from benchmarks._addon import addon_module
+
+
+@pytest.fixture
+def recording():
+    return addon_module("recording")
+
+
+def _connected_simulated(wrap, samples: int = 20):
+    """Connect wrap(simulated backend) with `samples` samples of a 1 kHz stream pending."""
+    now = [0.0]
+    backend = wrap(addon_module("simulated_backend").SimulatedBackend(
+        rate_hz=1000.0, seed=7, clock=lambda: now[0],
+    ))
+    backend.connect()
+    now[0] = samples / 1000.0
+    return backend
+
+
+def test_recording_is_flushed_after_each_drain(recording, tmp_path):
+    path = str(tmp_path / "session.screc")
+    backend = _connected_simulated(lambda inner: recording.RecordingBackend(inner, path))
+    batch = backend.read_states()
+    assert len(batch) == 20
+
+    # Without closing the recorder (as after a crash), the drained samples
+    # are already in the file.
+    on_disk = recording.StreamRecording(path)
+    assert len(on_disk) == len(batch)
+    on_disk.close()
+    backend.close()
+
+
+def test_recording_forwards_the_device_count(recording, tmp_path):
+    backend = _connected_simulated(
+        lambda inner: recording.RecordingBackend(inner, str(tmp_path / "session.screc"))
+    )
+    backend.inner.device_count = lambda: 3
+    assert backend.device_count() == 3
+    backend.close()
+
+
+def test_reconnecting_continues_the_recording(recording, tmp_path):
+    path = str(tmp_path / "session.screc")
+    now = [0.0]
+    backend = recording.RecordingBackend(addon_module("simulated_backend").SimulatedBackend(
+        rate_hz=1000.0, seed=7, clock=lambda: now[0],
+    ), path)
+    backend.connect()
+    now[0] += 0.02
+    first = backend.read_states()
+    backend.close()
+    backend.connect()    # e.g. after the device dropped out
+    now[0] += 0.01
+    second = backend.read_states()
+    backend.close()
+    assert len(first) == 20 and len(second) > 0
+
+    replay = recording.ReplayBackend(path, realtime=False)
+    replay.connect()
+    replayed = replay.read_states()
+    replay.close()
+    assert list(replayed.axes) == [float(round(v)) for v in (first.axes + second.axes)]
+
+
+def test_reconnect_in_the_addon_keeps_the_session(blender, tmp_path):
+    path = tmp_path / "session.screc"
+    prefs = blender.prefs
+    prefs.backend = 'SIMULATED'
+    prefs.simulated_rate = 0.0
+    prefs.record_path = str(path)
+    addon = blender.addon
+
+    counts = []
+    for _ in range(2):
+        blender.wait_for_device()
+        blender.run(10)
+        counts.append(addon._device._recorder.count)
+        addon._connector.report_lost(RuntimeError("test"))
+        addon._close_device()
+        addon._connector.reset()
+
+    on_disk = addon_module("recording").StreamRecording(str(path))
+    assert len(on_disk) == counts[1] > counts[0] > 0
+    on_disk.close()
+
+
+def test_replay_returns_the_recorded_samples(recording, tmp_path):
+    path = str(tmp_path / "session.screc")
+    backend = _connected_simulated(lambda inner: recording.RecordingBackend(inner, path))
+    recorded = backend.read_states()
+    backend.close()
+
+    replay = recording.ReplayBackend(path, realtime=False)
+    replay.connect()
+    replayed = replay.read_states()
+    replay.close()
+
+    assert len(replayed) == len(recorded)
+    assert list(replayed.axes) == [float(round(v)) for v in recorded.axes]
+    assert list(replayed.timestamps) == pytest.approx(list(recorded.timestamps), abs=1e-6)
+
+
+def test_realtime_replay_keeps_the_original_spacing(recording, device_module, tmp_path):
+    path = str(tmp_path / "timed.screc")
+    with recording.StreamRecorder(path) as recorder:
+        for i in range(3):
+            recorder.write(device_module.SpaceControllerState(tx=i, timestamp=10.0 + i))
+
+    now = [0.0]
+    replay = recording.ReplayBackend(path, realtime=True, clock=lambda: now[0])
+    replay.connect()
+    state = device_module.SpaceControllerState()
+    assert replay.read_state_into(state) and state.tx == 0.0
+    assert not replay.read_state_into(state)
+    now[0] = 1.0
+    assert replay.read_state_into(state) and state.tx == 1.0
+    replay.close()
+
+
+def test_not_a_recording(recording, tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(RuntimeError):
+        recording.StreamRecording(str(path))
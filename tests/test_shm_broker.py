@@ -0,0 +1,155 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Shared-memory broker with the simulated data source."""
+
+import os
+import signal
+import time
+
+import pytest
+
+from benchmarks._addon import addon_module
+
+
+@pytest.fixture
+def shm():
+    return addon_module("shm_broker")
+
+
+def _simulated(seed: int):
+    source = addon_module("simulated_backend").SimulatedBackend(rate_hz=0.0, seed=seed)
+    source.connect()
+    return source
+
+
+def test_samples_arrive_in_order(shm, device_module):
+    name = f"sctest-{os.getpid()}"
+    source = _simulated(3)
+    reference = _simulated(3)
+    state = device_module.SpaceControllerState()
+    expected = device_module.SpaceControllerState()
+
+    with shm.SharedMemoryBroker(name, capacity=16) as broker:
+        reader = shm.SharedMemoryBackend(name)
+        reader.connect()
+        for _ in range(10):
+            source.read_state_into(state)
+            broker.publish(state)
+        got = 0
+        while reader.read_state_into(state):
+            reference.read_state_into(expected)
+            assert (round(state.tx), round(state.rz)) == (round(expected.tx), round(expected.rz))
+            got += 1
+        assert got == 10
+        reader.close()
+
+
+def test_overrun_is_skipped_and_counted(shm, device_module):
+    name = f"sctest-overrun-{os.getpid()}"
+    state = device_module.SpaceControllerState(tx=1.0)
+    with shm.SharedMemoryBroker(name, capacity=16) as broker:
+        reader = shm.SharedMemoryBackend(name)
+        reader.connect()
+        for _ in range(40):
+            broker.publish(state)
+        got = len(reader.read_states(max_samples=64))
+        assert got == 15
+        assert got + reader.dropped == 40
+        reader.close()
+
+
+def test_closed_broker_is_reported(shm, device_module):
+    name = f"sctest-closed-{os.getpid()}"
+    with shm.SharedMemoryBroker(name, capacity=16):
+        reader = shm.SharedMemoryBackend(name)
+        reader.connect()
+    with pytest.raises(RuntimeError):
+        reader.read_state_into(device_module.SpaceControllerState())
+    reader.close()
+
+
+def test_broker_process_streams_to_this_process(shm, device_module):
+    name = f"sctest-proc-{os.getpid()}"
+    process = shm.launch_broker(["--name", name, "--simulated", "500"])
+    reader = shm.SharedMemoryBackend(name)
+    try:
+        deadline = time.monotonic() + 10.0
+        while True:
+            try:
+                reader.connect()
+                break
+            except RuntimeError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+        batch = device_module.SpaceControllerBatch()
+        samples = 0
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            samples += len(reader.read_states(batch, 256))
+            time.sleep(0.01)
+        assert samples > 50
+    finally:
+        process.send_signal(signal.SIGINT)
+        process.wait(timeout=10)
+
+    with pytest.raises(RuntimeError):
+        reader.read_states(batch, 1 << 20)   # whatever was published last
+        reader.read_state_into(device_module.SpaceControllerState())
+    reader.close()
+
+
+def _wait_for_broker(shm, name: str, timeout: float = 10.0):
+    """Connect a reader to broker `name` once it is up."""
+    reader = shm.SharedMemoryBackend(name)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            reader.connect()
+            return reader
+        except RuntimeError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def test_stop_broker_shuts_the_process_down_cleanly(shm):
+    name = f"sctest-stop-{os.getpid()}"
+    process = shm.launch_broker(["--name", name, "--simulated", "100"])
+    try:
+        _wait_for_broker(shm, name).close()
+    finally:
+        shm.stop_broker(process)
+    assert process.returncode == 0
+    with pytest.raises(RuntimeError):
+        shm.SharedMemoryBackend(name).connect()    # the segment was removed
+
+
+def test_addon_stops_its_broker(shm, blender, monkeypatch):
+    addon = blender.addon
+    monkeypatch.setattr(addon, "launch_broker",
+                        lambda args: shm.launch_broker([*args, "--simulated", "100"]))
+    blender.prefs.broker_name = f"sctest-addon-{os.getpid()}"
+
+    assert addon.SPACECONTROLLER_OT_start_broker().execute(None) == {'FINISHED'}
+    process = addon._broker_process
+    assert addon.SPACECONTROLLER_OT_start_broker().execute(None) == {'CANCELLED'}
+    assert addon._broker_process is process
+    _wait_for_broker(shm, blender.prefs.broker_name).close()
+
+    assert addon.SPACECONTROLLER_OT_stop_broker().execute(None) == {'FINISHED'}
+    assert process.returncode == 0
+    assert addon._broker_process is None
+
+    addon.SPACECONTROLLER_OT_start_broker().execute(None)
+    process = addon._broker_process
+    addon.unregister()
+    assert process.returncode is not None
+    addon.register()   # the fixture unregisters again
@@ -0,0 +1,194 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""SpaceControllerDevice against the native stub library (benchmarks/stub_lib)."""
+
+import ctypes
+import subprocess
+import sys
+import threading
+import types
+
+import pytest
+
+from benchmarks._addon import addon_module
+from benchmarks.stub_library import build, expected_sample
+
+
+@pytest.fixture(scope="module")
+def library_path():
+    try:
+        return build()
+    except (OSError, subprocess.CalledProcessError) as exc:
+        pytest.skip(f"cannot build the stub library: {exc}")
+
+
+def _configure(library_path, num_devices: int, burst: int = 8) -> None:
+    ctypes.CDLL(library_path).scStubConfigure(num_devices, burst)
+
+
+@pytest.fixture
+def device(device_module, library_path):
+    device = device_module.SpaceControllerDevice(app_name="Test", library_path=library_path)
+    yield device
+    device.close()
+
+
+def test_read_state_into_returns_the_scripted_samples(device, device_module):
+    lib = device._lib
+    lib.scStubConfigure(1, 8)
+    lib.scStubReset()
+    state = device_module.SpaceControllerState()
+    n = 0
+    empty = 0
+    while n < 100:
+        if not device.read_state_into(state):
+            empty += 1   # end of a burst
+            continue
+        axes, event, timestamp = expected_sample(n)
+        assert (state.tx, state.ty, state.tz, state.rx, state.ry, state.rz) == axes
+        assert state.event == event
+        assert state.timestamp == pytest.approx(timestamp)
+        n += 1
+    assert empty > 0
+
+
+def test_read_states_drains_one_burst(device, device_module):
+    lib = device._lib
+    lib.scStubConfigure(1, 8)
+    lib.scStubReset()
+    batch = device.read_states(max_samples=64)
+    assert len(batch) == 8
+    state = device_module.SpaceControllerState()
+    for i in range(len(batch)):
+        batch.get_into(i, state)
+        axes, event, _ = expected_sample(i)
+        assert (state.tx, state.rz, state.event) == (axes[0], axes[5], event)
+
+
+def test_device_count(device):
+    device._lib.scStubConfigure(2, 8)
+    assert device.device_count() == 2
+
+
+def test_device_count_and_close_wait_for_other_driver_calls(device, device_module):
+    device._lib.scStubConfigure(1, 8)
+    results = []
+
+    def count_close_count():
+        results.append(device.device_count())
+        device.close()
+        results.append(device.device_count())
+
+    thread = threading.Thread(target=count_close_count)
+    with device_module._driver_lock:   # as held by a fetch on another thread
+        thread.start()
+        thread.join(0.05)
+        assert thread.is_alive()
+        assert results == []
+    thread.join(2.0)
+    assert results == [1, None]
+
+
+def test_open_all_closes_the_connection_when_a_sibling_fails(device_module, library_path, monkeypatch):
+    _configure(library_path, 3)
+    open_sibling = device_module.SpaceControllerDevice._open_sibling
+
+    def failing_open_sibling(self, index):
+        if index == 2:
+            raise RuntimeError("sibling failed")
+        return open_sibling(self, index)
+
+    monkeypatch.setattr(device_module.SpaceControllerDevice, "_open_sibling", failing_open_sibling)
+    with pytest.raises(RuntimeError, match="sibling failed"):
+        device_module.SpaceControllerDevice.open_all(library_path=library_path)
+    assert device_module._driver_connections == 0
+
+
+def test_failed_open_releases_the_driver_connection(blender, library_path, tmp_path):
+    prefs = blender.prefs
+    prefs.backend = 'SPACECONTROL'
+    prefs.library_path = library_path
+    prefs.use_all_devices = True
+    prefs.record_path = str(tmp_path / "missing" / "session.screc")
+    _configure(library_path, 2)
+
+    open_backends = blender.addon._make_backend_opener()
+    for _ in range(3):
+        with pytest.raises(OSError):
+            open_backends()
+    driver = sys.modules[blender.addon.SpaceControllerDevice.__module__]
+    assert driver._driver_connections == 0
+
+
+def test_open_all_opens_every_device(device_module, library_path):
+    _configure(library_path, 3)
+    devices = device_module.SpaceControllerDevice.open_all(library_path=library_path)
+    try:
+        assert [device._device_id for device in devices] == [0, 1, 2]
+        devices[0]._lib.scStubReset()
+        # Every device has its own sample script.
+        for device in devices:
+            batch = device.read_states(max_samples=64)
+            assert len(batch) == 8
+            assert batch.axes[0] == expected_sample(0)[0][0]
+    finally:
+        for device in reversed(devices):
+            device.close()
+    assert device_module._driver_connections == 0
+
+
+def test_device_poller_routes_each_device_to_its_consumer(device_module, library_path):
+    multi_device = addon_module("multi_device")
+    _configure(library_path, 3, burst=4)
+    devices = device_module.SpaceControllerDevice.open_all(library_path=library_path)
+    try:
+        lib = devices[0]._lib
+        lib.scStubReset()
+        # Device 1 is a full burst ahead of device 2.
+        devices[1].read_states(max_samples=64)
+
+        received = []
+        poller = multi_device.DevicePoller()
+        for device in devices[1:]:
+            poller.add_route(device, lambda batch, context, d=device: received.append(
+                (d._device_id, len(batch), batch.axes[0], context)))
+        assert len(poller) == 2
+        assert poller.backends == devices[1:]
+
+        assert poller.poll("area", max_samples=64) == 8
+        assert received == [
+            (1, 4, expected_sample(4)[0][0], "area"),
+            (2, 4, expected_sample(0)[0][0], "area"),
+        ]
+    finally:
+        for device in reversed(devices):
+            device.close()
+
+
+@pytest.mark.parametrize("target", ['OBJECT', 'VIEW'])
+def test_extra_device_drives_its_target(blender, library_path, monkeypatch, target):
+    from mathutils import Matrix
+
+    active = types.SimpleNamespace(matrix_world=Matrix.Identity(4))
+    monkeypatch.setattr(blender.bpy.context.view_layer.objects, "active", active)
+    prefs = blender.prefs
+    prefs.use_reader_thread = False
+    prefs.backend = 'SPACECONTROL'
+    prefs.library_path = library_path
+    prefs.use_all_devices = True
+    prefs.extra_device_target = target
+    _configure(library_path, 2)
+    ctypes.CDLL(library_path).scStubReset()
+
+    blender.wait_for_device()
+    assert blender.addon._extra_devices.backends[0]._device_id == 1
+    blender.run(5)
+    moved = tuple(active.matrix_world.translation) != (0.0, 0.0, 0.0)
+    assert moved == (target == 'OBJECT')
@@ -0,0 +1,108 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""SpacenavBackend against a fake spacenavd."""
+
+import socket
+import time
+
+import pytest
+
+from benchmarks._addon import addon_module
+from benchmarks.fake_spacenavd import EVENT, FakeSpacenavd
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+
+def _drain(backend, batch, expected: int, timeout: float = 2.0) -> None:
+    """Read until `expected` samples arrived (the socket may deliver in pieces)."""
+    state = backend._batch_scratch
+    deadline = time.monotonic() + timeout
+    while len(batch) < expected and time.monotonic() < deadline:
+        if backend.read_state_into(state):
+            batch.append(state)
+
+
+@pytest.fixture
+def daemon():
+    with FakeSpacenavd() as fake:
+        yield fake
+
+
+@pytest.fixture
+def backend(daemon):
+    backend = addon_module("spacenav_backend").SpacenavBackend(
+        socket_path=daemon.path, clock=lambda: 100.0,
+    )
+    backend.connect()
+    daemon.wait_for_clients(1)
+    yield backend
+    backend.close()
+
+
+def test_motion_and_button_events(daemon, backend, device_module):
+    daemon.send_motion(10, -20, 30, -1, 2, -3, period=8)
+    daemon.send_button(2, pressed=True)
+    daemon.send_motion(5, 0, 0, 0, 0, 7, period=10)
+    daemon.send_button(2, pressed=False)
+    batch = device_module.SpaceControllerBatch()
+    _drain(backend, batch, 4)
+
+    state = device_module.SpaceControllerState()
+    got = []
+    for i in range(len(batch)):
+        batch.get_into(i, state)
+        got.append((state.tx, state.ty, state.tz, state.rx, state.ry, state.rz,
+                    state.event, round(state.timestamp, 6)))
+    assert got == [
+        (10, -20, 30, -1, 2, -3, 0, 100.008),
+        (0, 0, 0, 0, 0, 0, 4, 100.008),
+        (5, 0, 0, 0, 0, 7, 4, 100.018),
+        (0, 0, 0, 0, 0, 0, 0, 100.018),
+    ]
+
+
+def test_buttons_beyond_the_event_int_are_ignored(daemon, backend, device_module):
+    bits = device_module.BUTTON_BITS
+    daemon.send_button(bits - 1, pressed=True)
+    daemon.send_button(bits, pressed=True)
+    batch = device_module.SpaceControllerBatch()
+    _drain(backend, batch, 2)
+    assert list(batch.events) == [1 << (bits - 1)] * 2
+
+
+def test_event_split_across_reads(daemon, backend, device_module):
+    raw = EVENT.pack(0, 1, 2, 3, 4, 5, 6, 8)
+    state = device_module.SpaceControllerState()
+    daemon.send_raw(raw[:13])
+    time.sleep(0.01)
+    assert not backend.read_state_into(state)
+
+    daemon.send_raw(raw[13:])
+    batch = device_module.SpaceControllerBatch()
+    _drain(backend, batch, 1)
+    assert len(batch) == 1
+    assert batch.axes[5] == 6.0
+
+
+def test_burst_is_drained_with_few_receives(daemon, backend, device_module):
+    daemon.send_raw(EVENT.pack(0, 100, -100, 50, 10, -10, 5, 8) * 16)
+    batch = device_module.SpaceControllerBatch()
+    _drain(backend, batch, 16)
+    assert len(batch) == 16
+    assert backend.receives <= 2
+
+
+def test_daemon_disconnect_raises(daemon, backend, device_module):
+    state = device_module.SpaceControllerState()
+    daemon.disconnect_clients()
+    with pytest.raises(RuntimeError):
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline:
+            backend.read_state_into(state)
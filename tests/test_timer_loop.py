@@ -0,0 +1,187 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""The timer loop and view update, driven in the headless harness."""
+
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+
+from benchmarks._addon import addon_module
+from benchmarks.harness import HeadlessBlender, load_addon
+
+
+def test_simulated_motion_moves_the_view(simulated_blender):
+    blender = simulated_blender
+    location = tuple(blender.region_3d.view_location)
+    rotation = tuple(blender.region_3d.view_rotation)
+    redraws = blender.view3d_area.redraws
+
+    blender.run(100)
+
+    assert tuple(blender.region_3d.view_location) != location
+    assert tuple(blender.region_3d.view_rotation) != rotation
+    assert blender.view3d_area.redraws > redraws
+
+
+def test_zero_motion_skips_the_redraw(simulated_blender, device_module):
+    blender = simulated_blender
+    redraws = blender.view3d_area.redraws
+    blender.addon._apply_state_to_area(blender.view3d_area, device_module.SpaceControllerState())
+    assert blender.view3d_area.redraws == redraws
+
+
+def test_relative_paths_resolve_after_registration(monkeypatch, tmp_path):
+    # Blender restricts bpy.data while add-ons register, so a "//" path
+    # stored in the preferences can only be resolved from the timer.
+    addon = load_addon()
+    record_path = addon.SpaceControllerPreferences.__annotations__["record_path"]
+    monkeypatch.setattr(record_path, "default", "//recording.bin")
+    with HeadlessBlender() as blender:
+        monkeypatch.setattr(blender.bpy.data, "filepath", str(tmp_path / "scene.blend"))
+        blender.prefs.backend = 'SIMULATED'
+        blender.wait_for_device()
+    assert (tmp_path / "recording.bin").exists()
+
+
+def test_unregister_stops_the_timer(blender):
+    blender.prefs.backend = 'SIMULATED'
+    blender.wait_for_device()
+    blender.addon._addon_alive = False
+    assert blender.tick() is None
+    assert blender.addon._device is None
+
+
+class ConstantBackend(addon_module("spacecontroller_device").DeviceBackend):
+    """Holds tx at a constant deflection, queuing `rate_hz` samples per second."""
+
+    def __init__(self, rate_hz: float):
+        super().__init__()
+        self._period = 1.0 / rate_hz
+        self._next = time.perf_counter()
+
+    def connect(self) -> None:
+        pass
+
+    def read_state_into(self, state) -> bool:
+        if time.perf_counter() < self._next:
+            return False
+        state.tx, state.ty, state.tz, state.rx, state.ry, state.rz = 100.0, 0.0, 0.0, 0.0, 0.0, 0.0
+        state.event = 0
+        state.timestamp = self._next
+        self._next += self._period
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+def _distance_per_second(blender, monkeypatch, rate_hz: float, interval: float,
+                         seconds: float = 0.5, adaptive: bool = False) -> float:
+    addon = blender.addon
+    monkeypatch.setattr(addon, "_make_backend_opener",
+                        lambda: lambda: [ConstantBackend(rate_hz)])
+    blender.prefs.adaptive_poll_rate = adaptive
+    blender.prefs.enable_rotation = False
+    blender.wait_for_device()
+    blender.tick()
+    start = blender.region_3d.view_location.x
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < seconds:
+        time.sleep(interval)
+        blender.tick()
+    return (blender.region_3d.view_location.x - start) / (time.perf_counter() - t0)
+
+
+@pytest.mark.parametrize("rate_hz, interval", [
+    (60.0, 0.01), (500.0, 0.01), (100.0, 0.005), (100.0, 0.02),
+])
+def test_default_speed_ignores_device_rate_and_poll_interval(blender, monkeypatch, rate_hz, interval):
+    # Baseline: one 100-unit sample per 10 ms tick at the default sensitivity.
+    expected = 100.0 * blender.prefs.move_sensitivity / 0.01
+    speed = _distance_per_second(blender, monkeypatch, rate_hz, interval)
+    assert abs(speed) == pytest.approx(expected, rel=0.2)
+
+
+def test_adaptive_polling_keeps_the_default_speed(blender, monkeypatch):
+    assert not blender.prefs.adaptive_poll_rate   # opt-in
+    expected = 100.0 * blender.prefs.move_sensitivity / 0.01
+    speed = _distance_per_second(blender, monkeypatch, 250.0, 0.004, adaptive=True)
+    assert abs(speed) == pytest.approx(expected, rel=0.2)
+
+
+class _Quaternion:
+    __slots__ = ("w", "x", "y", "z")
+
+    def __init__(self):
+        self.w, self.x, self.y, self.z = 1.0, 0.0, 0.0, 0.0
+
+
+class _Vector:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self):
+        self.x = self.y = self.z = 0.0
+
+
+class _Area:
+    """VIEW_3D area whose redraw tag costs nothing (the harness one counts)."""
+
+    type = 'VIEW_3D'
+
+    def __init__(self):
+        region_3d = SimpleNamespace(view_rotation=_Quaternion(), view_location=_Vector())
+        self.spaces = SimpleNamespace(active=SimpleNamespace(region_3d=region_3d))
+
+    def tag_redraw(self):
+        pass
+
+
+def _bytes_allocated_per_call(fn, calls: int = 1000) -> float:
+    """Mean traced bytes allocated during one call, freed or not."""
+    for _ in range(calls):
+        fn()    # warm up (specialised bytecode, float freelists)
+    total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - base
+    finally:
+        tracemalloc.stop()
+    return total / calls
+
+
+def test_view_integrator_does_not_allocate():
+    integrator = addon_module("view_math").ViewIntegrator()
+    rotation = _Quaternion()
+    location = _Vector()
+
+    def tick():
+        integrator.translate(rotation, location, 0.01, -0.02, 0.005)
+        integrator.rotate(rotation, 0.001, 0.002, -0.0005)
+
+    assert _bytes_allocated_per_call(tick) < 1.0
+    norm = (rotation.w ** 2 + rotation.x ** 2 + rotation.y ** 2 + rotation.z ** 2) ** 0.5
+    assert abs(norm - 1.0) < 1e-9
+
+
+def test_applying_a_sample_does_not_allocate(blender, device_module):
+    blender.prefs.axis_coupling = "ry>right:0.2"
+    area = _Area()
+    state = device_module.SpaceControllerState(120.0, -40.0, 15.0, 30.0, -60.0, 5.0)
+    apply = blender.addon._apply_state_to_area
+
+    assert _bytes_allocated_per_call(lambda: apply(area, state)) < 1.0
+    assert area.spaces.active.region_3d.view_location.x != 0.0
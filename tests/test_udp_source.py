@@ -0,0 +1,90 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""UdpBackend over localhost."""
+
+import socket
+import time
+
+import pytest
+
+from benchmarks._addon import addon_module
+
+
+@pytest.fixture
+def udp():
+    return addon_module("udp_source")
+
+
+@pytest.fixture
+def sender():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    yield sock
+    sock.close()
+
+
+def _send(sender, backend, datagrams) -> None:
+    target = ("127.0.0.1", backend.port)
+    for data in datagrams:
+        sender.sendto(data, target)
+    time.sleep(0.01)   # let loopback deliver
+
+
+@pytest.mark.parametrize("mode, expected", [
+    ('LATEST', (100.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, 0.0)),
+    ('INTEGRATE', (111.0, -19.0, 31.0, 0.0, 3.0, -2.0, 0, 0.0)),
+])
+def test_one_poll_drains_all_datagrams(udp, device_module, sender, mode, expected):
+    State = device_module.SpaceControllerState
+    first = State(tx=10, ty=-20, tz=30, rx=-1, ry=2, rz=-3, event=5, timestamp=1.25)
+    second = State(tx=1, ty=1, tz=1, rx=1, ry=1, rz=1, event=0, timestamp=1.5)
+    osc_no_buttons = udp._osc_string(udp.DEFAULT_OSC_ADDRESS) + udp._osc_string(",ffffff") \
+        + udp._OSC_AXES.pack(100, 0, 0, 0, 0, 0)
+
+    backend = udp.UdpBackend(port=0, mode=mode)
+    backend.connect()
+    _send(sender, backend, [
+        udp.encode_binary(first),
+        b"not a sample",
+        udp.encode_osc(second),
+        osc_no_buttons,
+    ])
+    batch = backend.read_states()
+    backend.close()
+
+    assert len(batch) == 1
+    state = State()
+    batch.get_into(0, state)
+    got = (state.tx, state.ty, state.tz, state.rx, state.ry, state.rz, state.event, state.timestamp)
+    assert got == expected
+    assert (backend.datagrams, backend.invalid) == (3, 1)
+
+
+def test_binary_sample_keeps_buttons_and_timestamp(udp, device_module, sender):
+    State = device_module.SpaceControllerState
+    backend = udp.UdpBackend(port=0)
+    backend.connect()
+    _send(sender, backend, [udp.encode_binary(
+        State(tx=10, ty=-20, tz=30, rx=-1, ry=2, rz=-3, event=5, timestamp=1.25),
+    )])
+    state = State()
+    assert backend.read_state_into(state)
+    assert (state.tx, state.event, state.timestamp) == (10, 5, 1.25)
+    assert not backend.read_state_into(state)
+    backend.close()
+
+
+def test_port_in_use_raises(udp):
+    first = udp.UdpBackend(port=0)
+    first.connect()
+    try:
+        with pytest.raises(RuntimeError):
+            udp.UdpBackend(port=first.port).connect()
+    finally:
+        first.close()
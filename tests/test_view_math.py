@@ -0,0 +1,141 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""Axis mapping compiled from the preferences."""
+
+import pytest
+
+from benchmarks._addon import addon_module
+
+
+@pytest.fixture
+def view_math():
+    return addon_module("view_math")
+
+
+@pytest.fixture
+def prefs_snapshot():
+    return addon_module("prefs_snapshot")
+
+
+def test_compile_scales_inverts_and_swaps(view_math, device_module):
+    mapping = view_math.AxisMapping.compile(
+        move_scale=2.0, rotate_scale=0.5,
+        invert=(True, False, False, False, False, False),
+        source_axes=(0, 2, 1, 3, 5, 4),
+    )
+    state = device_module.SpaceControllerState(tx=1, ty=2, tz=3, rx=4, ry=5, rz=6)
+    assert mapping.map(state) == (-2.0, 6.0, 4.0, 2.0, 3.0, 2.5)
+
+
+def test_compile_without_rotation(view_math, device_module):
+    mapping = view_math.AxisMapping.compile(move_scale=1.0, rotate_scale=1.0, enable_rotation=False)
+    state = device_module.SpaceControllerState(tx=1, ty=2, tz=3, rx=4, ry=5, rz=6)
+    assert mapping.map(state) == (1.0, 2.0, 3.0, 0.0, 0.0, 0.0)
+
+
+def test_coupling_mixes_device_axes_into_view_axes(view_math, prefs_snapshot, device_module):
+    coupling = prefs_snapshot.parse_axis_coupling("ry>right:0.5, tz > pitch : -1")
+    mapping = view_math.AxisMapping.compile(move_scale=1.0, rotate_scale=2.0, coupling=coupling)
+    state = device_module.SpaceControllerState(tx=1, tz=3, ry=4)
+    right, up, forward, pitch, yaw, roll = mapping.map(state)
+    assert right == 1.0 + 0.5 * 4
+    assert pitch == 2.0 * -3
+    assert (up, forward, yaw, roll) == (0.0, 3.0, 8.0, 0.0)
+
+
+@pytest.mark.parametrize("text", ["", " , ", "ry>right", "ry:0.5", "qq>right:1", "ry>left:1", "ry>right:x"])
+def test_invalid_coupling_text_gives_no_coupling(prefs_snapshot, text):
+    assert prefs_snapshot.parse_axis_coupling(text) is None
+
+
+def test_coupling_preference_reaches_the_timer_mapping(blender):
+    prefs = blender.prefs
+    prefs.axis_coupling = "rz>right:1"
+    matrix = blender.addon._prefs.axis_mapping.matrix
+    assert matrix[0][5] == prefs.move_sensitivity
+    prefs.axis_coupling = ""
+    assert blender.addon._prefs.axis_mapping.matrix[0][5] == 0.0
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0.5, 0.0), (0.6, 1.0), (-0.6, -1.0), (1234.4, 1234.0),
+    (40000.0, 32767.0), (1e5, 32767.0), (-1e5, -32768.0), (float("inf"), 32767.0),
+    (float("nan"), 0.0),
+])
+def test_response_lookup_rounds_and_saturates(view_math, device_module, value, expected):
+    table = view_math.build_response_table('LINEAR')
+    curves = view_math.ResponseCurves([table] * 6)
+    state = device_module.SpaceControllerState(tx=value, rx=value)
+    curves.apply(state)
+    assert (state.tx, state.rx) == (expected, expected)
+
+    batch = device_module.SpaceControllerBatch()
+    batch.append(state.__class__(tz=value, rz=value))
+    curves.apply_batch(batch)
+    assert (batch.axes[2], batch.axes[5]) == (expected, expected)
+
+
+def _response(view_math, table, v):
+    return table[view_math.table_index(v)]
+
+
+SHAPED_CURVES = [
+    ('DEADZONE', {"deadzone": 0.2}),
+    ('EXPONENTIAL', {"exponent": 2.0}),
+    ('EXPONENTIAL', {"exponent": 3.0, "deadzone": 0.1}),
+    ('S_CURVE', {"exponent": 2.0}),
+    ('CUSTOM', {"points": [(0.5, 0.25)]}),
+]
+
+
+@pytest.mark.parametrize("curve, settings", SHAPED_CURVES)
+def test_response_curves_are_monotonic_odd_and_keep_the_endpoints(view_math, curve, settings):
+    table = view_math.build_response_table(curve, **settings)
+    response = [_response(view_math, table, v) for v in range(-32768, 32768)]
+    assert all(a <= b for a, b in zip(response, response[1:]))
+    assert all(_response(view_math, table, -v) == -_response(view_math, table, v) for v in range(32768))
+    assert _response(view_math, table, 0) == 0.0
+    assert _response(view_math, table, 350) == pytest.approx(350.0)
+    assert _response(view_math, table, -350) == pytest.approx(-350.0)
+    # Beyond full scale the response is linear, up to the saturated ends.
+    assert _response(view_math, table, 700) == 700.0
+    assert _response(view_math, table, 1e5) == 32767.0
+    assert _response(view_math, table, -1e5) == -32768.0
+
+
+def test_deadzone_is_zero_inside_and_continuous_at_the_edge(view_math):
+    table = view_math.build_response_table('DEADZONE', deadzone=0.2)
+    assert all(_response(view_math, table, v) == 0.0 for v in range(-70, 71))
+    # Past the edge the slope is 1 / (1 - deadzone): no jump at 70 -> 71.
+    assert _response(view_math, table, 71) == pytest.approx(1.25)
+    assert _response(view_math, table, 210) == pytest.approx(175.0)
+
+
+def test_exponent_shapes_the_curves(view_math):
+    exponential = view_math.build_response_table('EXPONENTIAL', exponent=2.0)
+    assert _response(view_math, exponential, 175) == pytest.approx(87.5)
+    s_curve = view_math.build_response_table('S_CURVE', exponent=2.0)
+    assert _response(view_math, s_curve, 175) == pytest.approx(175.0)
+    assert _response(view_math, s_curve, 70) < 70.0
+    assert _response(view_math, s_curve, 280) > 280.0
+
+
+def test_custom_curve_interpolates_its_points(view_math):
+    table = view_math.build_response_table('CUSTOM', points=[(0.75, 0.5), (0.5, 0.25)])
+    assert _response(view_math, table, 175) == pytest.approx(87.5)
+    assert _response(view_math, table, 219) == pytest.approx(350 * (0.25 + 0.25 * (219 / 350 - 0.5) / 0.25))
+    assert _response(view_math, table, 315) == pytest.approx(350 * 0.8)
+
+
+def test_unknown_curve_or_deadzone_is_rejected(view_math):
+    with pytest.raises(ValueError):
+        view_math.build_response_table('BOGUS')
+    with pytest.raises(ValueError):
+        view_math.build_response_table('DEADZONE', deadzone=1.0)
@@ -0,0 +1,124 @@
+# blender-spacecontroller-3d-mouse
+# Unofficial Blender add-on for SpaceController 3D mice.
+# Copyright (c) 2025 Mikhail Krigman
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+"""The cached VIEW_3D target and what invalidates it."""
+
+import pytest
+
+from benchmarks.harness import HeadlessBlender
+
+
+class FreedArea:
+    """Stands in for an area Blender has freed: any attribute access is a bug."""
+
+    def __getattribute__(self, name):
+        raise AssertionError(f"freed area dereferenced ({name})")
+
+
+def _free(area) -> None:
+    area.__class__ = FreedArea
+
+
+@pytest.fixture
+def blender():
+    with HeadlessBlender(windows=2) as session:
+        yield session
+
+
+@pytest.fixture
+def scans(blender, monkeypatch):
+    """Counts full window-manager scans."""
+    addon = blender.addon
+    find = addon._find_first_view3d
+    calls = []
+
+    def counting_find():
+        calls.append(1)
+        return find()
+
+    monkeypatch.setattr(addon, "_find_first_view3d", counting_find)
+    addon._view_target.invalidate()
+    return calls
+
+
+def _window_of(blender, area):
+    return next(w for w in blender.window_manager.windows if area in w.screen.areas)
+
+
+def test_target_is_cached(blender, scans):
+    cache = blender.addon._view_target
+    first = cache.get()
+    assert first[0] is blender.view3d_area
+    assert cache.get() == first
+    assert len(scans) == 1
+
+
+def test_split_area_rescans(blender, scans):
+    from bpy.types import Area
+    cache = blender.addon._view_target
+    cache.get()
+    _window_of(blender, blender.view3d_area).screen.areas.append(Area('OUTLINER'))
+    assert cache.get()[0] is blender.view3d_area
+    assert len(scans) == 2
+
+
+def test_joined_area_is_not_touched(blender, scans):
+    from bpy.types import Area
+    cache = blender.addon._view_target
+    cache.get()
+    areas = _window_of(blender, blender.view3d_area).screen.areas
+    areas.remove(blender.view3d_area)
+    _free(blender.view3d_area)
+    assert cache.get() == (None, None, None)
+
+    areas.append(Area('VIEW_3D'))
+    assert cache.get()[0] is areas[-1]
+
+
+def test_maximized_area_swaps_the_screen(blender, scans):
+    from bpy.types import Area, Screen
+    cache = blender.addon._view_target
+    cache.get()
+    window = _window_of(blender, blender.view3d_area)
+    window.screen = Screen([Area('VIEW_3D')])   # same area count, new screen
+    _free(blender.view3d_area)
+    assert cache.get()[0] is window.screen.areas[0]
+
+
+def test_closed_window_is_not_touched(blender, scans):
+    cache = blender.addon._view_target
+    cache.get()
+    window = _window_of(blender, blender.view3d_area)
+    blender.window_manager.windows.remove(window)
+    _free(blender.view3d_area)
+    assert cache.get() == (None, None, None)
+
+
+def test_screen_change_notification_invalidates(blender, scans):
+    import bpy
+    cache = blender.addon._view_target
+    cache.get()
+    bpy.msgbus.publish((bpy.types.Window, "workspace"))
+    cache.get()
+    assert len(scans) == 2
+
+
+def test_file_load_invalidates_and_resubscribes(blender, scans):
+    import bpy
+    cache = blender.addon._view_target
+    cache.get()
+    bpy.msgbus._subscriptions.clear()    # loading a file drops them
+    for handler in bpy.app.handlers.load_post:
+        handler(None)
+    cache.get()
+    assert len(scans) == 2
+
+    bpy.msgbus.publish((bpy.types.Window, "screen"))
+    cache.get()
+    assert len(scans) == 3